@@ -10,7 +10,7 @@ import time
 import uuid
 import ipaddress
 from http.server import BaseHTTPRequestHandler
-from typing import Any, Dict, Optional, Tuple
+from typing import AbstractSet, Any, Dict, Optional, Tuple
 from urllib.parse import parse_qs, quote, urlsplit
 
 from vr_hotspotd.adapters.inventory import get_adapters
@@ -132,7 +132,7 @@ _CONFIG_MUTABLE_KEYS = {
 }
 
 # One-shot start overrides (not persisted).
-_START_OVERRIDE_KEYS = {
+_START_OVERRIDE_KEYS = frozenset({
     "ssid",
     "wpa2_passphrase",
     "band_preference",
@@ -183,7 +183,7 @@ _START_OVERRIDE_KEYS = {
     "connection_quality_monitoring",
     "auto_channel_switch",
     "debug",
-}
+})
 
 # Sensitive config keys that should never be returned in cleartext unless explicitly requested.
 _SENSITIVE_CONFIG_KEYS = {"wpa2_passphrase"}
@@ -561,7 +561,7 @@ class APIHandler(BaseHTTPRequestHandler):
             warnings.append("body_json_parse_failed")
             return {}, warnings
 
-    def _filter_keys(self, data: Dict[str, Any], allow: set) -> Tuple[Dict[str, Any], list[str]]:
+    def _filter_keys(self, data: Dict[str, Any], allow: AbstractSet[str]) -> Tuple[Dict[str, Any], list[str]]:
         out: Dict[str, Any] = {}
         ignored: list[str] = []
         for k, v in (data or {}).items():
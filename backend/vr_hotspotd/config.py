@@ -187,17 +187,32 @@ def validate_network_config(config: Mapping[str, Any]) -> list[str]:
     return errors
 
 
+# Last parse of the config file, keyed on path + stat identity; writes go through
+# os.replace, so every save lands on a new inode and misses the cache. One
+# (key, data) entry, swapped in a single assignment so threads never see a mixed pair.
+_READ_CACHE: Dict[str, Any] = {"entry": None}
+
+
 def read_config_file() -> Dict[str, Any]:
     """
     Returns the raw JSON content on disk (or {} if missing/invalid).
     """
-    if not CONFIG_PATH.exists():
+    try:
+        st = CONFIG_PATH.stat()
+    except OSError:
         return {}
+    key = (str(CONFIG_PATH), st.st_ino, st.st_mtime_ns, st.st_size)
+    entry = _READ_CACHE["entry"]
+    if entry is not None and entry[0] == key:
+        return dict(entry[1])
     try:
         data = json.loads(CONFIG_PATH.read_text())
-        return data if isinstance(data, dict) else {}
     except Exception:
         return {}
+    if not isinstance(data, dict):
+        data = {}
+    _READ_CACHE["entry"] = (key, data)
+    return dict(data)
 
 
 def _write_atomic(path: Path, tmp: Path, payload: str) -> None:
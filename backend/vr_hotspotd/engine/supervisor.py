@@ -1,6 +1,7 @@
 import json
 import os
 import re
+import select
 import signal
 import subprocess
 import tempfile
@@ -28,6 +29,12 @@ _stderr_line_count = 0
 _last_ap_ifname: Optional[str] = None
 _last_firewalld_cfg: Dict[str, object] = {}
 _stdout_line_observer: Optional[Callable[[str], None]] = None
+# Self-pipe the reader threads write a byte to per engine line; waiters can poll
+# its read end together with other fds. Both ends non-blocking: a full pipe is
+# already signalled, an empty one is clear.
+_output_rfd, _output_wfd = os.pipe()
+os.set_blocking(_output_rfd, False)
+os.set_blocking(_output_wfd, False)
 
 _HOSTAPD_UNKNOWN_RE = re.compile(r"unknown configuration item '([^']+)'", re.IGNORECASE)
 _PASSPHRASE_FD_FLAG = {
@@ -126,6 +133,7 @@ def _reader_thread(stream, tail: Deque[str], label: str) -> None:
                 break
             clean = line.rstrip("\n")
             tail.append(clean)
+            _signal_output()
             if label == "stdout":
                 if len(_stdout_head) < ENGINE_STDOUT_MAX_LINES:
                     _stdout_head.append(clean)
@@ -178,6 +186,40 @@ def get_tails() -> Tuple[List[str], List[str]]:
     return list(_stdout_tail), list(_stderr_tail)
 
 
+def _signal_output() -> None:
+    try:
+        os.write(_output_wfd, b"\0")
+    except OSError:
+        pass
+
+
+def clear_output_signal() -> None:
+    """
+    Forget output seen so far. Call before re-reading the tails, so a line that
+    lands after the read still wakes the next wait_for_output.
+    """
+    try:
+        while os.read(_output_rfd, 4096):
+            pass
+    except OSError:
+        pass
+
+
+def output_wakeup_fd() -> int:
+    """Readable while engine output is pending since the last clear_output_signal."""
+    return _output_rfd
+
+
+def wait_for_output(timeout_s: float) -> bool:
+    """
+    Block until the engine writes a line (since the last clear_output_signal)
+    or timeout_s passes. Returns True when output arrived.
+    """
+    poller = select.poll()
+    poller.register(_output_rfd, select.POLLIN)
+    return bool(poller.poll(max(0.0, timeout_s) * 1000))
+
+
 def _merge_head_tail(
     head: List[str],
     tail: Deque[str],
@@ -823,6 +865,8 @@ def start_engine(
     _stderr_head.clear()
     _stdout_line_count = 0
     _stderr_line_count = 0
+    # Output from the previous engine must not wake this attempt's first poll.
+    clear_output_signal()
 
     started_ts = int(time.time())
 
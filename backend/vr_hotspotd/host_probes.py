@@ -28,6 +28,8 @@ _IW_FREQ_LINE_RE = re.compile(
 _IW_VHT_WIDTH_RE = re.compile(r"Supported Channel Width:\s*(.+)$", re.IGNORECASE)
 _IW_HE_80_RE = re.compile(r"HE40/HE80(?:/5GHz)?", re.IGNORECASE)
 _HE_IFTYPES_RE = re.compile(r"^\s*HE Iftypes:\s*(.+)$", re.IGNORECASE)
+# Each "* ..." entry (with its continuation lines) is one interface combination.
+_IW_COMBINATION_START_RE = re.compile(r"^[ \t]*\*", re.MULTILINE)
 
 
 def _subprocess_text(value: object) -> str:
@@ -592,28 +594,14 @@ def parse_ap_managed_concurrency(text: str) -> Optional[bool]:
     if not text or "valid interface combinations" not in text:
         return None
 
-    found_managed = False
-    found_ap = False
-    found_total = False
-    in_section = False
-    for raw in text.splitlines():
-        line = raw.strip()
-        if "valid interface combinations" in line:
-            in_section = True
-            continue
-        if not in_section:
-            continue
-        if line.startswith("*"):
-            found_managed = False
-            found_ap = False
-            found_total = False
-        if "#{ managed }" in line:
-            found_managed = True
-        if "AP" in line:
-            found_ap = True
-        if "total <=" in line:
-            found_total = True
-        if found_managed and found_ap and found_total:
+    # Everything after the header line, cut into combinations; the markers never
+    # span a newline, so plain substring checks per chunk match the per-line scan.
+    header_at = text.index("valid interface combinations")
+    body_at = text.find("\n", header_at)
+    if body_at < 0:
+        return False
+    for combo in _IW_COMBINATION_START_RE.split(text[body_at + 1 :]):
+        if "#{ managed }" in combo and "AP" in combo and "total <=" in combo:
             return True
     return False
 
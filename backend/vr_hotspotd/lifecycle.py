@@ -2,15 +2,19 @@ import logging
 import os
 import re
 import secrets
+import select
 import shutil
 import signal
+import socket
 import stat
 import string
 import subprocess
 import threading
 import time
-import hashlib
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Set, Dict, Any, List, Tuple
 
@@ -29,7 +33,14 @@ from vr_hotspotd.engine import lnxrouter_conf
 from vr_hotspotd.engine.hostapd6_cmd import build_cmd_6ghz
 from vr_hotspotd.engine.hostapd_nat_cmd import build_cmd_nat
 from vr_hotspotd.engine.hostapd_bridge_cmd import build_cmd_bridge
-from vr_hotspotd.engine.supervisor import start_engine, stop_engine, is_running, get_tails
+from vr_hotspotd.engine.supervisor import (
+    clear_output_signal,
+    get_tails,
+    is_running,
+    start_engine,
+    stop_engine,
+    output_wakeup_fd,
+)
 from vr_hotspotd.engine.channel_scan import select_best_channel
 from vr_hotspotd.engine.tx_power import auto_adjust_tx_power, set_tx_power, get_tx_power
 from vr_hotspotd.host_facts import HostFactsSnapshot
@@ -40,6 +51,7 @@ from vr_hotspotd import (
     os_release,
     preflight,
     system_tuning,
+    telemetry,
     wifi_probe,
 )
 from vr_hotspotd.policy import (
@@ -52,6 +64,7 @@ from vr_hotspotd.policy import (
 
 log = logging.getLogger("vr_hotspotd.lifecycle")
 
+@lru_cache(maxsize=64)
 def _precreated_ap_ifname(parent_ifname: str, prefix: str = "vrhs_ap_") -> str:
     """
     Creates a valid network interface name for a pre-created AP interface.
@@ -66,8 +79,9 @@ def _precreated_ap_ifname(parent_ifname: str, prefix: str = "vrhs_ap_") -> str:
         return ifname
 
     # Name is too long, so we need to truncate and add a hash to keep it unique.
-    # The suffix is a 4-char hex representation of the SHA1 hash of the parent.
-    suffix = "_" + hashlib.sha1(parent_ifname.encode()).hexdigest()[:4]
+    # The suffix is the low 16 bits of the parent's CRC32 as 4 hex chars; it only
+    # needs to be stable and spread, so no cryptographic hash is involved.
+    suffix = f"_{zlib.crc32(parent_ifname.encode()) & 0xFFFF:04x}"
 
     # Calculate the maximum length of the parent_ifname part we can keep.
     # 15 (max) - len(prefix) - len(suffix)
@@ -80,16 +94,46 @@ def _precreated_ap_ifname(parent_ifname: str, prefix: str = "vrhs_ap_") -> str:
 _OP_LOCK = threading.Lock()
 _WATCHDOG_THREAD: Optional[threading.Thread] = None
 _WATCHDOG_STOP = threading.Event()
+# Bumped on every successful start; an idle watchdog parks on the condition until it moves.
+_WATCHDOG_CV = threading.Condition()
+_WATCHDOG_GEN = 0
+_WATCHDOG_IDLE_MAX_S = 60.0
 _WATCHDOG_BACKOFF_MAX_S = 30.0
 _WATCHDOG_CHANNEL_CONFIG_KEY_BY_BAND = {
     "2.4ghz": "fallback_channel_2g",
     "5ghz": "channel_5g",
     "6ghz": "channel_6g",
 }
+_BAND_ALIAS: Dict[str, str] = {
+    "2ghz": "2.4ghz",
+    "2.4": "2.4ghz",
+    "2.4ghz": "2.4ghz",
+    "5": "5ghz",
+    "5g": "5ghz",
+    "5ghz": "5ghz",
+    "6": "6ghz",
+    "6g": "6ghz",
+    "6ghz": "6ghz",
+    "6e": "6ghz",
+}
+_WIFI6_ALIAS: Dict[str, object] = {
+    "auto": "auto",
+    "1": True,
+    "true": True,
+    "yes": True,
+    "on": True,
+    "y": True,
+    "0": False,
+    "false": False,
+    "no": False,
+    "off": False,
+    "n": False,
+}
 _AUTOGEN_PASSPHRASE_CACHE: Optional[str] = None
 _AUTOGEN_PASSPHRASE_TS: float = 0.0
 
 
+@lru_cache(maxsize=64)
 def _virt_ap_ifname(base: str) -> str:
     cand = f"x0{base}"
     return cand[:15]
@@ -141,7 +185,7 @@ def _get_or_create_bootstrap_passphrase(*, cache_ttl_s: float = 300.0) -> str:
     return generated
 
 
-_START_OVERRIDE_KEYS = {
+_START_OVERRIDE_KEYS = frozenset({
     "ssid",
     "wpa2_passphrase",
     "band_preference",
@@ -194,25 +238,76 @@ _START_OVERRIDE_KEYS = {
     "bridge_mode",
     "bridge_name",
     "bridge_uplink",
-}
+})
 
 # Broaden virtual AP detection: still safe because we only delete if type == AP.
-_VIRT_AP_RE = re.compile(r"^x\d+.+$")
+# ifnames are ASCII; \d should not accept other Unicode digits.
+_VIRT_AP_RE = re.compile(r"^x\d+.+$", re.ASCII)
 
 _LNXROUTER_PATH = "/var/lib/vr-hotspot/app/backend/vendor/bin/lnxrouter"
 _LNXROUTER_TMP = Path("/dev/shm/lnxrouter_tmp")
+_SYS_CLASS_NET = Path("/sys/class/net")
+_SYS_CLASS_IEEE80211 = Path("/sys/class/ieee80211")
 _HOSTAPD_CTRL_CANDIDATES = (Path("/run/hostapd"), Path("/var/run/hostapd"))
 
 _IW_PHY_RE = re.compile(r"^phy#(\d+)$")
 _IW_CHANNEL_RE = re.compile(r"^channel\s+(\d+)(?:\s+\((\d+(?:\.\d+)?)\s+MHz\))?")
 _IW_FREQ_RE = re.compile(r"^(?:freq|frequency)(?:[:\s]+)(\d+(?:\.\d+)?)\b")
 _IW_WIDTH_RE = re.compile(r"width:\s*(\d+)\s*mhz", re.IGNORECASE)
+# Lines of an `iw dev` dump the AP parser reads; addr/txpower/TXQ rows are skipped by the scan.
+_IW_DUMP_LINE_RE = re.compile(r"^[ \t]*((?:phy#|Interface|type|ssid|channel|freq)[^\n]*?)[ \t\r]*$", re.M)
 _HOSTAPD_CTRL_DIR_RE = re.compile(r"DIR=(.+)")
+# hostapd.conf keys, matched on the whole file with re.M; leading blanks are allowed
+# like the line-stripping parsers they replace, comments never match.
+_HOSTAPD_CTRL_IFACE_RE = re.compile(r"^[ \t]*ctrl_interface=(.*)$", re.M)
+_HOSTAPD_COUNTRY_KEYS_RE = re.compile(r"^[ \t]*(ieee80211d|country_code)=(.*)$", re.M)
 _COUNTRY_CODE_RE = re.compile(r"^[A-Z]{2}$")
 _CMD_TIMEOUT_S = 2.5
+# Last `iw dev` output as one (dump, monotonic_ts) entry, so threads never see a
+# dump paired with another dump's timestamp. Reset at the start of every lifecycle op.
+_IW_DEV_DUMP_CACHE: Dict[str, Optional[Tuple[str, float]]] = {"entry": None}
+_IW_DEV_DUMP_REUSE_S = 1.0
 _NM_IWD_CONF_DIR = Path("/etc/NetworkManager/conf.d")
 _IWD_ASSOCIATION_ERROR = "ap_adapter_still_associated_iwd_autoconnect"
 _DEFAULT_UPLINK_UNKNOWN_ERROR = "default_uplink_unknown"
+_EMPTY_ENGINE_TEMPLATE: Dict[str, Any] = {
+    "pid": None,
+    "cmd": None,
+    "started_ts": None,
+    "last_exit_code": None,
+    "last_error": None,
+}
+
+
+def _empty_engine(**overrides: Any) -> Dict[str, Any]:
+    """Cleared engine block for update_state; tails are fresh lists per call."""
+    engine = {**_EMPTY_ENGINE_TEMPLATE, "stdout_tail": [], "stderr_tail": [], "ap_logs_tail": []}
+    engine.update(overrides)
+    return engine
+
+
+# Last hostapd.conf read, keyed on path + stat identity; a rewrite changes mtime/size.
+_HOSTAPD_CONF_CACHE: Dict[str, Any] = {"entry": None}
+
+
+def _hostapd_conf_key(conf_path: str) -> Tuple[str, int, int, int]:
+    st = os.stat(conf_path)
+    return (conf_path, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _read_hostapd_conf(conf_path: str) -> str:
+    """
+    hostapd.conf text, re-read only when the file changed since the last call.
+    Raises OSError like open() when the file cannot be read.
+    """
+    key = _hostapd_conf_key(conf_path)
+    entry = _HOSTAPD_CONF_CACHE["entry"]
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    with open(conf_path, "r", encoding="utf-8") as f:
+        text = f.read()
+    _HOSTAPD_CONF_CACHE["entry"] = (key, text)
+    return text
 
 
 def ensure_hostapd_ctrl_interface_dir(conf_path: str) -> None:
@@ -221,27 +316,22 @@ def ensure_hostapd_ctrl_interface_dir(conf_path: str) -> None:
     Handles both plain path and DIR=/path formats.
     """
     try:
-        with open(conf_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        text = _read_hostapd_conf(conf_path)
     except Exception as e:
         log.warning("hostapd_ctrl_interface_parse_failed", extra={"conf_path": conf_path, "error": str(e)})
         return
 
     ctrl_dir: Optional[str] = None
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if stripped.startswith("ctrl_interface="):
-            value = stripped.split("=", 1)[1].strip()
-            # Check for DIR=/path format
-            m = _HOSTAPD_CTRL_DIR_RE.match(value)
-            if m:
-                ctrl_dir = m.group(1)
-            else:
-                # Plain path or first token
-                ctrl_dir = value.split()[0] if value else None
-            break
+    m_ctrl = _HOSTAPD_CTRL_IFACE_RE.search(text)
+    if m_ctrl:
+        value = m_ctrl.group(1).strip()
+        # Check for DIR=/path format
+        m = _HOSTAPD_CTRL_DIR_RE.match(value)
+        if m:
+            ctrl_dir = m.group(1)
+        else:
+            # Plain path or first token
+            ctrl_dir = value.split()[0] if value else None
 
     if not ctrl_dir:
         log.debug("hostapd_ctrl_interface_not_found", extra={"conf_path": conf_path})
@@ -261,28 +351,22 @@ def validate_hostapd_country(conf_path: str) -> Optional[str]:
     Returns error code string if invalid, None if valid.
     """
     try:
-        with open(conf_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        text = _read_hostapd_conf(conf_path)
     except Exception:
         return None
 
     ieee80211d: Optional[int] = None
     country_code: Optional[str] = None
 
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        
-        if stripped.startswith("ieee80211d="):
-            val = stripped.split("=", 1)[1].strip()
+    # Later lines win, as hostapd itself reads them.
+    for m in _HOSTAPD_COUNTRY_KEYS_RE.finditer(text):
+        val = m.group(2).strip()
+        if m.group(1) == "ieee80211d":
             try:
                 ieee80211d = int(val)
             except Exception:
                 pass
-        
-        if stripped.startswith("country_code="):
-            val = stripped.split("=", 1)[1].strip()
+        else:
             country_code = val if val else None
 
     if ieee80211d == 1:
@@ -307,37 +391,30 @@ def enforce_hostapd_country(conf_path: str, resolved_country: str) -> bool:
         return False
 
     try:
-        with open(conf_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        text = _read_hostapd_conf(conf_path)
     except Exception as e:
         log.warning("enforce_hostapd_country_read_failed", extra={"conf_path": conf_path, "error": str(e)})
         return False
 
-    modified = False
-    country_line_idx: Optional[int] = None
-    
-    # Find existing country_code line
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if stripped.startswith("country_code="):
-            country_line_idx = i
-            current_val = stripped.split("=", 1)[1].strip()
-            if current_val != resolved_country:
-                lines[i] = f"country_code={resolved_country}\n"
-                modified = True
-            break
-
-    # If no country_code line exists, append it
-    if country_line_idx is None:
-        lines.append(f"country_code={resolved_country}\n")
-        modified = True
+    new_text = text
+    # Rewrite the first country_code line in place, or append one.
+    m = next((m for m in _HOSTAPD_COUNTRY_KEYS_RE.finditer(text) if m.group(1) == "country_code"), None)
+    if m is None:
+        sep = "" if not text or text.endswith("\n") else "\n"
+        new_text = f"{text}{sep}country_code={resolved_country}\n"
+    elif m.group(2).strip() != resolved_country:
+        new_text = f"{text[:m.start()]}country_code={resolved_country}{text[m.end():]}"
+    modified = new_text != text
 
     if modified:
         try:
             with open(conf_path, "w", encoding="utf-8") as f:
-                f.writelines(lines)
+                f.write(new_text)
+            # Same-size rewrites can keep the old mtime on coarse clocks; never serve the stale text.
+            try:
+                _HOSTAPD_CONF_CACHE["entry"] = (_hostapd_conf_key(conf_path), new_text)
+            except OSError:
+                _HOSTAPD_CONF_CACHE["entry"] = None
             log.info("enforce_hostapd_country_updated", extra={"conf_path": conf_path, "country": resolved_country})
         except Exception as e:
             log.error("enforce_hostapd_country_write_failed", extra={"conf_path": conf_path, "error": str(e)})
@@ -356,6 +433,7 @@ class APReadyInfo:
     channel_width_mhz: Optional[int]
 
 
+@lru_cache(maxsize=1)
 def _iw_bin() -> str:
     iw = shutil.which("iw")
     if iw:
@@ -365,20 +443,54 @@ def _iw_bin() -> str:
     raise RuntimeError("iw_not_found")
 
 
+def _output_text(value: object) -> str:
+    if not value:
+        return ""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+
+def _join_output(stdout: object, stderr: object) -> str:
+    out = _output_text(stdout)
+    err = _output_text(stderr)
+    return f"{out}\n{err}" if err else out
+
+
 def _run(cmd: List[str], timeout_s: float = _CMD_TIMEOUT_S) -> str:
+    # Capture bytes and decode once here; text=True adds a newline-translating wrapper per stream.
     try:
-        p = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout_s)
-        return (p.stdout or "") + ("\n" + p.stderr if p.stderr else "")
+        p = subprocess.run(cmd, capture_output=True, timeout=timeout_s)
+        return _join_output(p.stdout, p.stderr)
     except subprocess.TimeoutExpired as exc:
-        out = (exc.stdout or "") + ("\n" + exc.stderr if exc.stderr else "")
+        out = _join_output(exc.stdout, exc.stderr)
         cmd_s = " ".join(cmd)
-        return (out + ("\n" if out else "")) + f"cmd_timed_out:{cmd_s}"
+        return f"{out}\ncmd_timed_out:{cmd_s}" if out else f"cmd_timed_out:{cmd_s}"
     except Exception as exc:
         return f"cmd_failed:{type(exc).__name__}:{exc}"
 
 
 def _iw_dev_dump() -> str:
-    return _run([_iw_bin(), "dev"])
+    dump = _run([_iw_bin(), "dev"])
+    _IW_DEV_DUMP_CACHE["entry"] = (dump, time.monotonic())
+    return dump
+
+
+def _recent_iw_dev_dump(max_age_s: float = _IW_DEV_DUMP_REUSE_S) -> str:
+    """
+    Reuse the last `iw dev` dump taken during the current lifecycle op.
+
+    Failure paths right after `_wait_for_ap_ready` only need the AP ifname for
+    log collection, so the dump from the final poll is fresh enough.
+    """
+    entry = _IW_DEV_DUMP_CACHE["entry"]
+    if entry is not None and time.monotonic() - entry[1] <= max_age_s:
+        return entry[0]
+    return _iw_dev_dump()
+
+
+def _invalidate_iw_dev_dump() -> None:
+    _IW_DEV_DUMP_CACHE["entry"] = None
 
 
 def _iw_dev_info(ifname: str) -> str:
@@ -523,14 +635,14 @@ def _ensure_iface_up_with_grace(
     except Exception:
         interval = 0.25
 
-    deadline = time.time() + grace
-    while time.time() < deadline:
+    deadline = time.monotonic() + grace
+    while time.monotonic() < deadline:
         if _iface_is_up(ifname):
             return True
         if not is_running():
             break
         _ensure_iface_up(ifname)
-        time.sleep(interval)
+        time.sleep(max(0.0, min(interval, deadline - time.monotonic())))
     return _iface_is_up(ifname)
 
 
@@ -583,14 +695,14 @@ def _nm_state_non_interfering(state: Optional[str]) -> bool:
 def _nm_wait_non_interfering(ifname: str, timeout_s: float = 1.5) -> bool:
     if not ifname or not _nm_is_running():
         return True
-    deadline = time.time() + max(0.1, float(timeout_s))
+    deadline = time.monotonic() + max(0.1, float(timeout_s))
     last_state: Optional[str] = None
-    while time.time() < deadline:
+    while time.monotonic() < deadline:
         state = _nm_device_state(ifname)
         if _nm_state_non_interfering(state):
             return True
         last_state = state
-        time.sleep(0.2)
+        time.sleep(max(0.0, min(0.2, deadline - time.monotonic())))
     return _nm_state_non_interfering(last_state)
 
 
@@ -871,6 +983,8 @@ def _cleanup_p2p_dev_ifaces(parent_ifname: str) -> List[str]:
             removed.append(ifname)
         except Exception:
             pass
+    if removed:
+        _invalidate_iw_dev_dump()
     return removed
 
 
@@ -1222,6 +1336,7 @@ def _maybe_reselect_ap_after_prestart_failure(
             if isinstance(cand, str) and cand.strip():
                 ordered.append(cand.strip())
 
+        adapters_by_ifname = _adapter_index(inv_cur)
         seen: Set[str] = set()
         for raw in ordered:
             cand = _normalize_ap_adapter(raw, inv_cur)
@@ -1230,7 +1345,7 @@ def _maybe_reselect_ap_after_prestart_failure(
             seen.add(cand)
             if not os.path.exists(f"/sys/class/net/{cand}"):
                 continue
-            item = _get_adapter(inv_cur, cand)
+            item = adapters_by_ifname.get(cand)
             if not item or not item.get("supports_ap"):
                 continue
             if require_bus and str(item.get("bus") or "").strip().lower() != require_bus:
@@ -1304,6 +1419,13 @@ def _nm_gate_check(ifname: str) -> Optional[str]:
 
 
 def _parse_iw_dev_ap_info(iw_text: str) -> List[APReadyInfo]:
+    return list(_parse_iw_dev_ap_entries(iw_text))
+
+
+# The ready-wait selects from the same dump more than once per poll and
+# reuses dumps across polls; identical text parses once.
+@lru_cache(maxsize=4)
+def _parse_iw_dev_ap_entries(iw_text: str) -> Tuple[APReadyInfo, ...]:
     aps: List[APReadyInfo] = []
     cur_phy: Optional[str] = None
     cur: Optional[Dict[str, Optional[object]]] = None
@@ -1327,18 +1449,20 @@ def _parse_iw_dev_ap_info(iw_text: str) -> List[APReadyInfo]:
             )
         cur = None
 
-    for raw in iw_text.splitlines():
-        line = raw.strip()
-        if not line:
-            continue
+    for m_line in _IW_DUMP_LINE_RE.finditer(iw_text):
+        line = m_line.group(1)
 
-        m_phy = _IW_PHY_RE.match(line)
-        if m_phy:
-            _finalize_current()
-            cur_phy = f"phy{m_phy.group(1)}"
-            continue
+        # Dispatch on the leading keyword; regexes only run on the lines that need them.
+        kind, _, rest = line.partition(" ")
 
-        if line.startswith("Interface "):
+        if kind.startswith("phy#"):
+            m_phy = _IW_PHY_RE.match(line)
+            if m_phy:
+                _finalize_current()
+                cur_phy = f"phy{m_phy.group(1)}"
+                continue
+
+        if kind == "Interface":
             _finalize_current()
             parts = line.split()
             cur = {
@@ -1355,39 +1479,41 @@ def _parse_iw_dev_ap_info(iw_text: str) -> List[APReadyInfo]:
         if not cur:
             continue
 
-        if line.startswith("type "):
-            cur["type"] = line.split(" ", 1)[1].strip()
+        if kind == "type" and rest:
+            cur["type"] = rest.strip()
             continue
-        if line.startswith("ssid "):
-            cur["ssid"] = line.split(" ", 1)[1].strip()
+        if kind == "ssid" and rest:
+            cur["ssid"] = rest.strip()
             continue
 
-        m_channel = _IW_CHANNEL_RE.match(line)
-        if m_channel:
-            try:
-                cur["channel"] = int(m_channel.group(1))
-            except Exception:
-                cur["channel"] = None
-            if cur.get("freq_mhz") is None and m_channel.group(2):
+        if kind.startswith("channel"):
+            m_channel = _IW_CHANNEL_RE.match(line)
+            if m_channel:
                 try:
-                    cur["freq_mhz"] = int(float(m_channel.group(2)))
+                    cur["channel"] = int(m_channel.group(1))
                 except Exception:
-                    pass
-            m_width = _IW_WIDTH_RE.search(line)
-            if m_width:
+                    cur["channel"] = None
+                if cur.get("freq_mhz") is None and m_channel.group(2):
+                    try:
+                        cur["freq_mhz"] = int(float(m_channel.group(2)))
+                    except Exception:
+                        pass
+                m_width = _IW_WIDTH_RE.search(line)
+                if m_width:
+                    try:
+                        cur["channel_width_mhz"] = int(m_width.group(1))
+                    except Exception:
+                        pass
+                continue
+
+        if kind.startswith("freq"):
+            m_freq = _IW_FREQ_RE.match(line)
+            if m_freq and cur.get("freq_mhz") is None:
                 try:
-                    cur["channel_width_mhz"] = int(m_width.group(1))
+                    cur["freq_mhz"] = int(float(m_freq.group(1)))
                 except Exception:
                     pass
-            continue
-
-        m_freq = _IW_FREQ_RE.match(line)
-        if m_freq and cur.get("freq_mhz") is None:
-            try:
-                cur["freq_mhz"] = int(float(m_freq.group(1)))
-            except Exception:
-                pass
-            continue
+                continue
 
         m_width = _IW_WIDTH_RE.search(line)
         if m_width:
@@ -1397,11 +1523,8 @@ def _parse_iw_dev_ap_info(iw_text: str) -> List[APReadyInfo]:
                 pass
 
     _finalize_current()
-    return aps
-
+    return tuple(aps)
 
-def _parse_iw_dev_ap_ifaces(iw_text: str) -> Set[str]:
-    return {ap.ifname for ap in _parse_iw_dev_ap_info(iw_text) if ap.ifname}
 
 def _parse_supported_interface_modes(text: str) -> Optional[bool]:
     return host_probes.supports_ap_mode(text)
@@ -1411,34 +1534,62 @@ def _parse_ap_managed_concurrency(text: str) -> Optional[bool]:
     return host_probes.parse_ap_managed_concurrency(text)
 
 
+# (low_mhz, high_mhz, band), inclusive.
+_FREQ_BAND_RANGES: Tuple[Tuple[int, int, str], ...] = (
+    (2400, 2500, "2.4ghz"),
+    (4900, 5900, "5ghz"),
+    (5925, 7125, "6ghz"),
+)
+
+
+# Dumps carry a handful of distinct freqs; the filters and sorts ask about the same ones repeatedly.
+@lru_cache(maxsize=64)
 def _band_from_freq_mhz(freq_mhz: Optional[int]) -> Optional[str]:
     if freq_mhz is None:
         return None
-    if 2400 <= freq_mhz <= 2500:
-        return "2.4ghz"
-    if 4900 <= freq_mhz <= 5900:
-        return "5ghz"
-    if 5925 <= freq_mhz <= 7125:
-        return "6ghz"
+    for low, high, band in _FREQ_BAND_RANGES:
+        if low <= freq_mhz <= high:
+            return band
     return None
 
 
+@lru_cache(maxsize=1)
 def _vendor_bin() -> Path:
     here = Path(__file__).resolve()
     backend_dir = here.parents[1]
     return backend_dir / "vendor" / "bin"
 
 
+_HOSTAPD_CLI_PATH: Optional[str] = None
+
+
 def _hostapd_cli_path() -> Optional[str]:
+    # Only a hit is remembered, so a later hostapd install is still picked up.
+    global _HOSTAPD_CLI_PATH
+    if _HOSTAPD_CLI_PATH:
+        return _HOSTAPD_CLI_PATH
+    found: Optional[str] = None
     vendor = _vendor_bin() / "hostapd_cli"
     if vendor.exists() and os.access(vendor, os.X_OK):
-        return str(vendor)
-    bundled = _vendor_bin() / "hostapd"
-    if bundled.exists() and os.access(bundled, os.X_OK):
-        cand = bundled.parent / "hostapd_cli"
-        if cand.exists() and os.access(cand, os.X_OK):
-            return str(cand)
-    return shutil.which("hostapd_cli")
+        found = str(vendor)
+    else:
+        bundled = _vendor_bin() / "hostapd"
+        if bundled.exists() and os.access(bundled, os.X_OK):
+            cand = bundled.parent / "hostapd_cli"
+            if cand.exists() and os.access(cand, os.X_OK):
+                found = str(cand)
+    if not found:
+        found = shutil.which("hostapd_cli")
+    _HOSTAPD_CLI_PATH = found
+    return found
+
+
+def reset_bin_cache() -> None:
+    """Forget resolved iw/hostapd_cli/vendor paths so the next lookup re-resolves them."""
+    global _HOSTAPD_CLI_PATH
+    _HOSTAPD_CLI_PATH = None
+    _iw_bin.cache_clear()
+    _vendor_bin.cache_clear()
 
 
 def _select_ap_from_iw(
@@ -1447,35 +1598,37 @@ def _select_ap_from_iw(
     target_phy: Optional[str],
     ssid: Optional[str],
 ) -> Optional[APReadyInfo]:
-    aps = _parse_iw_dev_ap_info(iw_text)
     want_ssid = ssid.strip() if isinstance(ssid, str) and ssid.strip() else None
 
-    def _filter(items: List[APReadyInfo], match_ssid: bool, match_phy: bool) -> List[APReadyInfo]:
-        out: List[APReadyInfo] = []
-        for ap in items:
-            if ap.freq_mhz is None:
-                continue
-            if match_ssid and want_ssid and ap.ssid != want_ssid:
-                continue
-            if match_phy and target_phy and ap.phy != target_phy:
-                continue
-            out.append(ap)
-        return out
+    # One pass buckets every AP by priority: ssid+phy, ssid, phy, any.
+    # A bucket only counts when its criteria were actually requested.
+    buckets: List[List[APReadyInfo]] = [[], [], [], []]
+    for ap in _parse_iw_dev_ap_entries(iw_text):
+        if ap.freq_mhz is None:
+            continue
+        ssid_ok = bool(want_ssid) and ap.ssid == want_ssid
+        phy_ok = bool(target_phy) and ap.phy == target_phy
+        if ssid_ok and phy_ok:
+            buckets[0].append(ap)
+        if ssid_ok:
+            buckets[1].append(ap)
+        if phy_ok:
+            buckets[2].append(ap)
+        buckets[3].append(ap)
 
-    candidates: List[APReadyInfo] = []
     if want_ssid and target_phy:
-        candidates = _filter(aps, match_ssid=True, match_phy=True)
-    if not candidates and want_ssid:
-        candidates = _filter(aps, match_ssid=True, match_phy=False)
-    if not candidates and target_phy:
-        candidates = _filter(aps, match_ssid=False, match_phy=True)
-    if not candidates and not (want_ssid or target_phy):
-        candidates = _filter(aps, match_ssid=False, match_phy=False)
+        order = (0, 1, 2)
+    elif want_ssid:
+        order = (1,)
+    elif target_phy:
+        order = (2,)
+    else:
+        order = (3,)
+    for idx in order:
+        if buckets[idx]:
+            return min(buckets[idx], key=lambda ap: ap.ifname)
+    return None
 
-    if not candidates:
-        return None
-    candidates.sort(key=lambda ap: ap.ifname)
-    return candidates[0]
 
 def _select_ap_by_ifname(iw_text: str, ifname: str) -> Optional[APReadyInfo]:
     aps = _parse_iw_dev_ap_info(iw_text)
@@ -1508,6 +1661,13 @@ def _validate_channel_for_band(band: str, channel: int, country: Optional[str] =
 
 
 def _iface_phy(ifname: str) -> Optional[str]:
+    # sysfs carries the wiphy name directly; only fork iw when it is missing.
+    try:
+        name = (_SYS_CLASS_NET / ifname / "phy80211" / "name").read_text(encoding="utf-8").strip()
+    except Exception:
+        name = ""
+    if name:
+        return name
     try:
         p = subprocess.run(
             [_iw_bin(), "dev", ifname, "info"],
@@ -1526,6 +1686,83 @@ def _iface_phy(ifname: str) -> Optional[str]:
     return None
 
 
+def _phy_netdev_signature(phy: Optional[str]) -> Optional[Tuple[Tuple[str, str, str], ...]]:
+    """
+    (ifname, operstate, flags) for every netdev on the phy, straight from sysfs.
+    None when sysfs cannot answer, so callers fall back to polling iw.
+    """
+    if not phy:
+        return None
+    try:
+        names = sorted(os.listdir(_SYS_CLASS_IEEE80211 / phy / "device" / "net"))
+    except OSError:
+        return None
+    sig: List[Tuple[str, str, str]] = []
+    for name in names:
+        fields: List[str] = []
+        for attr in ("operstate", "flags"):
+            try:
+                fields.append((_SYS_CLASS_NET / name / attr).read_text(encoding="utf-8").strip())
+            except OSError:
+                fields.append("")
+        sig.append((name, fields[0], fields[1]))
+    return tuple(sig)
+
+
+# rtnetlink RTMGRP_LINK subscription used to end the ready-wait on iface changes.
+_RTMGRP_LINK = 1
+# Set once netlink proved unavailable; later waits skip the socket attempt.
+_LINK_MONITOR: Dict[str, bool] = {"failed": False}
+
+
+def _open_link_monitor() -> Optional[socket.socket]:
+    """
+    Non-blocking rtnetlink socket joined to the link group, for one ready-wait.
+    None when netlink is unavailable; the wait then only wakes on engine output.
+    """
+    if _LINK_MONITOR["failed"]:
+        return None
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+    except Exception:
+        _LINK_MONITOR["failed"] = True
+        return None
+    try:
+        sock.bind((0, _RTMGRP_LINK))
+        sock.setblocking(False)
+    except Exception:
+        sock.close()
+        _LINK_MONITOR["failed"] = True
+        return None
+    return sock
+
+
+def _drain_link_events(sock: socket.socket) -> bool:
+    got = False
+    while True:
+        try:
+            sock.recv(65536)
+        except BlockingIOError:
+            return got
+        except OSError:
+            # ENOBUFS: events were dropped, so something changed.
+            return True
+        got = True
+
+
+def _wait_for_link_or_output(link_sock: Optional[socket.socket], timeout_s: float) -> None:
+    """
+    Block up to timeout_s in one poll over engine output and the link socket.
+    """
+    poller = select.poll()
+    poller.register(output_wakeup_fd(), select.POLLIN)
+    if link_sock is not None:
+        poller.register(link_sock.fileno(), select.POLLIN)
+    for fd, _events in poller.poll(max(0.0, timeout_s) * 1000):
+        if link_sock is not None and fd == link_sock.fileno():
+            _drain_link_events(link_sock)
+
+
 def _wait_for_ap_ready(
     target_phy: Optional[str],
     timeout_s: float = 6.0,
@@ -1535,15 +1772,52 @@ def _wait_for_ap_ready(
     expected_ap_ifname: Optional[str] = None,
     capture: Optional[Any] = None,
 ) -> Optional[APReadyInfo]:
-    deadline = time.time() + timeout_s
+    # Subscribed only for this wait, so no link events queue up between starts.
+    link_sock = _open_link_monitor()
+    try:
+        return _poll_ap_ready(
+            target_phy,
+            timeout_s,
+            poll_s,
+            ssid,
+            adapter_ifname,
+            expected_ap_ifname,
+            capture,
+            link_sock,
+        )
+    finally:
+        if link_sock is not None:
+            link_sock.close()
+
+
+def _poll_ap_ready(
+    target_phy: Optional[str],
+    timeout_s: float,
+    poll_s: float,
+    ssid: Optional[str],
+    adapter_ifname: Optional[str],
+    expected_ap_ifname: Optional[str],
+    capture: Optional[Any],
+    link_sock: Optional[socket.socket],
+) -> Optional[APReadyInfo]:
+    # Monotonic: a wall-clock step (NTP, resume) must not cut the wait short or stretch it.
+    deadline = time.monotonic() + timeout_s
     reported_ap_ifname: Optional[str] = None
     extended = False
     grace_s = max(3.0, min(8.0, float(timeout_s)))
-
-    while time.time() < deadline:
+    # Only re-run `iw dev` when the phy's netdevs changed in sysfs, or the last dump went stale.
+    dump: Optional[str] = None
+    dump_sig: Optional[Tuple[Tuple[str, str, str], ...]] = None
+    dump_ts = 0.0
+    # hostapd_cli forks that failed during this wait; see _hostapd_cli_ping.
+    cli_failed_at: Dict[Tuple[str, str], float] = {}
+
+    while time.monotonic() < deadline:
         stdout_lines: List[str] = []
         stderr_lines: List[str] = []
         stdout_ready = False
+        # Clear, then read, then wait: output landing after the read still ends the wait.
+        clear_output_signal()
         try:
             stdout_lines, stderr_lines = get_tails()
         except Exception:
@@ -1581,66 +1855,94 @@ def _wait_for_ap_ready(
                     reported_ap_ifname = discovered
                 if not extended:
                     # We saw AP readiness signals but it may take a bit longer for iw/ctrl to catch up.
-                    deadline = max(deadline, time.time() + grace_s)
+                    deadline = max(deadline, time.monotonic() + grace_s)
                     extended = True
                     log.info(
                         "ap_ready_grace_extended",
                         extra={"grace_s": grace_s, "reason": "stdout_ready_signal"},
                     )
             elif stdout_ready and not extended:
-                deadline = max(deadline, time.time() + grace_s)
+                deadline = max(deadline, time.monotonic() + grace_s)
                 extended = True
                 log.info(
                     "ap_ready_grace_extended",
                     extra={"grace_s": grace_s, "reason": "stdout_ready_no_ifname"},
                 )
-        dump = _iw_dev_dump()
+        sig = _phy_netdev_signature(target_phy)
+        now = time.monotonic()
+        if (
+            dump is None
+            or sig is None
+            or sig != dump_sig
+            or stdout_ready
+            or now - dump_ts >= _IW_DEV_DUMP_REUSE_S
+        ):
+            dump = _iw_dev_dump()
+            dump_sig = sig
+            dump_ts = now
+        # Each probe runs at most once per iface per poll; the selected AP and the
+        # expected ifname are often the same interface.
+        hostapd_checked: Dict[str, bool] = {}
+        up_checked: Dict[str, bool] = {}
+
+        def _hostapd_ok(ifname: str) -> bool:
+            if ifname not in hostapd_checked:
+                hostapd_checked[ifname] = _hostapd_ready(
+                    ifname, adapter_ifname=adapter_ifname, cli_failed_at=cli_failed_at
+                )
+            return hostapd_checked[ifname]
+
+        def _up(ifname: str) -> bool:
+            if ifname not in up_checked:
+                up_checked[ifname] = _iface_is_up(ifname)
+            return up_checked[ifname]
+
         ap = _select_ap_from_iw(dump, target_phy=target_phy, ssid=ssid)
         if ap:
             if not extended:
                 # AP interface is visible; allow a bit more time for hostapd_cli to respond.
-                deadline = max(deadline, time.time() + grace_s)
+                deadline = max(deadline, time.monotonic() + grace_s)
                 extended = True
                 log.info(
                     "ap_ready_grace_extended",
                     extra={"grace_s": grace_s, "reason": "ap_iface_visible"},
                 )
-            if _hostapd_ready(ap.ifname, adapter_ifname=adapter_ifname):
+            if _hostapd_ok(ap.ifname):
+                return ap
+            # The dump only yields "type AP" entries, so no per-iface `iw info` here.
+            if stdout_ready or _up(ap.ifname):
                 return ap
-            if stdout_ready or _iw_interface_is_ap(ap.ifname):
-                if stdout_ready or _iface_is_up(ap.ifname):
-                    return ap
         if expected_ap_ifname:
             ap_expected = _select_ap_by_ifname(dump, expected_ap_ifname)
             if ap_expected and (
-                _hostapd_ready(expected_ap_ifname, adapter_ifname=adapter_ifname)
-                or stdout_ready
-                or _iw_interface_is_ap(expected_ap_ifname)
+                stdout_ready
+                or _up(expected_ap_ifname)
+                or _hostapd_ok(expected_ap_ifname)
             ):
-                if stdout_ready or _iface_is_up(expected_ap_ifname) or _hostapd_ready(
-                    expected_ap_ifname, adapter_ifname=adapter_ifname
-                ):
-                    return ap_expected
-            if (
-                _hostapd_ready(expected_ap_ifname, adapter_ifname=adapter_ifname)
-                or stdout_ready
-                or _iw_interface_is_ap(expected_ap_ifname)
+                return ap_expected
+            if stdout_ready or (
+                (_hostapd_ok(expected_ap_ifname) or _iw_interface_is_ap(expected_ap_ifname))
+                and _up(expected_ap_ifname)
             ):
-                if stdout_ready or _iface_is_up(expected_ap_ifname):
-                    return APReadyInfo(
-                        ifname=expected_ap_ifname,
-                        phy=target_phy,
-                        ssid=ssid,
-                        freq_mhz=None,
-                        channel=None,
-                        channel_width_mhz=None,
-                    )
+                return APReadyInfo(
+                    ifname=expected_ap_ifname,
+                    phy=target_phy,
+                    ssid=ssid,
+                    freq_mhz=None,
+                    channel=None,
+                    channel_width_mhz=None,
+                )
 
         if not is_running() and not ap and not expected_ap_ifname and not stdout_ready:
             # Engine exited and there is no AP-ready signal to wait for.
             return None
 
-        time.sleep(poll_s)
+        # Never sleep past the deadline; the timeout is an upper bound. New engine
+        # output (e.g. AP-ENABLED) or a link change ends the wait early.
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        _wait_for_link_or_output(link_sock, min(poll_s, remaining))
 
     return None
 
@@ -1724,8 +2026,8 @@ def _attempt_start_candidate(
 
         # Some drivers emit decisive hostapd failure lines slightly after AP-ready timeout.
         # Give a brief settle window to capture those lines for accurate classification.
-        settle_deadline = time.time() + 1.2
-        while is_running() and time.time() < settle_deadline:
+        settle_deadline = time.monotonic() + 1.2
+        while is_running() and time.monotonic() < settle_deadline:
             combined_now = list(latest_stdout) + list(latest_stderr)
             if (
                 _lines_have_iface_busy_signal(combined_now)
@@ -1733,7 +2035,7 @@ def _attempt_start_candidate(
                 or _stdout_has_ap_ready(combined_now)
             ):
                 break
-            time.sleep(0.2)
+            time.sleep(max(0.0, min(0.2, settle_deadline - time.monotonic())))
             latest_stdout, latest_stderr = _refresh_tails(latest_stdout, latest_stderr)
         if latest_stdout or latest_stderr:
             try:
@@ -1851,7 +2153,9 @@ def _attempt_start_candidate(
     if not is_running():
         return None, res, "hostapd_failed", "engine_not_running", latest_stdout, latest_stderr
 
-    iw_info = _parse_iw_dev_info(_iw_dev_info(ap_info.ifname))
+    iw_info: Dict[str, Optional[int]] = {}
+    if ap_info.freq_mhz is None or ap_info.channel is None or ap_info.channel_width_mhz is None:
+        iw_info = _parse_iw_dev_info(_iw_dev_info(ap_info.ifname))
     freq_mhz = ap_info.freq_mhz or iw_info.get("freq_mhz")
     channel = ap_info.channel or iw_info.get("channel")
     width_mhz = ap_info.channel_width_mhz or iw_info.get("channel_width_mhz")
@@ -1916,12 +2220,13 @@ def _start_hotspot_5ghz_strict(
     iface_up_grace_s: float = 0.0,
     ap_ready_nohint_retry_s: float = 0.0,
     pop_timeout_retry_no_virt: bool = False,
+    adapter_info: Optional[Dict[str, Any]] = None,
 ) -> LifecycleResult:
     attempts: List[Dict[str, Any]] = []
     active_uplink_interface = host_facts_snapshot.default_uplink.selected_interface
 
     def _uplink_safety_failure(last_error: str) -> LifecycleResult:
-        warnings = list(start_warnings)
+        warnings = start_warnings
         warnings.extend(_safe_revert_tuning(tuning_state))
         state = update_state(
             phase="error",
@@ -1970,7 +2275,8 @@ def _start_hotspot_5ghz_strict(
     for w in wifi_warnings or []:
         start_warnings.append(f"wifi_probe_warning:{w}")
 
-    adapter_info = _get_adapter(inv, ap_ifname) if isinstance(inv, dict) else None
+    if adapter_info is None and isinstance(inv, dict):
+        adapter_info = _get_adapter(inv, ap_ifname)
     adapter_supports_ap = bool((adapter_info or {}).get("supports_ap"))
     adapter_supports_5ghz = bool((adapter_info or {}).get("supports_5ghz"))
     adapter_supports_80mhz = bool((adapter_info or {}).get("supports_80mhz"))
@@ -1999,7 +2305,7 @@ def _start_hotspot_5ghz_strict(
 
     if wifi_errors and not can_degrade_probe_errors:
         last_error = wifi_errors[0].get("code") if isinstance(wifi_errors[0], dict) else "wifi_probe_failed"
-        warnings = list(start_warnings)
+        warnings = start_warnings
         warnings.extend(_safe_revert_tuning(tuning_state))
         state = update_state(
             phase="error",
@@ -2059,7 +2365,7 @@ def _start_hotspot_5ghz_strict(
 
     if not candidates:
         last_error = "non_dfs_80mhz_channels_unavailable"
-        warnings = list(start_warnings)
+        warnings = start_warnings
         warnings.extend(_safe_revert_tuning(tuning_state))
         state = update_state(
             phase="error",
@@ -2228,7 +2534,7 @@ def _start_hotspot_5ghz_strict(
             if reselect_warnings:
                 start_warnings.extend(reselect_warnings)
             if ap_ifname != old_ifname:
-                target_phy = _get_adapter_phy(inv, ap_ifname)
+                target_phy = adapter_now.get("phy") if adapter_now else _get_adapter_phy(inv, ap_ifname)
                 prep_retry_warnings = _prepare_ap_interface(ap_ifname, force_nm_disconnect=True)
                 if prep_retry_warnings:
                     start_warnings.extend(prep_retry_warnings)
@@ -2371,7 +2677,7 @@ def _start_hotspot_5ghz_strict(
                     # Retry once more after parent-iface recovery even when the
                     # iface name is unchanged. On Pop!_OS, USB adapters can
                     # transiently disappear/reappear under the same ifname.
-                    target_phy = _get_adapter_phy(inv, ap_ifname)
+                    target_phy = adapter_now.get("phy") if adapter_now else _get_adapter_phy(inv, ap_ifname)
                     prep_retry_warnings = _prepare_ap_interface(ap_ifname, force_nm_disconnect=True)
                     if prep_retry_warnings:
                         start_warnings.extend(prep_retry_warnings)
@@ -2666,36 +2972,17 @@ def _start_hotspot_5ghz_strict(
 
     if ap_info_final:
         detected_band = _band_from_freq_mhz(ap_info_final.freq_mhz) or "5ghz"
-        affinity_pids = _collect_affinity_pids(
+        tuning_state, net_state, tuning_warnings = _apply_runtime_tuning(
+            tuning_state,
+            cfg,
+            ap_ifname=ap_info_final.ifname,
             adapter_ifname=ap_ifname,
-            ap_interface=ap_info_final.ifname,
             engine_pid=res_final.pid if res_final else None,
+            enable_internet=enable_internet,
+            fw_cfg=fw_cfg,
+            firewall_backend=firewall_backend,
         )
-        try:
-            tuning_state, runtime_warnings = system_tuning.apply_runtime(
-                tuning_state,
-                cfg,
-                ap_ifname=ap_info_final.ifname,
-                adapter_ifname=ap_ifname,
-                cpu_affinity_pids=affinity_pids,
-            )
-        except Exception as e:
-            runtime_warnings = [f"system_tuning_runtime_failed:{e}"]
-        if runtime_warnings:
-            start_warnings.extend(runtime_warnings)
-        try:
-            net_state, net_warnings = network_tuning.apply(
-                cfg,
-                ap_ifname=ap_info_final.ifname,
-                enable_internet=enable_internet,
-                firewalld_cfg=fw_cfg,
-                firewall_backend=firewall_backend,
-            )
-        except Exception as e:
-            net_state = {}
-            net_warnings = [f"network_tuning_apply_failed:{e}"]
-        if net_warnings:
-            start_warnings.extend(net_warnings)
+        start_warnings.extend(tuning_warnings)
 
         selected_channel = ap_info_final.channel
         if selected_channel is None and selected_candidate:
@@ -2736,7 +3023,7 @@ def _start_hotspot_5ghz_strict(
 
     last_error = last_failure_code or "ap_start_timed_out"
     error_detail = wifi_probe.build_error_detail(last_error, {"detail": last_failure_detail})
-    warnings = list(start_warnings)
+    warnings = start_warnings
     warnings.extend(_safe_revert_tuning(tuning_state))
     state = update_state(
         phase="error",
@@ -2755,12 +3042,29 @@ def _start_hotspot_5ghz_strict(
     return LifecycleResult("start_failed", state)
 
 
-def _pid_cmdline(pid: int) -> str:
+def _pid_cmdline_raw(pid: int) -> bytes:
     try:
-        raw = open(f"/proc/{pid}/cmdline", "rb").read()
-        return raw.decode("utf-8", "ignore").replace("\x00", " ").strip()
+        fd = os.open(f"/proc/{pid}/cmdline", os.O_RDONLY)
     except Exception:
-        return ""
+        return b""
+    chunks: List[bytes] = []
+    try:
+        while True:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except Exception:
+        return b""
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _pid_cmdline(pid: int) -> str:
+    """Decoded cmdline, for logs; membership checks use _pid_cmdline_raw bytes."""
+    raw = _pid_cmdline_raw(pid)
+    return raw.decode("utf-8", "ignore").replace("\x00", " ").strip() if raw else ""
 
 
 def _safe_revert_tuning(tuning_state: Optional[Dict[str, object]]) -> List[str]:
@@ -2777,6 +3081,65 @@ def _safe_revert_network_tuning(net_state: Optional[Dict[str, object]]) -> List[
         return [f"network_tuning_revert_failed:{e}"]
 
 
+def _apply_runtime_tuning(
+    tuning_state: Dict[str, object],
+    cfg: Dict[str, Any],
+    *,
+    ap_ifname: str,
+    adapter_ifname: str,
+    engine_pid: Optional[int],
+    enable_internet: bool,
+    fw_cfg: Dict[str, object],
+    firewall_backend: str,
+) -> Tuple[Dict[str, object], Dict[str, object], List[str]]:
+    """
+    Run system and network runtime tuning side by side once the AP is up.
+    They touch disjoint knobs (power save/affinity/IRQ vs qos/nat/ufw/coalescing).
+    The /proc walk for affinity pids runs on the system worker, overlapping network tuning.
+    Returns (tuning_state, net_state, warnings); warnings keep system-then-network order.
+    """
+
+    def _system_runtime() -> Tuple[Dict[str, object], List[str]]:
+        affinity_pids = _collect_affinity_pids(
+            adapter_ifname=adapter_ifname,
+            ap_interface=ap_ifname,
+            engine_pid=engine_pid,
+        )
+        return system_tuning.apply_runtime(
+            tuning_state,
+            cfg,
+            ap_ifname=ap_ifname,
+            adapter_ifname=adapter_ifname,
+            cpu_affinity_pids=affinity_pids,
+        )
+
+    warnings: List[str] = []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        net_future = pool.submit(
+            network_tuning.apply,
+            cfg,
+            ap_ifname=ap_ifname,
+            enable_internet=enable_internet,
+            firewalld_cfg=fw_cfg,
+            firewall_backend=firewall_backend,
+        )
+        sys_future = pool.submit(_system_runtime)
+        try:
+            tuning_state, runtime_warnings = sys_future.result()
+        except Exception as e:
+            runtime_warnings = [f"system_tuning_runtime_failed:{e}"]
+        try:
+            net_state, net_warnings = net_future.result()
+        except Exception as e:
+            net_state = {}
+            net_warnings = [f"network_tuning_apply_failed:{e}"]
+    if runtime_warnings:
+        warnings.extend(runtime_warnings)
+    if net_warnings:
+        warnings.extend(net_warnings)
+    return tuning_state, net_state, warnings
+
+
 def _child_pids(pid: Optional[int]) -> List[int]:
     if not pid or pid <= 0:
         return []
@@ -2794,66 +3157,160 @@ def _child_pids(pid: Optional[int]) -> List[int]:
 
 
 def _pid_is_our_lnxrouter(pid: int) -> bool:
-    cmdline = _pid_cmdline(pid)
-    return bool(cmdline) and (_LNXROUTER_PATH in cmdline or "lnxrouter" in cmdline)
+    # _LNXROUTER_PATH itself contains "lnxrouter", so one bytes check covers both.
+    return b"lnxrouter" in _pid_cmdline_raw(pid)
 
 
-def _find_our_lnxrouter_pids() -> List[int]:
-    pids: List[int] = []
-    for name in os.listdir("/proc"):
-        if not name.isdigit():
+_RUNTIME_CMDLINE_MARKERS = (b"lnxrouter", b"hostapd", b"dnsmasq")
+
+
+def _scan_proc_cmdlines() -> Dict[int, str]:
+    """
+    One /proc pass: pid -> cmdline for processes that mention lnxrouter, hostapd or dnsmasq.
+    Everything else is rejected on the raw bytes without being decoded.
+    """
+    out: Dict[int, str] = {}
+    with os.scandir("/proc") as entries:
+        pids = [int(e.name) for e in entries if e.name.isdigit()]
+    for pid in pids:
+        raw = _pid_cmdline_raw(pid)
+        if not raw:
             continue
-        pid = int(name)
-        cmdline = _pid_cmdline(pid)
-        if not cmdline:
+        low = raw.lower()
+        if not any(marker in low for marker in _RUNTIME_CMDLINE_MARKERS):
             continue
-        if _LNXROUTER_PATH in cmdline:
-            pids.append(pid)
-    return sorted(set(pids))
+        out[pid] = raw.decode("utf-8", "ignore").replace("\x00", " ").strip()
+    return out
 
 
-def _kill_pid(pid: int, timeout_s: float = 3.0) -> None:
-    try:
-        os.kill(pid, signal.SIGTERM)
-    except Exception:
-        return
+def _find_our_lnxrouter_pids(proc_cmdlines: Optional[Dict[int, str]] = None) -> List[int]:
+    if proc_cmdlines is None:
+        proc_cmdlines = _scan_proc_cmdlines()
+    return sorted(pid for pid, cmdline in proc_cmdlines.items() if _LNXROUTER_PATH in cmdline)
 
-    deadline = time.time() + timeout_s
-    while time.time() < deadline:
-        if not os.path.exists(f"/proc/{pid}"):
-            return
-        time.sleep(0.05)
 
+def _pidfd_open(pid: int) -> Optional[int]:
+    """pidfd for pid (Linux 5.3+), or None when unsupported or the process is gone."""
+    opener = getattr(os, "pidfd_open", None)
+    if opener is None or not hasattr(signal, "pidfd_send_signal"):
+        return None
     try:
-        os.kill(pid, signal.SIGKILL)
+        return opener(pid)
     except Exception:
-        pass
+        return None
 
 
-def _pid_is_hostapd(pid: int) -> bool:
-    cmdline = _pid_cmdline(pid)
-    return "hostapd" in cmdline.lower()
+def _pid_is_zombie(pid: int) -> bool:
+    """Exited but not yet reaped by its parent; there is nothing left to signal."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            raw = f.read()
+    except OSError:
+        return False
+    # comm may contain spaces or parens; the state follows the last ')'.
+    return raw.rpartition(b")")[2][1:2] == b"Z"
 
 
-def _pid_is_dnsmasq(pid: int) -> bool:
-    cmdline = _pid_cmdline(pid)
-    return "dnsmasq" in cmdline.lower()
+def _readable_fds(fds: List[int], timeout_s: float) -> List[int]:
+    # poll(), not select(): pidfds can land above FD_SETSIZE in a long-lived daemon.
+    poller = select.poll()
+    for fd in fds:
+        poller.register(fd, select.POLLIN)
+    return [fd for fd, _events in poller.poll(max(0.0, timeout_s) * 1000)]
 
 
-def _pid_running(pid: int) -> bool:
-    return lnxrouter_conf.pid_running(pid)
+def _kill_pids(pids: List[int], timeout_s: float = 3.0) -> None:
+    """SIGTERM every pid up front, wait on all of them against one deadline, then SIGKILL stragglers."""
+    # pidfds pin the exact process: a recycled pid never gets our SIGKILL, and
+    # an exited-but-unreaped child reads as gone instead of waiting out the timeout.
+    fds: Dict[int, int] = {}
 
+    def _signal(pid: int, sig: int) -> None:
+        fd = fds.get(pid)
+        if fd is not None:
+            signal.pidfd_send_signal(fd, sig)
+        else:
+            os.kill(pid, sig)
 
-def _candidate_conf_dirs(adapter_ifname: Optional[str]) -> List[Path]:
-    return lnxrouter_conf.candidate_conf_dirs(adapter_ifname, tmp_dir=_LNXROUTER_TMP)
+    def _alive(pid: int) -> bool:
+        fd = fds.get(pid)
+        if fd is not None:
+            return not _readable_fds([fd], 0)
+        # Signal 0 is a liveness probe without a procfs path lookup.
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return not _pid_is_zombie(pid)
 
+    pending: List[int] = []
+    try:
+        for pid in dict.fromkeys(pids):
+            fd = _pidfd_open(pid)
+            if fd is not None:
+                fds[pid] = fd
+            try:
+                _signal(pid, signal.SIGTERM)
+            except Exception:
+                continue
+            pending.append(pid)
 
-def _find_latest_conf_dir(adapter_ifname: Optional[str], ap_interface: Optional[str]) -> Optional[Path]:
-    return lnxrouter_conf.find_latest_conf_dir(
-        adapter_ifname,
-        ap_interface,
-        tmp_dir=_LNXROUTER_TMP,
-    )
+        deadline = time.monotonic() + timeout_s
+        try:
+            while pending and time.monotonic() < deadline:
+                pending = [pid for pid in pending if _alive(pid)]
+                if not pending:
+                    break
+                if all(pid in fds for pid in pending):
+                    # Block until one of them exits (pidfds turn readable) or time runs out.
+                    _readable_fds([fds[pid] for pid in pending], deadline - time.monotonic())
+                else:
+                    time.sleep(max(0.0, min(0.05, deadline - time.monotonic())))
+        except Exception:
+            # A failed wait must not skip the SIGKILL pass: treat everything left as a straggler.
+            pass
+
+        for pid in pending:
+            try:
+                _signal(pid, signal.SIGKILL)
+            except Exception:
+                pass
+    finally:
+        for fd in fds.values():
+            try:
+                os.close(fd)
+            except Exception:
+                pass
+
+
+def _kill_pid(pid: int, timeout_s: float = 3.0) -> None:
+    _kill_pids([pid], timeout_s=timeout_s)
+
+
+def _pid_is_hostapd(pid: int) -> bool:
+    return b"hostapd" in _pid_cmdline_raw(pid).lower()
+
+
+def _pid_is_dnsmasq(pid: int) -> bool:
+    return b"dnsmasq" in _pid_cmdline_raw(pid).lower()
+
+
+def _pid_running(pid: int) -> bool:
+    return lnxrouter_conf.pid_running(pid)
+
+
+def _candidate_conf_dirs(adapter_ifname: Optional[str]) -> List[Path]:
+    return lnxrouter_conf.candidate_conf_dirs(adapter_ifname, tmp_dir=_LNXROUTER_TMP)
+
+
+def _find_latest_conf_dir(adapter_ifname: Optional[str], ap_interface: Optional[str]) -> Optional[Path]:
+    return lnxrouter_conf.find_latest_conf_dir(
+        adapter_ifname,
+        ap_interface,
+        tmp_dir=_LNXROUTER_TMP,
+    )
 
 
 def _find_ctrl_dir(conf_dir: Optional[Path], ap_interface: str) -> Optional[Path]:
@@ -2864,7 +3321,46 @@ def _find_ctrl_dir(conf_dir: Optional[Path], ap_interface: str) -> Optional[Path
     )
 
 
-def _hostapd_cli_ping(ctrl_dir: Path, ap_interface: str) -> bool:
+# A failed hostapd_cli fork is not retried for this long within one ready-wait,
+# which polls every 250ms. The control-socket PING is cheap and never debounced.
+_HOSTAPD_PING_RETRY_S = 1.0
+
+
+_HOSTAPD_CTRL_TIMEOUT_S = 0.2
+
+
+def _hostapd_ctrl_ping(ctrl_path: Path) -> bool:
+    """
+    PING over the hostapd control socket directly (what hostapd_cli does, minus the fork).
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            # Abstract address: hostapd needs somewhere to send the reply, nothing to unlink.
+            sock.bind(f"\0vr-hotspotd-ping-{os.getpid()}-{secrets.token_hex(4)}")
+            sock.settimeout(_HOSTAPD_CTRL_TIMEOUT_S)
+            sock.connect(str(ctrl_path))
+            sock.send(b"PING")
+            return sock.recv(64).startswith(b"PONG")
+    except Exception:
+        return False
+
+
+def _hostapd_cli_ping(
+    ctrl_dir: Path,
+    ap_interface: str,
+    cli_failed_at: Optional[Dict[Tuple[str, str], float]] = None,
+) -> bool:
+    """
+    cli_failed_at: per-wait record of failed hostapd_cli forks, used to debounce them.
+    """
+    ctrl_path = ctrl_dir / ap_interface
+    if ctrl_path.is_socket():
+        return _hostapd_ctrl_ping(ctrl_path)
+    key = (str(ctrl_dir), ap_interface)
+    if cli_failed_at is not None:
+        failed_at = cli_failed_at.get(key)
+        if failed_at is not None and time.monotonic() - failed_at < _HOSTAPD_PING_RETRY_S:
+            return False
     binpath = _hostapd_cli_path()
     if not binpath:
         return False
@@ -2875,11 +3371,15 @@ def _hostapd_cli_ping(ctrl_dir: Path, ap_interface: str) -> bool:
             text=True,
             timeout=0.8,
         )
+        ok = p.returncode == 0 and "PONG" in (p.stdout or "")
     except Exception:
-        return False
-    if p.returncode != 0:
-        return False
-    return "PONG" in (p.stdout or "")
+        ok = False
+    if cli_failed_at is not None:
+        if ok:
+            cli_failed_at.pop(key, None)
+        else:
+            cli_failed_at[key] = time.monotonic()
+    return ok
 
 
 def _hostapd_pid_running(conf_dir: Path) -> bool:
@@ -2896,12 +3396,17 @@ def _dnsmasq_pid_running(conf_dir: Path) -> bool:
     return _pid_is_dnsmasq(pid)
 
 
-def _hostapd_ready(ap_interface: str, *, adapter_ifname: Optional[str]) -> bool:
+def _hostapd_ready(
+    ap_interface: str,
+    *,
+    adapter_ifname: Optional[str],
+    cli_failed_at: Optional[Dict[Tuple[str, str], float]] = None,
+) -> bool:
     conf_dir = _find_latest_conf_dir(adapter_ifname, ap_interface)
     if conf_dir and _hostapd_pid_running(conf_dir):
         return True
     ctrl_dir = _find_ctrl_dir(conf_dir, ap_interface)
-    if ctrl_dir and _hostapd_cli_ping(ctrl_dir, ap_interface):
+    if ctrl_dir and _hostapd_cli_ping(ctrl_dir, ap_interface, cli_failed_at):
         return True
     return False
 
@@ -2917,6 +3422,10 @@ _HOSTAPD_DRIVER_ERROR_PATTERNS = (
     "nl80211: could not configure driver mode",
     "registration to specific type not supported",
 )
+# One alternation, one sre pass over the whole tail instead of a per-line, per-pattern loop.
+_HOSTAPD_DRIVER_ERROR_RE = re.compile(
+    "|".join(re.escape(p) for p in _HOSTAPD_DRIVER_ERROR_PATTERNS), re.IGNORECASE
+)
 
 _IFACE_BUSY_PATTERNS = (
     "rtnetlink answers: device or resource busy",
@@ -2927,6 +3436,13 @@ _IFACE_BUSY_PATTERNS = (
     "failed to request a scan of neighboring bsses",
 )
 
+# start_engine errors raised before the engine ever sees a band (vendor binary
+# selection, Popen, passphrase fd); another band cannot get past them either.
+_TERMINAL_START_ERROR_PREFIXES = (
+    "vendor_selection_failed",
+    "spawn_failed",
+)
+
 _VIRT_AP_IFACE_RE = re.compile(r"^x\d+(.+)$")
 
 
@@ -2987,12 +3503,12 @@ def _coerce_log_lines(value: object) -> List[str]:
 
 
 def _stdout_has_hostapd_driver_error(lines: List[str]) -> bool:
-    for line in lines:
-        low = str(line or "").lower()
-        for pattern in _HOSTAPD_DRIVER_ERROR_PATTERNS:
-            if pattern in low:
-                return True
-    return False
+    # No pattern spans a newline, so joining cannot create false matches.
+    return _HOSTAPD_DRIVER_ERROR_RE.search("\n".join(str(line or "") for line in lines)) is not None
+
+
+def _is_terminal_start_error(error: Optional[str]) -> bool:
+    return bool(error) and str(error).startswith(_TERMINAL_START_ERROR_PREFIXES)
 
 
 def _lines_have_iface_busy_signal(lines: List[str]) -> bool:
@@ -3054,8 +3570,8 @@ def _lines_have_parent_iface_missing_signal(lines: List[str], ifname: Optional[s
 def _stdout_has_ap_enabled(lines: List[str], ifname: str) -> bool:
     if not ifname:
         return False
-    needle = f"{ifname}: AP-ENABLED"
-    return any(needle in line for line in lines)
+    # One C-level search over the joined tail; the needle never spans a newline.
+    return f"{ifname}: AP-ENABLED" in "\n".join(lines)
 
 
 _STDOUT_AP_READY_PATTERNS = (
@@ -3136,6 +3652,9 @@ def _infer_ap_ifname_from_conf(adapter_ifname: Optional[str]) -> Optional[str]:
     return None
 
 
+_LOG_TAIL_CHUNK = 8192
+
+
 def _read_log_tail(path: Path, max_lines: int = 200) -> List[str]:
     if not path.exists():
         return []
@@ -3153,7 +3672,19 @@ def _read_log_tail(path: Path, max_lines: int = 200) -> List[str]:
                 os.close(fd)
             data = raw.decode("utf-8", "ignore") if raw else ""
         else:
-            data = path.read_text(errors="ignore")
+            # Read backwards from EOF only until the last max_lines lines are covered.
+            chunks: List[bytes] = []
+            newlines = 0
+            with open(path, "rb") as f:
+                pos = f.seek(0, os.SEEK_END)
+                while pos > 0 and newlines <= max_lines:
+                    step = min(_LOG_TAIL_CHUNK, pos)
+                    pos -= step
+                    f.seek(pos)
+                    chunk = f.read(step)
+                    chunks.append(chunk)
+                    newlines += chunk.count(b"\n")
+            data = b"".join(reversed(chunks)).decode("utf-8", "ignore")
     except Exception:
         return []
     if not data:
@@ -3162,39 +3693,65 @@ def _read_log_tail(path: Path, max_lines: int = 200) -> List[str]:
     return lines[-max_lines:]
 
 
+_AP_LOGS_MAX_LINES = 200
+
+
 def _collect_ap_logs(adapter_ifname: Optional[str], ap_interface: Optional[str]) -> List[str]:
     conf_dir = _find_latest_conf_dir(adapter_ifname, ap_interface)
     if not conf_dir:
         return []
-    logs: List[str] = []
-    log_paths = [
-        ("hostapd", conf_dir / "hostapd.log"),
-        ("dnsmasq", conf_dir / "dnsmasq.log"),
-    ]
-    for label, path in log_paths:
-        for line in _read_log_tail(path, max_lines=200):
-            logs.append(f"[{label}] {line}")
-    return logs[-200:]
-
-
-def _find_hostapd_pids(adapter_ifname: Optional[str]) -> List[int]:
-    pids: List[int] = []
-    for conf_dir in _candidate_conf_dirs(adapter_ifname):
-        pid = lnxrouter_conf.read_pid_file(conf_dir / "hostapd.pid")
-        if pid and _pid_running(pid) and _pid_is_hostapd(pid):
-            pids.append(pid)
-    return sorted(set(pids))
+    # dnsmasq lines come last and win the 200-line budget; hostapd only gets what is left,
+    # so neither file is read further back than the result can show.
+    dnsmasq_lines = _read_log_tail(conf_dir / "dnsmasq.log", max_lines=_AP_LOGS_MAX_LINES)
+    room = _AP_LOGS_MAX_LINES - len(dnsmasq_lines)
+    hostapd_lines = _read_log_tail(conf_dir / "hostapd.log", max_lines=room) if room > 0 else []
+    return [f"[hostapd] {line}" for line in hostapd_lines] + [f"[dnsmasq] {line}" for line in dnsmasq_lines]
 
 
-def _find_dnsmasq_pids(adapter_ifname: Optional[str]) -> List[int]:
+def _find_pidfile_pids(
+    adapter_ifname: Optional[str],
+    pid_file: str,
+    name: str,
+    matcher,
+    proc_cmdlines: Optional[Dict[int, str]],
+    conf_dirs: Optional[List[Path]],
+) -> List[int]:
     pids: List[int] = []
-    for conf_dir in _candidate_conf_dirs(adapter_ifname):
-        pid = lnxrouter_conf.read_pid_file(conf_dir / "dnsmasq.pid")
-        if pid and _pid_running(pid) and _pid_is_dnsmasq(pid):
+    if conf_dirs is None:
+        conf_dirs = _candidate_conf_dirs(adapter_ifname)
+    for conf_dir in conf_dirs:
+        pid = lnxrouter_conf.read_pid_file(conf_dir / pid_file)
+        if not pid:
+            continue
+        if proc_cmdlines is not None and pid in proc_cmdlines:
+            # Already read during the caller's /proc scan.
+            if name in proc_cmdlines[pid].lower():
+                pids.append(pid)
+        elif _pid_running(pid) and matcher(pid):
             pids.append(pid)
     return sorted(set(pids))
 
 
+def _find_hostapd_pids(
+    adapter_ifname: Optional[str],
+    proc_cmdlines: Optional[Dict[int, str]] = None,
+    conf_dirs: Optional[List[Path]] = None,
+) -> List[int]:
+    return _find_pidfile_pids(
+        adapter_ifname, "hostapd.pid", "hostapd", _pid_is_hostapd, proc_cmdlines, conf_dirs
+    )
+
+
+def _find_dnsmasq_pids(
+    adapter_ifname: Optional[str],
+    proc_cmdlines: Optional[Dict[int, str]] = None,
+    conf_dirs: Optional[List[Path]] = None,
+) -> List[int]:
+    return _find_pidfile_pids(
+        adapter_ifname, "dnsmasq.pid", "dnsmasq", _pid_is_dnsmasq, proc_cmdlines, conf_dirs
+    )
+
+
 def _collect_affinity_pids(
     *,
     adapter_ifname: Optional[str],
@@ -3203,17 +3760,19 @@ def _collect_affinity_pids(
 ) -> List[int]:
     pids: List[int] = []
 
+    # Matched on raw cmdline bytes: a gone pid reads as b"", so one read covers
+    # both the liveness and the name check, and nothing gets decoded.
     conf_dir = _find_latest_conf_dir(adapter_ifname, ap_interface)
     if conf_dir:
-        for name, matcher in (("hostapd.pid", _pid_is_hostapd), ("dnsmasq.pid", _pid_is_dnsmasq)):
-            pid = lnxrouter_conf.read_pid_file(conf_dir / name)
-            if pid and _pid_running(pid) and matcher(pid):
+        for pid_file, marker in (("hostapd.pid", b"hostapd"), ("dnsmasq.pid", b"dnsmasq")):
+            pid = lnxrouter_conf.read_pid_file(conf_dir / pid_file)
+            if pid and pid > 0 and marker in _pid_cmdline_raw(pid).lower():
                 pids.append(pid)
 
     if engine_pid and not pids:
         for child in _child_pids(engine_pid):
-            cmd = _pid_cmdline(child).lower()
-            if "hostapd" in cmd or "dnsmasq" in cmd:
+            raw = _pid_cmdline_raw(child).lower()
+            if b"hostapd" in raw or b"dnsmasq" in raw:
                 pids.append(child)
 
     if engine_pid:
@@ -3238,7 +3797,13 @@ def _watchdog_interval(cfg: Optional[Dict[str, object]]) -> float:
         return 2.0
 
 
-def _watchdog_reason(state: Dict[str, Any], cfg: Dict[str, object]) -> Optional[str]:
+def _watchdog_reason(
+    state: Dict[str, Any],
+    cfg: Dict[str, object],
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Returns (restart reason or None, telemetry snapshot the quality check took or None).
+    """
     adapter_ifname = state.get("adapter") if isinstance(state, dict) else None
     ap_interface = state.get("ap_interface") if isinstance(state, dict) else None
     engine_pid = state.get("engine", {}).get("pid") if isinstance(state, dict) else None
@@ -3259,47 +3824,47 @@ def _watchdog_reason(state: Dict[str, Any], cfg: Dict[str, object]) -> Optional[
             dnsmasq_ok = any(_pid_is_dnsmasq(pid) for pid in _child_pids(engine_pid))
 
         if not hostapd_ok:
-            return "hostapd_exited"
+            return "hostapd_exited", None
         if expect_dns and not dnsmasq_ok:
-            return "dnsmasq_exited"
+            return "dnsmasq_exited", None
         # Check connection quality if monitoring is enabled
         if bool(cfg.get("connection_quality_monitoring", True)):
-            quality_reason = _check_connection_quality(state, cfg)
-            if quality_reason:
-                return quality_reason
-        return None
+            return _check_connection_quality(state, cfg)
+        return None, None
 
     if engine_pid and _pid_running(engine_pid):
         children = _child_pids(engine_pid)
         has_hostapd = any(_pid_is_hostapd(pid) for pid in children)
         has_dnsmasq = any(_pid_is_dnsmasq(pid) for pid in children)
         if not has_hostapd:
-            return "hostapd_missing"
+            return "hostapd_missing", None
         if expect_dns and not has_dnsmasq:
-            return "dnsmasq_missing"
+            return "dnsmasq_missing", None
         # Check connection quality
         if bool(cfg.get("connection_quality_monitoring", True)):
-            quality_reason = _check_connection_quality(state, cfg)
-            if quality_reason:
-                return quality_reason
-        return None
-
-    if not _find_hostapd_pids(adapter_ifname):
-        return "hostapd_missing"
-    if expect_dns and not _find_dnsmasq_pids(adapter_ifname):
-        return "dnsmasq_missing"
-    return None
-
+            return _check_connection_quality(state, cfg)
+        return None, None
 
-def _check_connection_quality(state: Dict[str, Any], cfg: Dict[str, object]) -> Optional[str]:
-    """Check connection quality and return reason if quality is degraded."""
+    # One conf-dir listing serves both pidfile lookups.
+    conf_dirs = _candidate_conf_dirs(adapter_ifname)
+    if not _find_hostapd_pids(adapter_ifname, None, conf_dirs):
+        return "hostapd_missing", None
+    if expect_dns and not _find_dnsmasq_pids(adapter_ifname, None, conf_dirs):
+        return "dnsmasq_missing", None
+    return None, None
+
+
+def _check_connection_quality(
+    state: Dict[str, Any],
+    cfg: Dict[str, object],
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Check connection quality; returns (reason if quality is degraded, telemetry snapshot)."""
+    telemetry_data: Optional[Dict[str, Any]] = None
     try:
-        from vr_hotspotd import telemetry
-        
         adapter_ifname = state.get("adapter")
         telemetry_enabled = bool(cfg.get("telemetry_enable", True))
         if not telemetry_enabled:
-            return None
+            return None, None
         
         interval = float(cfg.get("telemetry_interval_s", 2.0))
         telemetry_data = telemetry.get_snapshot(
@@ -3310,7 +3875,7 @@ def _check_connection_quality(state: Dict[str, Any], cfg: Dict[str, object]) ->
         )
         
         if not telemetry_data.get("enabled"):
-            return None
+            return None, telemetry_data
         
         summary = telemetry_data.get("summary", {})
         quality_score = summary.get("quality_score_avg")
@@ -3321,14 +3886,30 @@ def _check_connection_quality(state: Dict[str, Any], cfg: Dict[str, object]) ->
             rssi_min = summary.get("rssi_min_dbm")
             
             if loss_pct is not None and loss_pct > 5.0:
-                return f"connection_quality_degraded:loss={loss_pct:.1f}%"
+                return f"connection_quality_degraded:loss={loss_pct:.1f}%", telemetry_data
             if rssi_min is not None and rssi_min < -85:
-                return f"connection_quality_degraded:rssi={rssi_min}dBm"
-            return f"connection_quality_degraded:score={quality_score:.1f}"
+                return f"connection_quality_degraded:rssi={rssi_min}dBm", telemetry_data
+            return f"connection_quality_degraded:score={quality_score:.1f}", telemetry_data
     except Exception:
         pass  # Best-effort, don't fail watchdog on telemetry errors
     
-    return None
+    return None, telemetry_data
+
+
+def _persist_auto_channel(cfg: Dict[str, Any], config_key: str, channel: int) -> None:
+    """
+    Record an auto-selected channel in cfg and on disk, skipping the config
+    rewrite when the persisted value already matches.
+    """
+    current = cfg.get(config_key)
+    try:
+        unchanged = current is not None and int(current) == int(channel)
+    except Exception:
+        unchanged = False
+    cfg[config_key] = channel
+    if unchanged:
+        return
+    write_config_file({config_key: channel})
 
 
 def _restart_from_watchdog(reason: str) -> None:
@@ -3368,8 +3949,7 @@ def _restart_from_watchdog(reason: str) -> None:
                 if best_channel:
                     config_key = _WATCHDOG_CHANNEL_CONFIG_KEY_BY_BAND.get(band)
                     if config_key:
-                        cfg[config_key] = best_channel
-                        write_config_file({config_key: best_channel})
+                        _persist_auto_channel(cfg, config_key, best_channel)
             except Exception:
                 pass  # Best-effort
     
@@ -3399,7 +3979,20 @@ def _restart_from_watchdog(reason: str) -> None:
 def _watchdog_loop() -> None:
     backoff_s = 2.0
     next_restart = 0.0
+    idle = False
+    seen_gen = _WATCHDOG_GEN
     while not _WATCHDOG_STOP.is_set():
+        if idle:
+            # Nothing to supervise while stopped; sleep until the next start instead
+            # of re-reading config and state every interval.
+            with _WATCHDOG_CV:
+                _WATCHDOG_CV.wait_for(
+                    lambda: _WATCHDOG_GEN != seen_gen or _WATCHDOG_STOP.is_set(),
+                    timeout=_WATCHDOG_IDLE_MAX_S,
+                )
+            idle = False
+        # Read before the state check so a start landing in between is not missed.
+        seen_gen = _WATCHDOG_GEN
         cfg = load_config()
         interval = _watchdog_interval(cfg)
         if _WATCHDOG_STOP.wait(interval):
@@ -3412,12 +4005,15 @@ def _watchdog_loop() -> None:
         st = load_state()
         if not st.get("running") or st.get("phase") != "running":
             backoff_s = max(2.0, interval)
+            idle = True
             continue
 
+        # The quality check's snapshot is reused by the TX-power step below.
+        tick_snapshot: Optional[Dict[str, Any]] = None
         if not is_running():
             reason = "engine_not_running"
         else:
-            reason = _watchdog_reason(st, cfg)
+            reason, tick_snapshot = _watchdog_reason(st, cfg)
 
         if not reason:
             backoff_s = max(2.0, interval)
@@ -3427,10 +4023,9 @@ def _watchdog_loop() -> None:
             tx_power_cfg = cfg.get("tx_power")
             if tx_power_cfg is None:  # Auto mode
                 try:
-                    from vr_hotspotd import telemetry
                     adapter_ifname = st.get("adapter")
                     if adapter_ifname:
-                        telemetry_data = telemetry.get_snapshot(
+                        telemetry_data = tick_snapshot or telemetry.get_snapshot(
                             adapter_ifname=adapter_ifname,
                             ap_interface_hint=st.get("ap_interface"),
                             enabled=True,
@@ -3445,14 +4040,13 @@ def _watchdog_loop() -> None:
                                 ok, msg = set_tx_power(adapter_ifname, new_power)
                                 if ok:
                                     # Update config
-                                    from vr_hotspotd.config import write_config_file
                                     write_config_file({"tx_power": new_power})
                 except Exception:
                     pass  # Best-effort
             
             continue
 
-        now = time.time()
+        now = time.monotonic()
         if next_restart and now < next_restart:
             continue
 
@@ -3463,7 +4057,10 @@ def _watchdog_loop() -> None:
 
 
 def _ensure_watchdog_started() -> None:
-    global _WATCHDOG_THREAD
+    global _WATCHDOG_THREAD, _WATCHDOG_GEN
+    with _WATCHDOG_CV:
+        _WATCHDOG_GEN += 1
+        _WATCHDOG_CV.notify_all()
     if _WATCHDOG_THREAD and _WATCHDOG_THREAD.is_alive():
         return
     _WATCHDOG_STOP.clear()
@@ -3471,14 +4068,61 @@ def _ensure_watchdog_started() -> None:
     _WATCHDOG_THREAD.start()
 
 
+# Trashed conf dirs still hold hostapd.conf with the plaintext passphrase.
+# One drainer thread at a time; "pending" asks a running drainer for another pass.
+_CONF_TRASH_GUARD = threading.Lock()
+_CONF_TRASH_DRAIN_LOCK = threading.Lock()
+_CONF_TRASH: Dict[str, Any] = {"thread": None, "pending": False}
+
+
+def _drain_conf_trash() -> None:
+    # Serialized, so a synchronous caller returns only once nothing is left mid-delete.
+    with _CONF_TRASH_DRAIN_LOCK:
+        try:
+            entries = list((_LNXROUTER_TMP / ".trash").iterdir())
+        except Exception:
+            return
+        for entry in entries:
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def _conf_trash_loop() -> None:
+    while True:
+        _drain_conf_trash()
+        with _CONF_TRASH_GUARD:
+            if not _CONF_TRASH["pending"]:
+                _CONF_TRASH["thread"] = None
+                return
+            _CONF_TRASH["pending"] = False
+
+
+def _schedule_conf_trash_drain() -> None:
+    with _CONF_TRASH_GUARD:
+        if _CONF_TRASH["thread"] is not None:
+            _CONF_TRASH["pending"] = True
+            return
+        thread = threading.Thread(target=_conf_trash_loop, name="conf-trash", daemon=True)
+        _CONF_TRASH["thread"] = thread
+        thread.start()
+
+
 def _remove_conf_dirs(adapter_ifname: Optional[str]) -> List[str]:
+    """
+    Move conf dirs into a trash dir (one rename each on tmpfs) and unlink them
+    on the background drainer, so stop does not wait on the tree walk.
+    """
     removed: List[str] = []
+    trash = _LNXROUTER_TMP / ".trash"
     for conf_dir in _candidate_conf_dirs(adapter_ifname):
         try:
+            trash.mkdir(exist_ok=True)
+            os.rename(conf_dir, trash / f"{conf_dir.name}.{secrets.token_hex(4)}")
+        except Exception:
             shutil.rmtree(conf_dir, ignore_errors=True)
+        if not conf_dir.exists():
             removed.append(conf_dir.name)
-        except Exception:
-            pass
+    if removed and trash.is_dir():
+        _schedule_conf_trash_drain()
     return removed
 
 
@@ -3494,14 +4138,21 @@ def _kill_runtime_processes(
         except Exception:
             pass
 
-    for pid in _find_our_lnxrouter_pids():
-        _kill_pid(pid)
+    # One /proc pass and one conf dir listing serve all three process families.
+    try:
+        procs: Optional[Dict[int, str]] = _scan_proc_cmdlines()
+    except Exception:
+        procs = None
+    conf_dirs = _candidate_conf_dirs(adapter_ifname)
 
-    for pid in _find_hostapd_pids(adapter_ifname):
-        _kill_pid(pid)
+    _kill_pids(
+        _find_our_lnxrouter_pids(procs)
+        + _find_hostapd_pids(adapter_ifname, procs, conf_dirs)
+        + _find_dnsmasq_pids(adapter_ifname, procs, conf_dirs)
+    )
 
-    for pid in _find_dnsmasq_pids(adapter_ifname):
-        _kill_pid(pid)
+    # AP ifaces change type/disappear once hostapd is gone.
+    _invalidate_iw_dev_dump()
 
 
 def _cleanup_virtual_ap_ifaces(target_phy: Optional[str] = None) -> List[str]:
@@ -3509,25 +4160,32 @@ def _cleanup_virtual_ap_ifaces(target_phy: Optional[str] = None) -> List[str]:
 
     try:
         dump = _iw_dev_dump()
-        ap_ifaces = _parse_iw_dev_ap_ifaces(dump)
+        # The dump already groups interfaces under their phy; keep that per iface.
+        ap_phys: Dict[str, Optional[str]] = {}
+        for ap in _parse_iw_dev_ap_info(dump):
+            if ap.ifname and _VIRT_AP_RE.match(ap.ifname):
+                ap_phys.setdefault(ap.ifname, ap.phy)
     except Exception:
         return removed
 
-    for ifname in sorted(ap_ifaces):
-        if not _VIRT_AP_RE.match(ifname):
-            continue
-
+    for ifname in sorted(ap_phys):
         if target_phy is not None:
-            try:
-                phy = _iface_phy(ifname)
-            except Exception:
-                phy = None
+            phy = ap_phys[ifname]
+            if phy is None:
+                try:
+                    phy = _iface_phy(ifname)
+                except Exception:
+                    phy = None
             if phy != target_phy:
                 continue
+        removed.append(ifname)
+
+    iw = _iw_bin() if removed else ""
 
+    def _del(ifname: str) -> None:
         try:
             subprocess.run(
-                [_iw_bin(), "dev", ifname, "del"],
+                [iw, "dev", ifname, "del"],
                 check=False,
                 capture_output=True,
                 text=True,
@@ -3536,8 +4194,17 @@ def _cleanup_virtual_ap_ifaces(target_phy: Optional[str] = None) -> List[str]:
         except Exception:
             pass
 
-        removed.append(ifname)
+    # iw has no batch mode and `ip link del` is refused for nl80211 vifs,
+    # so overlap the per-iface deletes instead of running them back to back.
+    if len(removed) > 1:
+        with ThreadPoolExecutor(max_workers=min(4, len(removed))) as pool:
+            list(pool.map(_del, removed))
+    else:
+        for ifname in removed:
+            _del(ifname)
 
+    if removed:
+        _invalidate_iw_dev_dump()
     return removed
 
 
@@ -3547,7 +4214,7 @@ def _select_ap_adapter(inv: dict, band_pref: str) -> str:
     For 6ghz: requires supports_6ghz True.
     """
     bp = (band_pref or "").lower().strip()
-    if bp in ("6", "6g", "6ghz", "6e"):
+    if _BAND_ALIAS.get(bp) == "6ghz":
         for a in inv.get("adapters", []):
             if a.get("supports_ap") and a.get("supports_6ghz"):
                 return a.get("ifname")
@@ -3573,11 +4240,27 @@ def _get_adapter(inv: dict, ifname: str) -> Optional[dict]:
     return None
 
 
+def _adapter_index(inv: dict) -> Dict[str, dict]:
+    """
+    ifname -> adapter map for repeated lookups; first entry wins, like _get_adapter.
+    """
+    index: Dict[str, dict] = {}
+    for a in inv.get("adapters", []):
+        ifname = a.get("ifname")
+        if ifname and ifname not in index:
+            index[ifname] = a
+    return index
+
+
 def _get_adapter_phy(inv: dict, ifname: str) -> Optional[str]:
     a = _get_adapter(inv, ifname)
     return a.get("phy") if a else None
 
 
+# Start overrides that feed into _build_firewalld_cfg.
+_FIREWALLD_CFG_OVERRIDE_KEYS = frozenset({"enable_internet", "bridge_mode"})
+
+
 def _build_firewalld_cfg(cfg: dict) -> dict:
     enable_internet = bool(cfg.get("enable_internet", True))
     if bool(cfg.get("bridge_mode", False)):
@@ -3594,22 +4277,29 @@ def _build_firewalld_cfg(cfg: dict) -> dict:
 def _apply_start_overrides(cfg: Dict[str, Any], overrides: Optional[dict]) -> Dict[str, Any]:
     if not overrides or not isinstance(overrides, dict):
         return cfg
-    for k, v in overrides.items():
-        if k in _START_OVERRIDE_KEYS:
-            cfg[k] = v
+    # Key-view intersection runs in C; payloads carry far fewer keys than the allow-list.
+    for k in overrides.keys() & _START_OVERRIDE_KEYS:
+        cfg[k] = overrides[k]
     return cfg
 
 
+# Last country this daemon set successfully; repeat starts skip the fork.
+_REGDOM_APPLIED: Dict[str, Optional[str]] = {"cc": None}
+
+
 def _maybe_set_regdom(country: Optional[str]) -> None:
     if not country or not isinstance(country, str):
         return
     cc = country.strip().upper()
     if len(cc) != 2:
         return
+    if _REGDOM_APPLIED["cc"] == cc:
+        return
     try:
-        subprocess.run([_iw_bin(), "reg", "set", cc], check=False, capture_output=True, text=True)
+        p = subprocess.run([_iw_bin(), "reg", "set", cc], check=False, capture_output=True, text=True)
     except Exception:
-        pass
+        return
+    _REGDOM_APPLIED["cc"] = cc if p.returncode == 0 else None
 
 
 def reconcile_state_with_engine() -> Dict[str, Any]:
@@ -3635,9 +4325,10 @@ def _repair_impl(
     host_facts_snapshot: Optional[HostFactsSnapshot] = None,
     inventory: Optional[Dict[str, Any]] = None,
     platform_is_pop: Optional[bool] = None,
+    firewalld_cfg: Optional[Dict[str, object]] = None,
 ):
     cfg = load_config()
-    fw_cfg = _build_firewalld_cfg(cfg)
+    fw_cfg = firewalld_cfg if firewalld_cfg is not None else _build_firewalld_cfg(cfg)
 
     st = load_state()
     tuning_warnings = _safe_revert_tuning(st.get("tuning") if isinstance(st, dict) else None)
@@ -3666,6 +4357,8 @@ def _repair_impl(
 
     _kill_runtime_processes(ap_ifname, firewalld_cfg=fw_cfg, stop_engine_first=True)
     removed_conf_dirs = _remove_conf_dirs(ap_ifname)
+    # Synchronous: trash a previous process left mid-drain is only found here (boot runs repair).
+    _drain_conf_trash()
 
     try:
         # Pop!_OS USB adapters can re-enumerate PHYs; stale virtual AP ifaces on
@@ -3694,30 +4387,54 @@ def _repair_impl(
         warnings=warnings,
         tuning={},
         network_tuning={},
-        engine={
-            "pid": None,
-            "cmd": None,
-            "started_ts": None,
-            "last_exit_code": None,
-            "last_error": None,
-            "stdout_tail": [],
-            "stderr_tail": [],
-            "ap_logs_tail": [],
-        },
+        engine=_empty_engine(),
     )
     return st
 
 
+def _has_stale_artifacts() -> bool:
+    """
+    Subprocess-free probe for leftovers a repair would clean up: a live engine,
+    lnxrouter conf dirs, or virtual AP ifaces. Errs towards True.
+    """
+    try:
+        if is_running():
+            return True
+        if _candidate_conf_dirs(None):
+            return True
+        return any(_VIRT_AP_RE.match(name) for name in os.listdir(_SYS_CLASS_NET))
+    except Exception:
+        return True
+
+
+def _start_needs_repair(prior_state: Dict[str, Any]) -> bool:
+    """
+    Start runs a full repair unless the previous op left a clean stop behind.
+    """
+    if not isinstance(prior_state, dict):
+        return True
+    if prior_state.get("phase") != "stopped" or prior_state.get("last_op") not in ("stop", "repair"):
+        return True
+    if prior_state.get("last_error") or prior_state.get("tuning") or prior_state.get("network_tuning"):
+        return True
+    engine = prior_state.get("engine")
+    if isinstance(engine, dict) and engine.get("pid"):
+        return True
+    return _has_stale_artifacts()
+
+
 def start_hotspot(correlation_id: str = "start", overrides: Optional[dict] = None, basic_mode: bool = False):
     with _OP_LOCK:
         return _start_hotspot_impl(correlation_id=correlation_id, overrides=overrides, basic_mode=basic_mode)
 
 
 def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict] = None, basic_mode: bool = False):
+    _invalidate_iw_dev_dump()
     ensure_config_file()
     state = load_state()
     if state.get("phase") in ("starting", "running") and is_running():
         return LifecycleResult("already_running", state)
+    prior_state = state
 
     cfg = load_config()
     cfg = _apply_start_overrides(cfg, overrides)
@@ -3781,20 +4498,23 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
     use_hostapd_nat = os_release.is_bazzite(platform_info)
     if use_hostapd_nat:
         platform_warnings.append("platform_bazzite_use_hostapd_nat")
-    fw_cfg = _build_firewalld_cfg(cfg)
+    base_fw_cfg = _build_firewalld_cfg(cfg)
+    fw_cfg = dict(base_fw_cfg)
     if firewall_backend == "firewalld":
         fw_cfg["firewalld_enabled"] = True
     else:
         fw_cfg["firewalld_enabled"] = False
-    state = update_state(
-        attempts=[],
-        selected_band=None,
-        selected_width_mhz=None,
-        selected_channel=None,
-        selected_country=None,
-        pro_mode_allow_fallback_40mhz=allow_fallback_40mhz,
-        last_error_detail=None,
-    )
+    # Per-attempt fields cleared for this start. Not written on their own: they ride
+    # along with the "starting" write or with whichever early failure comes first.
+    start_reset: Dict[str, Any] = {
+        "attempts": [],
+        "selected_band": None,
+        "selected_width_mhz": None,
+        "selected_channel": None,
+        "selected_country": None,
+        "pro_mode_allow_fallback_40mhz": allow_fallback_40mhz,
+        "last_error_detail": None,
+    }
 
     ssid = cfg.get("ssid", "VR-Hotspot")
     passphrase = cfg.get("wpa2_passphrase", "")
@@ -3825,17 +4545,12 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
     dhcp_start_ip = _norm_str(cfg.get("dhcp_start_ip"))
     dhcp_end_ip = _norm_str(cfg.get("dhcp_end_ip"))
     dhcp_dns = _norm_str(cfg.get("dhcp_dns"))
+    country_str = country if isinstance(country, str) else None
+    bridge_name_s = _norm_str(bridge_name)
+    bridge_uplink_s = _norm_str(bridge_uplink)
 
     # Normalize band
-    bp = str(band_pref or "").lower().strip()
-    if bp in ("2ghz", "2.4", "2.4ghz"):
-        bp = "2.4ghz"
-    elif bp in ("5", "5g", "5ghz"):
-        bp = "5ghz"
-    elif bp in ("6", "6g", "6ghz", "6e"):
-        bp = "6ghz"
-    else:
-        bp = "5ghz"
+    bp = _BAND_ALIAS.get(str(band_pref or "").lower().strip(), "5ghz")
 
     passphrase_override_provided = isinstance(overrides, dict) and "wpa2_passphrase" in overrides
     if not isinstance(passphrase, str) or len(passphrase) < 8:
@@ -3855,6 +4570,7 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
         if not isinstance(passphrase, str) or len(passphrase) < 8:
             err = "invalid_passphrase_min_length_8"
             state = update_state(
+                **start_reset,
                 phase="error",
                 running=False,
                 ap_interface=None,
@@ -3912,12 +4628,22 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
         # All host mutation stays behind the active-uplink role guard. Repair
         # can stop engines, revert tuning/firewall state, and remove virtual
         # interfaces, so it must not run until the selected AP role is safe.
-        _repair_impl(
-            correlation_id=correlation_id,
-            host_facts_snapshot=host_facts_snapshot,
-            inventory=inv,
-            platform_is_pop=platform_is_pop,
-        )
+        # A clean stop with nothing left behind needs no repair pass.
+        if _start_needs_repair(prior_state):
+            # Repair tears down what the persisted config started; reuse our
+            # firewalld cfg unless start overrides changed its inputs.
+            repair_fw_cfg = None
+            if not (isinstance(overrides, dict) and _FIREWALLD_CFG_OVERRIDE_KEYS.intersection(overrides)):
+                repair_fw_cfg = base_fw_cfg
+            _repair_impl(
+                correlation_id=correlation_id,
+                host_facts_snapshot=host_facts_snapshot,
+                inventory=inv,
+                platform_is_pop=platform_is_pop,
+                firewalld_cfg=repair_fw_cfg,
+            )
+        else:
+            log.info("start_repair_skipped", extra={"reason": "clean_stop"})
         state = update_state(
             phase="starting",
             last_op="start",
@@ -3928,13 +4654,7 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
             warnings=[],
             ap_interface=None,
             engine={"ap_logs_tail": []},
-            attempts=[],
-            selected_band=None,
-            selected_width_mhz=None,
-            selected_channel=None,
-            selected_country=None,
-            pro_mode_allow_fallback_40mhz=allow_fallback_40mhz,
-            last_error_detail=None,
+            **start_reset,
         )
 
         iwd_warnings = _reserve_iwd_ap_adapter(
@@ -4067,7 +4787,8 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
         except Exception:
             pass  # Best-effort, continue if profile application fails
 
-        target_phy = _get_adapter_phy(inv, ap_ifname)
+        # `a` tracks ap_ifname through reselection, so no second inventory scan.
+        target_phy = a.get("phy")
     except Exception as e:
         err = str(e)
         error_detail = None
@@ -4100,22 +4821,13 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
                 if nm_remediation_error:
                     error_detail["remediation_error"] = nm_remediation_error
         state = update_state(
+            **{**start_reset, "last_error_detail": error_detail},
             phase="error",
             running=False,
             ap_interface=None,
             last_error=err,
-            last_error_detail=error_detail,
             last_correlation_id=correlation_id,
-            engine={
-                "pid": None,
-                "cmd": None,
-                "started_ts": None,
-                "last_exit_code": None,
-                "last_error": err,
-                "stdout_tail": [],
-                "stderr_tail": [],
-                "ap_logs_tail": [],
-            },
+            engine=_empty_engine(last_error=err),
         )
         result_code = (
             ERROR_AP_ADAPTER_IS_ACTIVE_UPLINK
@@ -4126,21 +4838,12 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
 
     wifi6_setting = cfg.get("wifi6", "auto")
     if isinstance(wifi6_setting, str):
-        s = wifi6_setting.strip().lower()
-        if s == "auto":
-            wifi6_setting = "auto"
-        elif s in ("1", "true", "yes", "on", "y"):
-            wifi6_setting = True
-        elif s in ("0", "false", "no", "off", "n"):
-            wifi6_setting = False
-        else:
-            wifi6_setting = "auto"
+        wifi6_setting = _WIFI6_ALIAS.get(wifi6_setting.strip().lower(), "auto")
 
     supports_wifi6 = bool(a.get("supports_wifi6"))
     effective_wifi6 = False
-    start_warnings: List[str] = []
-    if prestart_warnings:
-        start_warnings.extend(prestart_warnings)
+    # One warnings buffer for the whole start; later phases append to it in place.
+    start_warnings: List[str] = prestart_warnings
     if platform_warnings:
         start_warnings.extend(platform_warnings)
 
@@ -4155,11 +4858,8 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
     else:
         effective_wifi6 = supports_wifi6
 
-    if start_warnings:
-        update_state(warnings=start_warnings)
-
     # Best-effort regdom set before starting (helps 5/6 GHz bringup on many systems)
-    _maybe_set_regdom(country if isinstance(country, str) else None)
+    _maybe_set_regdom(country_str)
 
     # Enforce WPA3-SAE for 6 GHz
     ap_security = str(cfg.get("ap_security", "wpa2")).lower().strip()
@@ -4173,6 +4873,7 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
             last_error=err,
             last_correlation_id=correlation_id,
             engine={"last_error": err, "ap_logs_tail": []},
+            **({"warnings": start_warnings} if start_warnings else {}),
         )
         return LifecycleResult("start_failed", state)
 
@@ -4188,7 +4889,11 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
     preflight_errors = [str(e) for e in preflight_result.get("errors") or []]
     if preflight_errors:
         start_warnings.extend([f"preflight_error:{e}" for e in preflight_errors])
-    update_state(preflight=preflight_result)
+    # Early warnings ride along with the preflight write rather than costing their own.
+    if start_warnings:
+        update_state(preflight=preflight_result, warnings=start_warnings)
+    else:
+        update_state(preflight=preflight_result)
     try:
         hostapd_caps = (preflight_result.get("details") or {}).get("hostapd") or {}
         hostapd_he = hostapd_caps.get("he")
@@ -4214,15 +4919,15 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
             target_phy=target_phy,
             ssid=ssid,
             passphrase=passphrase,
-            country=country if isinstance(country, str) else None,
+            country=country_str,
             ap_security=ap_security,
             ap_ready_timeout_s=ap_ready_timeout_s,
             optimized_no_virt=optimized_no_virt,
             debug=debug,
             enable_internet=enable_internet,
             bridge_mode=bridge_mode,
-            bridge_name=bridge_name,
-            bridge_uplink=bridge_uplink,
+            bridge_name=bridge_name_s,
+            bridge_uplink=bridge_uplink_s,
             gateway_ip=gateway_ip,
             dhcp_start_ip=dhcp_start_ip,
             dhcp_end_ip=dhcp_end_ip,
@@ -4241,9 +4946,52 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
             ap_ready_nohint_retry_s=ap_ready_nohint_retry_s,
             pop_timeout_retry_no_virt=platform_is_pop,
             host_facts_snapshot=host_facts_snapshot,
+            adapter_info=a,
         )
 
+    # Radio knobs shared by the primary, retry and fallback command builders.
+    channel_width = str(cfg.get("channel_width", "auto")).lower()
+    beacon_interval = int(cfg.get("beacon_interval", 50))
+    dtim_period = int(cfg.get("dtim_period", 1))
+    short_guard_interval = bool(cfg.get("short_guard_interval", True))
+    tx_power = cfg.get("tx_power")
+    if tx_power is not None:
+        try:
+            tx_power = int(tx_power)
+        except Exception:
+            tx_power = None
+
     # Attempt 1: requested band
+    # Shared by the primary attempt and every retry/fallback; only band/channel/virt/width vary.
+    nat_base: Dict[str, Any] = dict(
+        ap_ifname=ap_ifname,
+        ssid=ssid,
+        passphrase=passphrase,
+        ap_security=ap_security,
+        country=country_str,
+        debug=debug,
+        wifi6=effective_wifi6,
+        gateway_ip=gateway_ip,
+        dhcp_start_ip=dhcp_start_ip,
+        dhcp_end_ip=dhcp_end_ip,
+        dhcp_dns=dhcp_dns,
+        enable_internet=enable_internet,
+        beacon_interval=beacon_interval,
+        dtim_period=dtim_period,
+        short_guard_interval=short_guard_interval,
+        tx_power=tx_power,
+    )
+    lnx_base: Dict[str, Any] = dict(
+        ap_ifname=ap_ifname,
+        ssid=ssid,
+        passphrase=passphrase,
+        country=country_str,
+        wifi6=effective_wifi6,
+        gateway_ip=gateway_ip,
+        dhcp_dns=dhcp_dns,
+        enable_internet=enable_internet,
+    )
+
     if bridge_mode:
         bridge_channel: Optional[int] = None
         if bp == "6ghz":
@@ -4259,30 +5007,19 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
             except Exception:
                 bridge_channel = 6
 
-        channel_width = str(cfg.get("channel_width", "auto")).lower()
-        beacon_interval = int(cfg.get("beacon_interval", 50))
-        dtim_period = int(cfg.get("dtim_period", 1))
-        short_guard_interval = bool(cfg.get("short_guard_interval", True))
-        tx_power = cfg.get("tx_power")
-        if tx_power is not None:
-            try:
-                tx_power = int(tx_power)
-            except Exception:
-                tx_power = None
-
         cmd1 = build_cmd_bridge(
             ap_ifname=ap_ifname,
             ssid=ssid,
             passphrase=passphrase,
             band=bp,
             ap_security=ap_security,
-            country=country if isinstance(country, str) else None,
+            country=country_str,
             channel=bridge_channel,
             no_virt=optimized_no_virt,
             debug=debug,
             wifi6=effective_wifi6,
-            bridge_name=str(bridge_name).strip() if isinstance(bridge_name, str) else None,
-            bridge_uplink=str(bridge_uplink).strip() if isinstance(bridge_uplink, str) else None,
+            bridge_name=bridge_name_s,
+            bridge_uplink=bridge_uplink_s,
             channel_width=channel_width,
             beacon_interval=beacon_interval,
             dtim_period=dtim_period,
@@ -4300,7 +5037,7 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
                 if best_channel:
                     channel_6g = best_channel
                     # Update config with selected channel
-                    write_config_file({"channel_6g": best_channel})
+                    _persist_auto_channel(cfg, "channel_6g", best_channel)
             except Exception:
                 pass  # Best-effort, continue with default
         
@@ -4310,22 +5047,11 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
             except Exception:
                 channel_6g = None
 
-        channel_width = str(cfg.get("channel_width", "auto")).lower()
-        beacon_interval = int(cfg.get("beacon_interval", 50))
-        dtim_period = int(cfg.get("dtim_period", 1))
-        short_guard_interval = bool(cfg.get("short_guard_interval", True))
-        tx_power = cfg.get("tx_power")
-        if tx_power is not None:
-            try:
-                tx_power = int(tx_power)
-            except Exception:
-                tx_power = None
-
         cmd1 = build_cmd_6ghz(
             ap_ifname=ap_ifname,
             ssid=ssid,
             passphrase=passphrase,
-            country=country if isinstance(country, str) else None,
+            country=country_str,
             channel=channel_6g,
             no_virt=optimized_no_virt,
             debug=debug,
@@ -4364,141 +5090,99 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
                     # If we auto-picked 5GHz, should we persist it?
                     # 6GHz logic persists it. Let's persist it for consistency if it was a 5GHz pick.
                     if bp == "5ghz":
-                        write_config_file({"channel_5g": best_channel})
+                        _persist_auto_channel(cfg, "channel_5g", best_channel)
             except Exception:
                 pass  # Best-effort
 
-        channel_width = str(cfg.get("channel_width", "auto")).lower()
-        if enforced_channel_width:
-             channel_width = enforced_channel_width
-        beacon_interval = int(cfg.get("beacon_interval", 50))
-        dtim_period = int(cfg.get("dtim_period", 1))
-        short_guard_interval = bool(cfg.get("short_guard_interval", True))
-        tx_power = cfg.get("tx_power")
-        if tx_power is not None:
-            try:
-                tx_power = int(tx_power)
-            except Exception:
-                tx_power = None
-
+        primary_channel_width = enforced_channel_width or channel_width
         if use_hostapd_nat:
-            strict_width = bp == "5ghz" and str(channel_width) in ("auto", "80", "160")
+            strict_width = bp == "5ghz" and primary_channel_width in ("auto", "80", "160")
             cmd1 = build_cmd_nat(
-                ap_ifname=ap_ifname,
-                ssid=ssid,
-                passphrase=passphrase,
+                **nat_base,
                 band=bp,
-                ap_security=ap_security,
-                country=country if isinstance(country, str) else None,
                 channel=selected_channel,
                 no_virt=optimized_no_virt,
-                debug=debug,
-                wifi6=effective_wifi6,
-                gateway_ip=gateway_ip,
-                dhcp_start_ip=dhcp_start_ip,
-                dhcp_end_ip=dhcp_end_ip,
-                dhcp_dns=dhcp_dns,
-                enable_internet=enable_internet,
-                channel_width=channel_width,
-                beacon_interval=beacon_interval,
-                dtim_period=dtim_period,
-                short_guard_interval=short_guard_interval,
-                tx_power=tx_power,
+                channel_width=primary_channel_width,
                 strict_width=strict_width,
             )
         else:
             cmd1 = build_cmd(
-                ap_ifname=ap_ifname,
-                ssid=ssid,
-                passphrase=passphrase,
+                **lnx_base,
                 band_preference=bp,
-                country=country if isinstance(country, str) else None,
                 channel=selected_channel,
                 no_virt=optimized_no_virt,
-                wifi6=effective_wifi6,
-                gateway_ip=gateway_ip,
-                dhcp_dns=dhcp_dns,
-                enable_internet=enable_internet,
             )
 
-    res = start_engine(cmd1, firewalld_cfg=fw_cfg)
+    def _expected_ifname(no_virt: bool) -> Optional[str]:
+        if use_hostapd_nat:
+            return ap_ifname if no_virt else _virt_ap_ifname(ap_ifname)
+        return _lnxrouter_expected_ifname(ap_ifname, no_virt=no_virt)
 
-    state = update_state(
-        adapter=ap_ifname,
-        engine={
-            "pid": res.pid,
-            "cmd": res.cmd,
-            "started_ts": res.started_ts,
-            "last_exit_code": res.exit_code,
-            "last_error": res.error,
-            "stdout_tail": res.stdout_tail,
-            "stderr_tail": res.stderr_tail,
-            "ap_logs_tail": [],
-        },
-    )
+    def _build_attempt_cmd(band: str, channel: Optional[int], no_virt: bool) -> List[str]:
+        if use_hostapd_nat:
+            strict_width = band == "5ghz" and channel_width in ("auto", "80", "160")
+            return build_cmd_nat(
+                **nat_base,
+                band=band,
+                channel=channel,
+                no_virt=no_virt,
+                channel_width=channel_width,
+                strict_width=strict_width,
+            )
+        return build_cmd(**lnx_base, band_preference=band, channel=channel, no_virt=no_virt)
 
-    expected_ap_ifname = None
-    if use_hostapd_nat:
-        expected_ap_ifname = ap_ifname if optimized_no_virt else _virt_ap_ifname(ap_ifname)
-    else:
-        expected_ap_ifname = _lnxrouter_expected_ifname(ap_ifname, no_virt=optimized_no_virt)
+    # Logs/tails of the last failed attempt. Held back rather than written: the next
+    # launch overwrites every one of these engine fields, so only _fail_start needs them.
+    pending_engine: Dict[str, Any] = {}
 
-    ap_info = None
-    start_failure_reason = None
-    latest_stdout = res.stdout_tail
-    latest_stderr = res.stderr_tail
-    if not res.ok:
-        start_failure_reason = res.error or "engine_start_failed"
-    else:
+    def _launch_attempt(cmd: List[str], no_virt: bool) -> Tuple[Any, Optional[APReadyInfo]]:
+        res = start_engine(cmd, firewalld_cfg=fw_cfg)
+        pending_engine.clear()
+        update_state(
+            adapter=ap_ifname,
+            engine={
+                "pid": res.pid,
+                "cmd": res.cmd,
+                "started_ts": res.started_ts,
+                "last_exit_code": res.exit_code,
+                "last_error": res.error,
+                "stdout_tail": res.stdout_tail,
+                "stderr_tail": res.stderr_tail,
+                "ap_logs_tail": [],
+            },
+        )
+        if not res.ok:
+            return res, None
         ap_info = _wait_for_ap_ready(
             target_phy,
             ap_ready_timeout_s,
             ssid=ssid,
             adapter_ifname=ap_ifname,
-            expected_ap_ifname=expected_ap_ifname,
+            expected_ap_ifname=_expected_ifname(no_virt),
         )
-        if not ap_info:
-            start_failure_reason = "ap_ready_timeout"
-            try:
-                latest_stdout, latest_stderr = get_tails()
-            except Exception:
-                latest_stdout = res.stdout_tail
-                latest_stderr = res.stderr_tail
-            if latest_stdout or latest_stderr:
-                update_state(engine={"stdout_tail": latest_stdout, "stderr_tail": latest_stderr})
+        return res, ap_info
 
-    if ap_info:
-        detected_band = _band_from_freq_mhz(ap_info.freq_mhz) or bp
-        affinity_pids = _collect_affinity_pids(
+    def _finish_running(
+        res: Any,
+        ap_info: APReadyInfo,
+        band: str,
+        warnings: List[str],
+        *,
+        mode: str,
+        fallback_reason: Optional[str],
+    ) -> LifecycleResult:
+        detected_band = _band_from_freq_mhz(ap_info.freq_mhz) or band
+        runtime_tuning, net_state, tuning_warnings = _apply_runtime_tuning(
+            tuning_state,
+            cfg,
+            ap_ifname=ap_info.ifname,
             adapter_ifname=ap_ifname,
-            ap_interface=ap_info.ifname,
             engine_pid=res.pid,
+            enable_internet=enable_internet,
+            fw_cfg=fw_cfg,
+            firewall_backend=firewall_backend,
         )
-        try:
-            tuning_state, runtime_warnings = system_tuning.apply_runtime(
-                tuning_state,
-                cfg,
-                ap_ifname=ap_info.ifname,
-                adapter_ifname=ap_ifname,
-                cpu_affinity_pids=affinity_pids,
-            )
-        except Exception as e:
-            runtime_warnings = [f"system_tuning_runtime_failed:{e}"]
-        if runtime_warnings:
-            start_warnings.extend(runtime_warnings)
-        try:
-            net_state, net_warnings = network_tuning.apply(
-                cfg,
-                ap_ifname=ap_info.ifname,
-                enable_internet=enable_internet,
-                firewalld_cfg=fw_cfg,
-                firewall_backend=firewall_backend,
-            )
-        except Exception as e:
-            net_state = {}
-            net_warnings = [f"network_tuning_apply_failed:{e}"]
-        if net_warnings:
-            start_warnings.extend(net_warnings)
+        warnings.extend(tuning_warnings)
         state = update_state(
             phase="running",
             running=True,
@@ -4508,33 +5192,58 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
             selected_band=detected_band,
             selected_width_mhz=ap_info.channel_width_mhz,
             selected_channel=ap_info.channel,
-            selected_country=country if isinstance(country, str) else None,
-            mode="optimized",
-            fallback_reason=None,
-            warnings=start_warnings,
+            selected_country=country_str,
+            mode=mode,
+            fallback_reason=fallback_reason,
+            warnings=warnings,
             last_error=None,
             last_correlation_id=correlation_id,
-            tuning=tuning_state,
+            tuning=runtime_tuning,
             network_tuning=net_state,
             engine={"last_error": None, "last_exit_code": None, "ap_logs_tail": []},
         )
         if _watchdog_enabled(cfg) and is_running():
             _ensure_watchdog_started()
-        return LifecycleResult("started", state)
+        return LifecycleResult("started" if mode == "optimized" else "started_with_fallback", state)
+
+    def _cleanup_attempt(engine_update: Optional[Dict[str, Any]] = None) -> None:
+        try:
+            ap_candidate = _select_ap_from_iw(_recent_iw_dev_dump(), target_phy=target_phy, ssid=ssid)
+        except Exception:
+            ap_candidate = None
+        ap_logs = _collect_ap_logs(ap_ifname, ap_candidate.ifname if ap_candidate else None)
+        pending_engine.clear()
+        pending_engine.update(engine_update or {})
+        if ap_logs:
+            pending_engine["ap_logs_tail"] = ap_logs
+        _kill_runtime_processes(ap_ifname, firewalld_cfg=fw_cfg, stop_engine_first=True)
+        _remove_conf_dirs(ap_ifname)
+
+    res, ap_info = _launch_attempt(cmd1, optimized_no_virt)
+
+    start_failure_reason = None
+    latest_stdout = res.stdout_tail
+    latest_stderr = res.stderr_tail
+    tails_update: Dict[str, Any] = {}
+    if not res.ok:
+        start_failure_reason = res.error or "engine_start_failed"
+    elif not ap_info:
+        start_failure_reason = "ap_ready_timeout"
+        try:
+            latest_stdout, latest_stderr = get_tails()
+        except Exception:
+            latest_stdout = res.stdout_tail
+            latest_stderr = res.stderr_tail
+        if latest_stdout or latest_stderr:
+            tails_update = {"stdout_tail": latest_stdout, "stderr_tail": latest_stderr}
+
+    if ap_info:
+        return _finish_running(res, ap_info, bp, start_warnings, mode="optimized", fallback_reason=None)
 
     # If requested band failed to become ready, fallback (6 -> 5 -> 2.4).
-    ap_candidate = None
-    try:
-        ap_candidate = _select_ap_from_iw(_iw_dev_dump(), target_phy=target_phy, ssid=ssid)
-    except Exception:
-        ap_candidate = None
-    ap_logs = _collect_ap_logs(ap_ifname, ap_candidate.ifname if ap_candidate else None)
-    if ap_logs:
-        update_state(engine={"ap_logs_tail": ap_logs})
-    _kill_runtime_processes(ap_ifname, firewalld_cfg=fw_cfg, stop_engine_first=True)
-    _remove_conf_dirs(ap_ifname)
+    _cleanup_attempt(tails_update)
 
-    warnings: List[str] = list(start_warnings)
+    warnings = start_warnings
     if start_failure_reason == "ap_ready_timeout":
         warnings.append("optimized_ap_start_timed_out")
     else:
@@ -4542,294 +5251,27 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
 
     driver_lines = _coerce_log_lines(latest_stdout) + _coerce_log_lines(latest_stderr)
     driver_error = _stdout_has_hostapd_driver_error(driver_lines)
-    if optimized_no_virt and driver_error and (not bridge_mode) and bp in ("2.4ghz", "5ghz"):
-        warnings.append("optimized_no_virt_retry_with_virt")
-        retry_channel_width = str(cfg.get("channel_width", "auto")).lower()
-        retry_beacon_interval = int(cfg.get("beacon_interval", 50))
-        retry_dtim_period = int(cfg.get("dtim_period", 1))
-        retry_short_guard_interval = bool(cfg.get("short_guard_interval", True))
-        retry_tx_power = cfg.get("tx_power")
-        if retry_tx_power is not None:
-            try:
-                retry_tx_power = int(retry_tx_power)
-            except Exception:
-                retry_tx_power = None
-
-        if use_hostapd_nat:
-            strict_width = bp == "5ghz" and str(retry_channel_width) in ("auto", "80", "160")
-            cmd_retry = build_cmd_nat(
-                ap_ifname=ap_ifname,
-                ssid=ssid,
-                passphrase=passphrase,
-                band=bp,
-                ap_security=ap_security,
-                country=country if isinstance(country, str) else None,
-                channel=selected_channel,
-                no_virt=False,
-                debug=debug,
-                wifi6=effective_wifi6,
-                gateway_ip=gateway_ip,
-                dhcp_start_ip=dhcp_start_ip,
-                dhcp_end_ip=dhcp_end_ip,
-                dhcp_dns=dhcp_dns,
-                enable_internet=enable_internet,
-                channel_width=retry_channel_width,
-                beacon_interval=retry_beacon_interval,
-                dtim_period=retry_dtim_period,
-                short_guard_interval=retry_short_guard_interval,
-                tx_power=retry_tx_power,
-                strict_width=strict_width,
-            )
+    if driver_error and (not bridge_mode) and bp in ("2.4ghz", "5ghz"):
+        # Driver errors often depend on the virt/no-virt choice; flip it once on the same band.
+        retry_no_virt = not optimized_no_virt
+        if optimized_no_virt:
+            warnings.append("optimized_no_virt_retry_with_virt")
+            retry_tag, retry_reason = "optimized_no_virt_retry", "no_virt_retry"
         else:
-            cmd_retry = build_cmd(
-                ap_ifname=ap_ifname,
-                ssid=ssid,
-                passphrase=passphrase,
-                band_preference=bp,
-                country=country if isinstance(country, str) else None,
-                channel=selected_channel,
-                no_virt=False,
-                wifi6=effective_wifi6,
-                gateway_ip=gateway_ip,
-                dhcp_dns=dhcp_dns,
-                enable_internet=enable_internet,
-            )
+            warnings.append("optimized_virt_retry_with_no_virt")
+            retry_tag, retry_reason = "optimized_virt_retry", "virt_retry_no_virt"
 
-        res_retry = start_engine(cmd_retry, firewalld_cfg=fw_cfg)
-        update_state(
-            adapter=ap_ifname,
-            engine={
-                "pid": res_retry.pid,
-                "cmd": res_retry.cmd,
-                "started_ts": res_retry.started_ts,
-                "last_exit_code": res_retry.exit_code,
-                "last_error": res_retry.error,
-                "stdout_tail": res_retry.stdout_tail,
-                "stderr_tail": res_retry.stderr_tail,
-                "ap_logs_tail": [],
-            },
+        res_retry, ap_info_retry = _launch_attempt(
+            _build_attempt_cmd(bp, selected_channel, retry_no_virt),
+            retry_no_virt,
         )
-
-        ap_info_retry = None
-        if res_retry.ok:
-            retry_expected_ifname = _virt_ap_ifname(ap_ifname) if use_hostapd_nat else _lnxrouter_expected_ifname(ap_ifname, no_virt=False)
-            ap_info_retry = _wait_for_ap_ready(
-                target_phy,
-                ap_ready_timeout_s,
-                ssid=ssid,
-                adapter_ifname=ap_ifname,
-                expected_ap_ifname=retry_expected_ifname,
-            )
-
         if ap_info_retry:
-            detected_band = _band_from_freq_mhz(ap_info_retry.freq_mhz) or bp
-            affinity_pids = _collect_affinity_pids(
-                adapter_ifname=ap_ifname,
-                ap_interface=ap_info_retry.ifname,
-                engine_pid=res_retry.pid,
+            return _finish_running(
+                res_retry, ap_info_retry, bp, warnings, mode="fallback", fallback_reason=retry_reason
             )
-            try:
-                tuning_state, runtime_warnings = system_tuning.apply_runtime(
-                    tuning_state,
-                    cfg,
-                    ap_ifname=ap_info_retry.ifname,
-                    adapter_ifname=ap_ifname,
-                    cpu_affinity_pids=affinity_pids,
-                )
-            except Exception as e:
-                runtime_warnings = [f"system_tuning_runtime_failed:{e}"]
-            if runtime_warnings:
-                warnings.extend(runtime_warnings)
-            try:
-                net_state, net_warnings = network_tuning.apply(
-                    cfg,
-                    ap_ifname=ap_info_retry.ifname,
-                    enable_internet=enable_internet,
-                    firewalld_cfg=fw_cfg,
-                    firewall_backend=firewall_backend,
-                )
-            except Exception as e:
-                net_state = {}
-                net_warnings = [f"network_tuning_apply_failed:{e}"]
-            if net_warnings:
-                warnings.extend(net_warnings)
-            state = update_state(
-                phase="running",
-                running=True,
-                ap_interface=ap_info_retry.ifname,
-                band=detected_band,
-                channel_width_mhz=ap_info_retry.channel_width_mhz,
-                selected_band=detected_band,
-                selected_width_mhz=ap_info_retry.channel_width_mhz,
-                selected_channel=ap_info_retry.channel,
-                selected_country=country if isinstance(country, str) else None,
-                mode="fallback",
-                fallback_reason="no_virt_retry",
-                warnings=warnings,
-                last_error=None,
-                last_correlation_id=correlation_id,
-                tuning=tuning_state,
-                network_tuning=net_state,
-                engine={"last_error": None, "last_exit_code": None, "ap_logs_tail": []},
-            )
-            if _watchdog_enabled(cfg) and is_running():
-                _ensure_watchdog_started()
-            return LifecycleResult("started_with_fallback", state)
 
-        warnings.append("optimized_no_virt_retry_failed")
-        try:
-            ap_candidate = _select_ap_from_iw(_iw_dev_dump(), target_phy=target_phy, ssid=ssid)
-        except Exception:
-            ap_candidate = None
-        ap_logs = _collect_ap_logs(ap_ifname, ap_candidate.ifname if ap_candidate else None)
-        if ap_logs:
-            update_state(engine={"ap_logs_tail": ap_logs})
-        _kill_runtime_processes(ap_ifname, firewalld_cfg=fw_cfg, stop_engine_first=True)
-        _remove_conf_dirs(ap_ifname)
-    elif (not optimized_no_virt) and driver_error and (not bridge_mode) and bp in ("2.4ghz", "5ghz"):
-        warnings.append("optimized_virt_retry_with_no_virt")
-        retry_channel_width = str(cfg.get("channel_width", "auto")).lower()
-        retry_beacon_interval = int(cfg.get("beacon_interval", 50))
-        retry_dtim_period = int(cfg.get("dtim_period", 1))
-        retry_short_guard_interval = bool(cfg.get("short_guard_interval", True))
-        retry_tx_power = cfg.get("tx_power")
-        if retry_tx_power is not None:
-            try:
-                retry_tx_power = int(retry_tx_power)
-            except Exception:
-                retry_tx_power = None
-
-        if use_hostapd_nat:
-            strict_width = bp == "5ghz" and str(retry_channel_width) in ("auto", "80", "160")
-            cmd_retry = build_cmd_nat(
-                ap_ifname=ap_ifname,
-                ssid=ssid,
-                passphrase=passphrase,
-                band=bp,
-                ap_security=ap_security,
-                country=country if isinstance(country, str) else None,
-                channel=selected_channel,
-                no_virt=True,
-                debug=debug,
-                wifi6=effective_wifi6,
-                gateway_ip=gateway_ip,
-                dhcp_start_ip=dhcp_start_ip,
-                dhcp_end_ip=dhcp_end_ip,
-                dhcp_dns=dhcp_dns,
-                enable_internet=enable_internet,
-                channel_width=retry_channel_width,
-                beacon_interval=retry_beacon_interval,
-                dtim_period=retry_dtim_period,
-                short_guard_interval=retry_short_guard_interval,
-                tx_power=retry_tx_power,
-                strict_width=strict_width,
-            )
-        else:
-            cmd_retry = build_cmd(
-                ap_ifname=ap_ifname,
-                ssid=ssid,
-                passphrase=passphrase,
-                band_preference=bp,
-                country=country if isinstance(country, str) else None,
-                channel=selected_channel,
-                no_virt=True,
-                wifi6=effective_wifi6,
-                gateway_ip=gateway_ip,
-                dhcp_dns=dhcp_dns,
-                enable_internet=enable_internet,
-            )
-
-        res_retry = start_engine(cmd_retry, firewalld_cfg=fw_cfg)
-        update_state(
-            adapter=ap_ifname,
-            engine={
-                "pid": res_retry.pid,
-                "cmd": res_retry.cmd,
-                "started_ts": res_retry.started_ts,
-                "last_exit_code": res_retry.exit_code,
-                "last_error": res_retry.error,
-                "stdout_tail": res_retry.stdout_tail,
-                "stderr_tail": res_retry.stderr_tail,
-                "ap_logs_tail": [],
-            },
-        )
-
-        ap_info_retry = None
-        if res_retry.ok:
-            retry_expected_ifname = ap_ifname if use_hostapd_nat else _lnxrouter_expected_ifname(ap_ifname, no_virt=True)
-            ap_info_retry = _wait_for_ap_ready(
-                target_phy,
-                ap_ready_timeout_s,
-                ssid=ssid,
-                adapter_ifname=ap_ifname,
-                expected_ap_ifname=retry_expected_ifname,
-            )
-
-        if ap_info_retry:
-            detected_band = _band_from_freq_mhz(ap_info_retry.freq_mhz) or bp
-            affinity_pids = _collect_affinity_pids(
-                adapter_ifname=ap_ifname,
-                ap_interface=ap_info_retry.ifname,
-                engine_pid=res_retry.pid,
-            )
-            try:
-                tuning_state, runtime_warnings = system_tuning.apply_runtime(
-                    tuning_state,
-                    cfg,
-                    ap_ifname=ap_info_retry.ifname,
-                    adapter_ifname=ap_ifname,
-                    cpu_affinity_pids=affinity_pids,
-                )
-            except Exception as e:
-                runtime_warnings = [f"system_tuning_runtime_failed:{e}"]
-            if runtime_warnings:
-                warnings.extend(runtime_warnings)
-            try:
-                net_state, net_warnings = network_tuning.apply(
-                    cfg,
-                    ap_ifname=ap_info_retry.ifname,
-                    enable_internet=enable_internet,
-                    firewalld_cfg=fw_cfg,
-                    firewall_backend=firewall_backend,
-                )
-            except Exception as e:
-                net_state = {}
-                net_warnings = [f"network_tuning_apply_failed:{e}"]
-            if net_warnings:
-                warnings.extend(net_warnings)
-            state = update_state(
-                phase="running",
-                running=True,
-                ap_interface=ap_info_retry.ifname,
-                band=detected_band,
-                channel_width_mhz=ap_info_retry.channel_width_mhz,
-                selected_band=detected_band,
-                selected_width_mhz=ap_info_retry.channel_width_mhz,
-                selected_channel=ap_info_retry.channel,
-                selected_country=country if isinstance(country, str) else None,
-                mode="fallback",
-                fallback_reason="virt_retry_no_virt",
-                warnings=warnings,
-                last_error=None,
-                last_correlation_id=correlation_id,
-                tuning=tuning_state,
-                network_tuning=net_state,
-                engine={"last_error": None, "last_exit_code": None, "ap_logs_tail": []},
-            )
-            if _watchdog_enabled(cfg) and is_running():
-                _ensure_watchdog_started()
-            return LifecycleResult("started_with_fallback", state)
-
-        warnings.append("optimized_virt_retry_failed")
-        try:
-            ap_candidate = _select_ap_from_iw(_iw_dev_dump(), target_phy=target_phy, ssid=ssid)
-        except Exception:
-            ap_candidate = None
-        ap_logs = _collect_ap_logs(ap_ifname, ap_candidate.ifname if ap_candidate else None)
-        if ap_logs:
-            update_state(engine={"ap_logs_tail": ap_logs})
-        _kill_runtime_processes(ap_ifname, firewalld_cfg=fw_cfg, stop_engine_first=True)
-        _remove_conf_dirs(ap_ifname)
+        warnings.append(f"{retry_tag}_failed")
+        _cleanup_attempt()
     fallback_no_virt = optimized_no_virt
     if optimized_no_virt and driver_error:
         fallback_no_virt = False
@@ -4840,25 +5282,28 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
 
     fallback_chain: List[Tuple[str, Optional[int], bool, str]] = []
 
-    if bridge_mode:
-        revert_warnings = _safe_revert_tuning(tuning_state)
-        warnings.extend(revert_warnings)
-        last_error = "ap_ready_timeout_bridge_mode"
-        if start_failure_reason and start_failure_reason != "ap_ready_timeout":
-            last_error = start_failure_reason
+    def _fail_start(last_error: str, fallback_reason: Optional[str]) -> LifecycleResult:
+        warnings.extend(_safe_revert_tuning(tuning_state))
         state = update_state(
             phase="error",
             running=False,
             ap_interface=None,
             last_error=last_error,
             last_correlation_id=correlation_id,
-            fallback_reason=None,
+            fallback_reason=fallback_reason,
             warnings=warnings,
             tuning={},
             network_tuning={},
+            **({"engine": dict(pending_engine)} if pending_engine else {}),
         )
         return LifecycleResult("start_failed", state)
 
+    if bridge_mode:
+        last_error = "ap_ready_timeout_bridge_mode"
+        if start_failure_reason and start_failure_reason != "ap_ready_timeout":
+            last_error = start_failure_reason
+        return _fail_start(last_error, None)
+
     if bp == "6ghz":
         fallback_chain = [
             ("5ghz", None, fallback_no_virt, "fallback_to_5ghz"),
@@ -4869,223 +5314,77 @@ def _start_hotspot_impl(correlation_id: str = "start", overrides: Optional[dict]
             ("2.4ghz", int(cfg.get("fallback_channel_2g", 6)), fallback_no_virt, "fallback_to_2_4ghz"),
         ]
     else:
-        revert_warnings = _safe_revert_tuning(tuning_state)
-        warnings.extend(revert_warnings)
-        last_error = "ap_ready_timeout"
-        if start_failure_reason and start_failure_reason != "ap_ready_timeout":
-            last_error = start_failure_reason
-        state = update_state(
-            phase="error",
-            running=False,
-            ap_interface=None,
-            last_error=last_error,
-            last_correlation_id=correlation_id,
-            fallback_reason=None,
-            warnings=warnings,
-            tuning={},
-            network_tuning={},
-        )
-        return LifecycleResult("start_failed", state)
-
-    fallback_channel_width = str(cfg.get("channel_width", "auto")).lower()
-    fallback_beacon_interval = int(cfg.get("beacon_interval", 50))
-    fallback_dtim_period = int(cfg.get("dtim_period", 1))
-    fallback_short_guard_interval = bool(cfg.get("short_guard_interval", True))
-    fallback_tx_power = cfg.get("tx_power")
-    if fallback_tx_power is not None:
-        try:
-            fallback_tx_power = int(fallback_tx_power)
-        except Exception:
-            fallback_tx_power = None
+        return _fail_start(start_failure_reason or "ap_ready_timeout", None)
 
     for band, channel, no_virt, warning_tag in fallback_chain:
         warnings.append(warning_tag)
 
-        if use_hostapd_nat:
-            strict_width = band == "5ghz" and str(fallback_channel_width) in ("auto", "80", "160")
-            cmd_fallback = build_cmd_nat(
-                ap_ifname=ap_ifname,
-                ssid=ssid,
-                passphrase=passphrase,
-                band=band,
-                ap_security=ap_security,
-                country=country if isinstance(country, str) else None,
-                channel=channel,
-                no_virt=no_virt,
-                debug=debug,
-                wifi6=effective_wifi6,
-                gateway_ip=gateway_ip,
-                dhcp_start_ip=dhcp_start_ip,
-                dhcp_end_ip=dhcp_end_ip,
-                dhcp_dns=dhcp_dns,
-                enable_internet=enable_internet,
-                channel_width=fallback_channel_width,
-                beacon_interval=fallback_beacon_interval,
-                dtim_period=fallback_dtim_period,
-                short_guard_interval=fallback_short_guard_interval,
-                tx_power=fallback_tx_power,
-                strict_width=strict_width,
-            )
-        else:
-            cmd_fallback = build_cmd(
-                ap_ifname=ap_ifname,
-                ssid=ssid,
-                passphrase=passphrase,
-                band_preference=band,
-                country=country if isinstance(country, str) else None,
-                channel=channel,
-                no_virt=no_virt,
-                wifi6=effective_wifi6,
-                gateway_ip=gateway_ip,
-                dhcp_dns=dhcp_dns,
-                enable_internet=enable_internet,
-            )
-
-        res_fallback = start_engine(cmd_fallback, firewalld_cfg=fw_cfg)
-        state = update_state(
-            adapter=ap_ifname,
-            engine={
-                "pid": res_fallback.pid,
-                "cmd": res_fallback.cmd,
-                "started_ts": res_fallback.started_ts,
-                "last_exit_code": res_fallback.exit_code,
-                "last_error": res_fallback.error,
-                "stdout_tail": res_fallback.stdout_tail,
-                "stderr_tail": res_fallback.stderr_tail,
-                "ap_logs_tail": [],
-            },
+        res_fallback, ap_info_fallback = _launch_attempt(
+            _build_attempt_cmd(band, channel, no_virt),
+            no_virt,
         )
-
         if not res_fallback.ok:
             warnings.append(
                 f"fallback_start_failed:{res_fallback.error or 'engine_start_failed_fallback'}"
             )
-            ap_info_fallback = None
-        else:
-            fallback_expected_ifname = None
-            if use_hostapd_nat:
-                fallback_expected_ifname = ap_ifname if no_virt else _virt_ap_ifname(ap_ifname)
-            else:
-                fallback_expected_ifname = _lnxrouter_expected_ifname(ap_ifname, no_virt=no_virt)
-            ap_info_fallback = _wait_for_ap_ready(
-                target_phy,
-                ap_ready_timeout_s,
-                ssid=ssid,
-                adapter_ifname=ap_ifname,
-                expected_ap_ifname=fallback_expected_ifname,
-            )
-
         if ap_info_fallback:
-            detected_band = _band_from_freq_mhz(ap_info_fallback.freq_mhz) or band
-            affinity_pids = _collect_affinity_pids(
-                adapter_ifname=ap_ifname,
-                ap_interface=ap_info_fallback.ifname,
-                engine_pid=res_fallback.pid,
-            )
-            try:
-                tuning_state, runtime_warnings = system_tuning.apply_runtime(
-                    tuning_state,
-                    cfg,
-                    ap_ifname=ap_info_fallback.ifname,
-                    adapter_ifname=ap_ifname,
-                    cpu_affinity_pids=affinity_pids,
-                )
-            except Exception as e:
-                runtime_warnings = [f"system_tuning_runtime_failed:{e}"]
-            if runtime_warnings:
-                warnings.extend(runtime_warnings)
-            try:
-                net_state, net_warnings = network_tuning.apply(
-                    cfg,
-                    ap_ifname=ap_info_fallback.ifname,
-                    enable_internet=enable_internet,
-                    firewalld_cfg=fw_cfg,
-                    firewall_backend=firewall_backend,
-                )
-            except Exception as e:
-                net_state = {}
-                net_warnings = [f"network_tuning_apply_failed:{e}"]
-            if net_warnings:
-                warnings.extend(net_warnings)
-            state = update_state(
-                phase="running",
-                running=True,
-                ap_interface=ap_info_fallback.ifname,
-                band=detected_band,
-                channel_width_mhz=ap_info_fallback.channel_width_mhz,
-                selected_band=detected_band,
-                selected_width_mhz=ap_info_fallback.channel_width_mhz,
-                selected_channel=ap_info_fallback.channel,
-                selected_country=country if isinstance(country, str) else None,
+            return _finish_running(
+                res_fallback,
+                ap_info_fallback,
+                band,
+                warnings,
                 mode="fallback",
                 fallback_reason="ap_ready_timeout",
-                warnings=warnings,
-                last_error=None,
-                last_correlation_id=correlation_id,
-                tuning=tuning_state,
-                network_tuning=net_state,
-                engine={"last_error": None, "last_exit_code": None, "ap_logs_tail": []},
             )
-            if _watchdog_enabled(cfg) and is_running():
-                _ensure_watchdog_started()
-            return LifecycleResult("started_with_fallback", state)
 
-        ap_candidate = None
-        try:
-            ap_candidate = _select_ap_from_iw(_iw_dev_dump(), target_phy=target_phy, ssid=ssid)
-        except Exception:
-            ap_candidate = None
-        ap_logs = _collect_ap_logs(ap_ifname, ap_candidate.ifname if ap_candidate else None)
-        if ap_logs:
-            update_state(engine={"ap_logs_tail": ap_logs})
-        _kill_runtime_processes(ap_ifname, firewalld_cfg=fw_cfg, stop_engine_first=True)
-        _remove_conf_dirs(ap_ifname)
+        _cleanup_attempt()
+        if not res_fallback.ok and _is_terminal_start_error(res_fallback.error):
+            warnings.append("fallback_chain_aborted_terminal")
+            return _fail_start(f"fallback_chain_aborted:{res_fallback.error}", "fallback_chain_aborted")
 
-    revert_warnings = _safe_revert_tuning(tuning_state)
-    warnings.extend(revert_warnings)
-    state = update_state(
-        phase="error",
-        running=False,
-        ap_interface=None,
-        last_error="ap_ready_timeout_after_fallback",
-        last_correlation_id=correlation_id,
-        fallback_reason="ap_ready_timeout",
-        warnings=warnings,
-        tuning={},
-        network_tuning={},
-    )
-    return LifecycleResult("start_failed", state)
+    return _fail_start("ap_ready_timeout_after_fallback", "ap_ready_timeout")
 
 
-def stop_hotspot(correlation_id: str = "stop"):
+def stop_hotspot(correlation_id: str = "stop", *, wait_cleanup: bool = False):
     with _OP_LOCK:
-        return _stop_hotspot_impl(correlation_id=correlation_id)
+        res = _stop_hotspot_impl(correlation_id=correlation_id)
+        if wait_cleanup:
+            # The process is about to exit and would kill the drainer mid-delete.
+            _drain_conf_trash()
+        return res
 
 
 def _stop_hotspot_impl(correlation_id: str = "stop"):
+    _invalidate_iw_dev_dump()
     state = load_state()
-    tuning_warnings = _safe_revert_tuning(state.get("tuning") if isinstance(state, dict) else None)
-    net_warnings = _safe_revert_network_tuning(
-        state.get("network_tuning") if isinstance(state, dict) else None
-    )
-
-    cfg = load_config()
-    fw_cfg = _build_firewalld_cfg(cfg)
     adapter_ifname = state.get("adapter") if isinstance(state, dict) else None
 
-    runtime_present = False
-    try:
-        runtime_present = bool(
-            is_running()
-            or _find_our_lnxrouter_pids()
-            or _find_hostapd_pids(adapter_ifname)
-            or _find_dnsmasq_pids(adapter_ifname)
-        )
-    except Exception:
-        runtime_present = bool(is_running())
+    # Only a "stopped" state can short-circuit, so only then probe for leftovers.
+    if state["phase"] == "stopped":
+        try:
+            # A live engine already answers the question; sweep /proc only without one.
+            runtime_present = is_running()
+            if not runtime_present:
+                procs = _scan_proc_cmdlines()
+                conf_dirs = _candidate_conf_dirs(adapter_ifname)
+                runtime_present = bool(
+                    _find_our_lnxrouter_pids(procs)
+                    or _find_hostapd_pids(adapter_ifname, procs, conf_dirs)
+                    or _find_dnsmasq_pids(adapter_ifname, procs, conf_dirs)
+                )
+        except Exception:
+            runtime_present = bool(is_running())
+        if not runtime_present:
+            return LifecycleResult("already_stopped", state)
+
+    # A clean stop/repair leaves these empty; skip the revert calls then.
+    tuning_prev = state.get("tuning")
+    net_prev = state.get("network_tuning")
+    tuning_warnings = _safe_revert_tuning(tuning_prev) if tuning_prev else []
+    net_warnings = _safe_revert_network_tuning(net_prev) if net_prev else []
 
-    if state["phase"] == "stopped" and not runtime_present:
-        return LifecycleResult("already_stopped", state)
+    cfg = load_config()
+    fw_cfg = _build_firewalld_cfg(cfg)
 
     state = update_state(
         phase="stopping",
@@ -5097,12 +5396,16 @@ def _stop_hotspot_impl(correlation_id: str = "stop"):
     ok, rc, out_tail, err_tail, err = stop_engine(firewalld_cfg=fw_cfg)
 
     # Always run a second-pass teardown in case engine children or orphan helpers remain.
+    # The kill reads pidfiles from the conf dirs, so it has to finish before they go.
     _kill_runtime_processes(adapter_ifname, firewalld_cfg=fw_cfg, stop_engine_first=True)
-    removed_conf_dirs = _remove_conf_dirs(adapter_ifname)
 
-    removed_ifaces: List[str] = []
+    # Conf dir removal and iface deletion are independent; overlap them.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        conf_future = pool.submit(_remove_conf_dirs, adapter_ifname)
+        iface_future = pool.submit(_cleanup_virtual_ap_ifaces, target_phy=None)
+    removed_conf_dirs = conf_future.result()
     try:
-        removed_ifaces = _cleanup_virtual_ap_ifaces(target_phy=None)
+        removed_ifaces: List[str] = iface_future.result()
     except Exception:
         removed_ifaces = []
 
@@ -5115,19 +5418,12 @@ def _stop_hotspot_impl(correlation_id: str = "stop"):
         warnings.append("stop_removed_lnxrouter_conf_dirs:" + ",".join(removed_conf_dirs))
 
     state = update_state(
-        engine={
-            "pid": None,
-            "cmd": None,
-            "started_ts": None,
-            "last_exit_code": rc,
-            "last_error": err,
-            "stdout_tail": out_tail,
-            "stderr_tail": err_tail,
-            "ap_logs_tail": [],
-        }
-    )
-
-    state = update_state(
+        engine=_empty_engine(
+            last_exit_code=rc,
+            last_error=err,
+            stdout_tail=out_tail,
+            stderr_tail=err_tail,
+        ),
         phase="stopped",
         running=False,
         adapter=None,
@@ -5155,20 +5451,22 @@ def collect_capture_logs(
     Returns a list of log lines (most recent lines from various log files).
     """
     lines = []
-    
+
+    def _append_tail(filename: str, filepath: str) -> None:
+        # Reads back from EOF only as far as max_lines; long captures stay cheap.
+        prefix = f"[{filename}] "
+        lines.append(f"=== {filename} ===")
+        lines.extend([prefix + line.rstrip() for line in _read_log_tail(Path(filepath), max_lines)])
+
     # Collect from capture directory
     if capture_dir and os.path.isdir(capture_dir):
         try:
-            for filename in sorted(os.listdir(capture_dir)):
-                if filename.endswith('.log') or filename.endswith('.txt'):
-                    filepath = os.path.join(capture_dir, filename)
-                    try:
-                        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                            file_lines = f.readlines()
-                            lines.append(f"=== {filename} ===")
-                            lines.extend([f"[{filename}] {line.rstrip()}" for line in file_lines[-max_lines:]])
-                    except Exception:
-                        pass
+            with os.scandir(capture_dir) as it:
+                log_files = sorted(
+                    (e.name, e.path) for e in it if e.name.endswith(('.log', '.txt')) and e.is_file()
+                )
+            for filename, filepath in log_files:
+                _append_tail(filename, filepath)
         except Exception:
             pass
     
@@ -5195,15 +5493,11 @@ def collect_capture_logs(
         captured_conf_root = os.path.join(capture_dir, "lnxrouter_tmp")
         if os.path.isdir(captured_conf_root):
             try:
-                conf_dirs = []
-                for d in os.listdir(captured_conf_root):
-                    path = os.path.join(captured_conf_root, d)
-                    if os.path.isdir(path):
-                        conf_dirs.append(path)
-                
+                # is_dir() comes from the dirent type; only directories get a stat.
+                with os.scandir(captured_conf_root) as it:
+                    conf_dirs = [(e.stat().st_mtime, e.path) for e in it if e.is_dir()]
                 if conf_dirs:
-                    conf_dirs.sort(key=lambda p: os.path.getmtime(p))
-                    target_dirs.append(conf_dirs[-1])
+                    target_dirs.append(max(conf_dirs)[1])
             except Exception:
                 pass
 
@@ -5213,13 +5507,7 @@ def collect_capture_logs(
             for filename in ['hostapd.log', 'dnsmasq.log', 'hostapd.conf']:
                 filepath = os.path.join(conf_dir, filename)
                 if os.path.isfile(filepath):
-                    try:
-                        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                            file_lines = f.readlines()
-                            lines.append(f"=== {filename} ===")
-                            lines.extend([f"[{filename}] {line.rstrip()}" for line in file_lines[-max_lines:]])
-                    except Exception:
-                        pass
+                    _append_tail(filename, filepath)
         except Exception:
             pass
     
@@ -7,7 +7,7 @@ import threading
 from vr_hotspotd.server import build_server
 from vr_hotspotd.logging import setup_logging
 from vr_hotspotd.config import ensure_config_file
-from vr_hotspotd.lifecycle import repair, stop_hotspot
+from vr_hotspotd.lifecycle import repair, reset_bin_cache, stop_hotspot
 from vr_hotspotd import vendor_paths
 
 log = logging.getLogger("vr_hotspotd.main")
@@ -27,6 +27,14 @@ def _install_signal_handlers(stop_event: threading.Event) -> None:
     for sig in (signal.SIGTERM, signal.SIGINT):
         signal.signal(sig, _handler)
 
+    def _reload_handler(_signum, _frame):
+        # iw/hostapd_cli/vendor paths are cached for the process lifetime; SIGHUP
+        # re-resolves them after a package upgrade without a restart.
+        reset_bin_cache()
+        log.info("reload_signal:bin_cache_reset")
+
+    signal.signal(signal.SIGHUP, _reload_handler)
+
 
 def _inprocess_autostart_enabled() -> bool:
     raw = os.environ.get("VR_HOTSPOTD_INPROCESS_AUTOSTART")
@@ -119,7 +127,7 @@ def main():
         except Exception:
             log.exception("server_thread_join_failed")
         try:
-            stop_hotspot(correlation_id="shutdown")
+            stop_hotspot(correlation_id="shutdown", wait_cleanup=True)
         except Exception:
             log.exception("stop_on_shutdown_failed")
 
@@ -70,9 +70,13 @@ DEFAULT_STATE: Dict[str, Any] = {
 }
 
 
+# Encoded once; every load decodes a fresh copy from it.
+_DEFAULT_STATE_JSON = json.dumps(DEFAULT_STATE)
+
+
 def _deepcopy_default() -> Dict[str, Any]:
     # JSON roundtrip is fine here; state is small.
-    return json.loads(json.dumps(DEFAULT_STATE))
+    return json.loads(_DEFAULT_STATE_JSON)
 
 
 def load_state() -> Dict[str, Any]:
@@ -129,7 +133,8 @@ def save_state(state: Dict[str, Any]) -> None:
     # Ensure schema_version stays correct
     state.setdefault("schema_version", SCHEMA_VERSION)
 
-    payload = json.dumps(state, indent=2, sort_keys=True)
+    # No indent: keeps json on its C encoder, this runs on every update_state.
+    payload = json.dumps(state, sort_keys=True, separators=(",", ":"))
     _write_atomic(STATE_PATH, STATE_TMP, payload)
 
     # Runtime state is non-secret; 0644 is reasonable.
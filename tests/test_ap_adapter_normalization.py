@@ -24,3 +24,11 @@ def test_normalize_ap_adapter_falls_back_to_recommended_when_stale_ifname():
     }
     with patch("vr_hotspotd.lifecycle.os.path.exists", return_value=False):
         assert lifecycle._normalize_ap_adapter("wlxOLD123456789", inv) == "wlxNEW123456789"
+
+
+def test_adapter_index_matches_get_adapter_first_match():
+    first = {"ifname": "wlan0", "phy": "phy0"}
+    inv = {"adapters": [first, {"ifname": "wlan0", "phy": "phy9"}, {"phy": "phy2"}]}
+    index = lifecycle._adapter_index(inv)
+    assert index == {"wlan0": first}
+    assert index["wlan0"] is lifecycle._get_adapter(inv, "wlan0")
@@ -51,3 +51,199 @@ class TestApReadyFallback(unittest.TestCase):
             self.assertTrue(
                 any(call.kwargs.get("ap_interface") == "x0wlan1" for call in update_state.call_args_list)
             )
+
+    def test_ap_from_dump_skips_iw_info_probe(self):
+        iw_text = """phy#0
+\tInterface x0wlan1
+\t\tssid TestNet
+\t\ttype AP
+\t\tchannel 36 (5180 MHz), width: 80 MHz
+"""
+        with (
+            patch.object(lifecycle, "_iw_dev_dump", return_value=iw_text),
+            patch.object(lifecycle, "_hostapd_ready", return_value=False),
+            patch.object(lifecycle, "get_tails", return_value=([], [])),
+            patch.object(lifecycle, "_iface_is_up", return_value=True),
+            patch.object(lifecycle, "_infer_ap_ifname_from_conf", return_value=None),
+            patch.object(lifecycle, "_iw_dev_info", side_effect=AssertionError("iw info spawned")),
+        ):
+            ap = lifecycle._wait_for_ap_ready(
+                target_phy="phy0",
+                timeout_s=0.1,
+                poll_s=0.01,
+                ssid="TestNet",
+                adapter_ifname="wlan0",
+                expected_ap_ifname="x0wlan1",
+                capture=None,
+            )
+            self.assertIsNotNone(ap)
+            self.assertEqual(ap.ifname, "x0wlan1")
+
+    def test_iw_dump_reused_while_phy_netdevs_unchanged(self):
+        import tempfile
+        from pathlib import Path
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "ieee80211" / "phy0" / "device" / "net" / "wlan0").mkdir(parents=True)
+            (root / "net" / "wlan0").mkdir(parents=True)
+            (root / "net" / "wlan0" / "operstate").write_text("down\n")
+            (root / "net" / "wlan0" / "flags").write_text("0x1002\n")
+            dumps = []
+            with (
+                patch.object(lifecycle, "_SYS_CLASS_IEEE80211", root / "ieee80211"),
+                patch.object(lifecycle, "_SYS_CLASS_NET", root / "net"),
+                patch.object(lifecycle, "_iw_dev_dump", side_effect=lambda: dumps.append(1) or ""),
+                patch.object(lifecycle, "get_tails", return_value=([], [])),
+                patch.object(lifecycle, "is_running", return_value=True),
+                patch.object(lifecycle, "_infer_ap_ifname_from_conf", return_value=None),
+            ):
+                ap = lifecycle._wait_for_ap_ready(
+                    target_phy="phy0",
+                    timeout_s=0.2,
+                    poll_s=0.01,
+                    ssid="TestNet",
+                    adapter_ifname="wlan0",
+                    expected_ap_ifname=None,
+                    capture=None,
+                )
+            self.assertIsNone(ap)
+            self.assertEqual(len(dumps), 1)
+
+    def test_ready_probes_run_once_per_iface_per_poll(self):
+        dump = "phy#0\n\tInterface x0wlan1\n\t\ttype AP\n\t\tchannel 36 (5180 MHz), width: 80 MHz\n"
+        counts = {"hostapd": 0, "up": 0, "is_ap": 0}
+
+        def fake_hostapd_ready(_ifname, *, adapter_ifname, cli_failed_at=None):
+            counts["hostapd"] += 1
+            return False
+
+        def fake_up(_ifname):
+            counts["up"] += 1
+            return counts["is_ap"] >= 3
+
+        def fake_is_ap(_ifname):
+            counts["is_ap"] += 1
+            return True
+
+        with (
+            patch.object(lifecycle, "_iw_dev_dump", return_value=dump),
+            patch.object(lifecycle, "_phy_netdev_signature", return_value=None),
+            patch.object(lifecycle, "_hostapd_ready", side_effect=fake_hostapd_ready),
+            patch.object(lifecycle, "_iface_is_up", side_effect=fake_up),
+            patch.object(lifecycle, "_iw_interface_is_ap", side_effect=fake_is_ap),
+            patch.object(lifecycle, "get_tails", return_value=([], [])),
+            patch.object(lifecycle, "_infer_ap_ifname_from_conf", return_value=None),
+        ):
+            ap = lifecycle._wait_for_ap_ready(
+                target_phy="phy0",
+                timeout_s=2.0,
+                poll_s=0.01,
+                adapter_ifname="wlan0",
+                expected_ap_ifname="x0wlan1",
+            )
+        self.assertEqual(ap.ifname, "x0wlan1")
+        self.assertEqual(counts, {"hostapd": 4, "up": 4, "is_ap": 3})
+
+    def test_link_event_ends_ready_wait_early(self):
+        import socket
+        import time
+
+        ours, kernel = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        ours.setblocking(False)
+        try:
+            lifecycle.clear_output_signal()
+            kernel.send(b"RTM_NEWLINK")
+            t0 = time.monotonic()
+            lifecycle._wait_for_link_or_output(ours, 5.0)
+            self.assertLess(time.monotonic() - t0, 1.0)
+            # Drained: nothing left to wake the next wait.
+            self.assertFalse(lifecycle._drain_link_events(ours))
+        finally:
+            ours.close()
+            kernel.close()
+
+    def test_ready_wait_closes_its_link_socket(self):
+        import socket
+
+        ours, kernel = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        kernel.close()
+        seen = []
+
+        def fake_poll(*args):
+            seen.append(args[-1])
+            return None
+
+        with (
+            patch.object(lifecycle, "_open_link_monitor", return_value=ours),
+            patch.object(lifecycle, "_poll_ap_ready", side_effect=fake_poll),
+        ):
+            self.assertIsNone(lifecycle._wait_for_ap_ready("phy0", timeout_s=0.1))
+        self.assertEqual(seen, [ours])
+        self.assertEqual(ours.fileno(), -1)
+
+    def test_hostapd_ping_uses_ctrl_socket_without_cli(self):
+        import socket
+        import tempfile
+        import threading
+        import time
+        from pathlib import Path
+
+        with tempfile.TemporaryDirectory() as tmp:
+            ctrl = Path(tmp)
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            server.bind(str(ctrl / "x0wlan1"))
+            server.settimeout(2.0)
+
+            def _serve():
+                data, addr = server.recvfrom(64)
+                if data == b"PING":
+                    server.sendto(b"PONG\n", addr)
+
+            t = threading.Thread(target=_serve)
+            t.start()
+            try:
+                # A CLI failure recorded before the socket appeared must not hold back the PING.
+                failed_at = {(str(ctrl), "x0wlan1"): time.monotonic()}
+                with patch.object(lifecycle, "_hostapd_cli_path", side_effect=AssertionError("cli used")):
+                    self.assertTrue(lifecycle._hostapd_cli_ping(ctrl, "x0wlan1", failed_at))
+            finally:
+                t.join()
+                server.close()
+
+    def test_failed_hostapd_ping_is_debounced(self):
+        from pathlib import Path
+
+        calls = []
+
+        class _Failed:
+            returncode = 1
+            stdout = ""
+
+        def fake_run(cmd, **_kwargs):
+            calls.append(cmd)
+            return _Failed()
+
+        with (
+            patch.object(lifecycle, "_hostapd_cli_path", return_value="/usr/sbin/hostapd_cli"),
+            patch.object(lifecycle.subprocess, "run", side_effect=fake_run),
+        ):
+            ctrl = Path("/run/hostapd")
+            failed_at = {}
+            self.assertFalse(lifecycle._hostapd_cli_ping(ctrl, "x0wlan1", failed_at))
+            self.assertFalse(lifecycle._hostapd_cli_ping(ctrl, "x0wlan1", failed_at))
+            self.assertEqual(len(calls), 1)
+            failed_at[(str(ctrl), "x0wlan1")] -= lifecycle._HOSTAPD_PING_RETRY_S
+            self.assertFalse(lifecycle._hostapd_cli_ping(ctrl, "x0wlan1", failed_at))
+            self.assertEqual(len(calls), 2)
+            # Without a per-wait record (e.g. the watchdog) nothing is debounced or kept.
+            self.assertFalse(lifecycle._hostapd_cli_ping(ctrl, "x0wlan1"))
+            self.assertEqual(len(calls), 3)
+            self.assertFalse(hasattr(lifecycle, "_HOSTAPD_PING_FAILED_AT"))
+
+
+def test_stdout_ap_enabled_requires_exact_iface_on_one_line():
+    lines = ["wlan0", ": AP-ENABLED", "x0wlan0: AP-ENABLED"]
+    assert lifecycle._stdout_has_ap_enabled(lines, "x0wlan0")
+    assert not lifecycle._stdout_has_ap_enabled(lines[:2], "wlan0")
+    assert not lifecycle._stdout_has_ap_enabled(lines, "")
@@ -54,3 +54,85 @@ def test_collect_capture_logs_uses_newest(tmp_path: Path) -> None:
 
     assert any("[hostapd.log] new" in line for line in logs)
     assert not any("[hostapd.log] old" in line for line in logs)
+
+
+def test_collect_capture_logs_scans_each_dir_once(tmp_path: Path, monkeypatch) -> None:
+    capture_dir = tmp_path / "capture"
+    conf_root = capture_dir / "lnxrouter_tmp"
+    _write(capture_dir / "b.txt", "bee\n")
+    _write(capture_dir / "a.log", "ay\n")
+    _write(capture_dir / "skip.json", "{}\n")
+    _write(conf_root / "stray.file", "x\n")
+    _write(conf_root / "lnxrouter.wlan0.conf.only" / "hostapd.log", "only\n")
+
+    def _forbidden(*_args, **_kwargs):
+        raise AssertionError("per-entry listdir/getmtime should not be used")
+
+    monkeypatch.setattr(os, "listdir", _forbidden)
+    monkeypatch.setattr(os.path, "getmtime", _forbidden)
+
+    logs = collect_capture_logs(capture_dir=str(capture_dir), lnxrouter_config_dir=None, max_lines=20)
+
+    headers = [line for line in logs if line.startswith("===")]
+    assert headers == ["=== a.log ===", "=== b.txt ===", "=== hostapd.log ==="]
+    assert "[hostapd.log] only" in logs
+
+
+def test_collect_capture_logs_tails_files_from_the_end(tmp_path: Path, monkeypatch) -> None:
+    import vr_hotspotd.lifecycle as lifecycle
+
+    capture_dir = tmp_path / "capture"
+    _write(capture_dir / "hostapd.log", "".join(f"line-{i}  \n" for i in range(5000)))
+    tails = []
+    real_tail = lifecycle._read_log_tail
+
+    def _recording_tail(path, max_lines=200):
+        tails.append((path.name, max_lines))
+        return real_tail(path, max_lines)
+
+    monkeypatch.setattr(lifecycle, "_read_log_tail", _recording_tail)
+
+    logs = collect_capture_logs(capture_dir=str(capture_dir), lnxrouter_config_dir=None, max_lines=3)
+
+    assert tails == [("hostapd.log", 3)]
+    assert logs == [
+        "=== hostapd.log ===",
+        "[hostapd.log] line-4997",
+        "[hostapd.log] line-4998",
+        "[hostapd.log] line-4999",
+    ]
+
+
+def test_read_log_tail_reads_only_the_end(tmp_path: Path, monkeypatch) -> None:
+    import vr_hotspotd.lifecycle as lifecycle
+
+    text = "".join(f"line-{i} é\r\n" for i in range(5000))
+    log_path = tmp_path / "hostapd.log"
+    log_path.write_text(text, encoding="utf-8")
+    monkeypatch.setattr(lifecycle, "_LOG_TAIL_CHUNK", 1000)
+
+    assert lifecycle._read_log_tail(log_path, max_lines=200) == text.splitlines()[-200:]
+    assert lifecycle._read_log_tail(log_path, max_lines=10000) == text.splitlines()
+
+
+def test_collect_ap_logs_matches_combined_tail(tmp_path: Path, monkeypatch) -> None:
+    import vr_hotspotd.lifecycle as lifecycle
+
+    conf_dir = tmp_path / "lnxrouter.wlan0.conf.A"
+    _write(conf_dir / "hostapd.log", "".join(f"h{i}\n" for i in range(300)))
+    _write(conf_dir / "dnsmasq.log", "".join(f"d{i}\n" for i in range(50)))
+    monkeypatch.setattr(lifecycle, "_find_latest_conf_dir", lambda *_a: conf_dir)
+
+    reads = []
+    real_tail = lifecycle._read_log_tail
+    monkeypatch.setattr(
+        lifecycle,
+        "_read_log_tail",
+        lambda path, max_lines=200: reads.append((path.name, max_lines)) or real_tail(path, max_lines),
+    )
+
+    logs = lifecycle._collect_ap_logs("wlan0", None)
+
+    expected = [f"[hostapd] h{i}" for i in range(300)] + [f"[dnsmasq] d{i}" for i in range(50)]
+    assert logs == expected[-200:]
+    assert reads == [("dnsmasq.log", 200), ("hostapd.log", 150)]
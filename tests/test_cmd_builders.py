@@ -176,3 +176,24 @@ def test_lnxrouter_cmd_does_not_set_virt_name_when_no_virt_enabled():
         no_virt=True,
     )
     assert "--virt-name" not in cmd
+
+
+def test_precreated_ap_ifname_hashes_long_parents_within_ifnamsiz():
+    assert _precreated_ap_ifname("wlan0") == "vrhs_ap_wlan0"
+    name = _precreated_ap_ifname("wlx7419f816af4c")
+    assert len(name) == 15
+    assert name.startswith("vrhs_ap_wl")
+    assert name == _precreated_ap_ifname("wlx7419f816af4c")
+    assert name != _precreated_ap_ifname("wlx7419f816af4d")
+
+
+def test_ap_ifname_helpers_are_memoized():
+    from vr_hotspotd.lifecycle import _virt_ap_ifname
+
+    _precreated_ap_ifname.cache_clear()
+    _virt_ap_ifname.cache_clear()
+    for _ in range(3):
+        assert _precreated_ap_ifname("wlx7419f816af4c") == _precreated_ap_ifname("wlx7419f816af4c")
+        assert _virt_ap_ifname("wlx7419f816af4c") == "x0wlx7419f816af"
+    assert _precreated_ap_ifname.cache_info().misses == 1
+    assert _virt_ap_ifname.cache_info().misses == 1
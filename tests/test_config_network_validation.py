@@ -215,6 +215,29 @@ def test_write_config_file_rejects_invalid_candidate_without_changing_disk(
     assert config_path.read_bytes() == before
 
 
+def test_read_config_file_reuses_parse_until_file_is_replaced(monkeypatch, tmp_path):
+    config_path = tmp_path / "config.json"
+    monkeypatch.setattr(config, "CONFIG_PATH", config_path)
+    monkeypatch.setattr(config, "CONFIG_TMP", tmp_path / "config.json.tmp")
+    monkeypatch.setattr(config, "_READ_CACHE", {"entry": None})
+    config.write_config_file({"ssid": "first"})
+
+    parses = []
+    real_loads = config.json.loads
+    monkeypatch.setattr(config.json, "loads", lambda text: parses.append(1) or real_loads(text))
+
+    first = config.read_config_file()
+    first["ssid"] = "mutated"
+    assert config.read_config_file()["ssid"] == "first"
+    assert len(parses) == 1
+
+    config.write_config_file({"ssid": "second"})
+    assert config.read_config_file()["ssid"] == "second"
+    assert len(parses) == 2
+    key, data = config._READ_CACHE["entry"]
+    assert key[0] == str(config_path) and data["ssid"] == "second"
+
+
 def test_load_config_does_not_write_invalid_migration(monkeypatch, tmp_path):
     config_path = tmp_path / "config.json"
     config_tmp = tmp_path / "config.json.tmp"
@@ -25,7 +25,16 @@ def _state_helpers():
     return state, load_state, update_state
 
 
-def _stubbed_env(monkeypatch, cfg, ap_ready_returns, fallback_candidates=None):
+_CFG_6GHZ = {
+    "ssid": "Test",
+    "wpa2_passphrase": "password123",
+    "band_preference": "6ghz",
+    "ap_security": "wpa3_sae",
+    "ap_ready_timeout_s": 0.1,
+}
+
+
+def _stubbed_env(monkeypatch, cfg, ap_ready_returns, fallback_candidates=None, ap_logs=None):
     state, load_state, update_state = _state_helpers()
 
     monkeypatch.setattr(lifecycle, "load_state", load_state)
@@ -122,6 +131,12 @@ def _stubbed_env(monkeypatch, cfg, ap_ready_returns, fallback_candidates=None):
     monkeypatch.setattr(lifecycle, "start_engine", start_engine)
     monkeypatch.setattr(lifecycle, "stop_engine", lambda **_kwargs: (True, 0, [], [], None))
     monkeypatch.setattr(lifecycle, "build_cmd", lambda **_kwargs: ["cmd", "5ghz"])
+    monkeypatch.setattr(lifecycle, "build_cmd_6ghz", lambda **_kwargs: ["cmd", "6ghz"])
+    # Per-attempt cleanup: no real processes, conf dirs or iw dumps to touch.
+    monkeypatch.setattr(lifecycle, "_kill_runtime_processes", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(lifecycle, "_remove_conf_dirs", lambda *_args, **_kwargs: [])
+    monkeypatch.setattr(lifecycle, "_collect_ap_logs", lambda *_args, **_kwargs: list(ap_logs or []))
+    monkeypatch.setattr(lifecycle, "_recent_iw_dev_dump", lambda *_args, **_kwargs: "")
 
     ap_iter = iter(ap_ready_returns)
     monkeypatch.setattr(lifecycle, "_wait_for_ap_ready", lambda *_args, **_kwargs: next(ap_iter))
@@ -149,6 +164,23 @@ def test_fail_closed_no_fallback_for_5ghz(monkeypatch, mock_missing_system_comma
     assert state["attempts"][0]["failure_reason"] == "ap_start_timed_out"
 
 
+def test_6ghz_exhausted_fallback_reverts_tuning_and_fails(monkeypatch, mock_missing_system_commands):
+    cfg = dict(_CFG_6GHZ)
+    state, calls = _stubbed_env(monkeypatch, cfg, [None, None, None])
+    state["tuning"] = {"stale": True}
+    monkeypatch.setattr(lifecycle, "_safe_revert_tuning", lambda _t: ["reverted"])
+
+    res = lifecycle._start_hotspot_impl(correlation_id="t-exhausted")
+
+    assert res.code == "start_failed"
+    assert len(calls) == 3
+    assert state["phase"] == "error"
+    assert state["last_error"] == "ap_ready_timeout_after_fallback"
+    assert state["fallback_reason"] == "ap_ready_timeout"
+    assert state["tuning"] == {}
+    assert state["warnings"][-1] == "reverted"
+
+
 def test_pro_mode_allows_40mhz_fallback(monkeypatch, mock_missing_system_commands):
     cfg = {
         "ssid": "Test",
@@ -188,3 +220,194 @@ def test_pro_mode_allows_40mhz_fallback(monkeypatch, mock_missing_system_command
     assert state["mode"] == "fallback"
     assert state["fallback_reason"] == "pro_mode_40mhz"
     assert state["channel_width_mhz"] == 40
+
+
+def test_6ghz_timeout_falls_back_to_5ghz(monkeypatch, mock_missing_system_commands):
+    cfg = dict(_CFG_6GHZ)
+    ap_ready = [
+        None,
+        lifecycle.APReadyInfo(
+            ifname="ap0",
+            phy="phy0",
+            ssid="Test",
+            freq_mhz=5180,
+            channel=36,
+            channel_width_mhz=80,
+        ),
+    ]
+    state, calls = _stubbed_env(monkeypatch, cfg, ap_ready)
+
+    res = lifecycle._start_hotspot_impl(correlation_id="t3")
+
+    assert res.code == "started_with_fallback"
+    assert calls == [["cmd", "6ghz"], ["cmd", "5ghz"]]
+    assert state["mode"] == "fallback"
+    assert state["fallback_reason"] == "ap_ready_timeout"
+    assert state["band"] == "5ghz"
+    assert "optimized_ap_start_timed_out" in state["warnings"]
+    assert "fallback_to_5ghz" in state["warnings"]
+
+
+def test_timeout_tails_and_ap_logs_share_one_state_write(monkeypatch, mock_missing_system_commands):
+    cfg = dict(_CFG_6GHZ)
+    ap_ready = [
+        None,
+        lifecycle.APReadyInfo(
+            ifname="ap0",
+            phy="phy0",
+            ssid="Test",
+            freq_mhz=5180,
+            channel=36,
+            channel_width_mhz=80,
+        ),
+    ]
+    state, _calls = _stubbed_env(monkeypatch, cfg, ap_ready, ap_logs=["hostapd: x"])
+    engine_writes = []
+    inner_update = lifecycle.update_state
+
+    def _recording_update(**kwargs):
+        if set(kwargs) == {"engine"}:
+            engine_writes.append(sorted(kwargs["engine"]))
+        return inner_update(**kwargs)
+
+    monkeypatch.setattr(lifecycle, "update_state", _recording_update)
+    monkeypatch.setattr(lifecycle, "get_tails", lambda: (["out"], ["err"]))
+
+    res = lifecycle._start_hotspot_impl(correlation_id="t-coalesce")
+
+    assert res.code == "started_with_fallback"
+    # The fallback launch overwrites those fields, so no standalone engine write is made.
+    assert engine_writes == []
+
+
+def test_failed_start_folds_attempt_tails_into_error_write(monkeypatch, mock_missing_system_commands):
+    cfg = {
+        "ssid": "Test",
+        "wpa2_passphrase": "password123",
+        "band_preference": "2.4ghz",
+        "ap_ready_timeout_s": 0.1,
+    }
+    state, _calls = _stubbed_env(monkeypatch, cfg, [None], ap_logs=["hostapd: x"])
+    writes = []
+    inner_update = lifecycle.update_state
+
+    def _recording_update(**kwargs):
+        writes.append(kwargs)
+        return inner_update(**kwargs)
+
+    monkeypatch.setattr(lifecycle, "update_state", _recording_update)
+    monkeypatch.setattr(lifecycle, "get_tails", lambda: (["out"], ["err"]))
+
+    res = lifecycle._start_hotspot_impl(correlation_id="t-fail-coalesce")
+
+    assert res.code == "start_failed"
+    assert not [w for w in writes if set(w) == {"engine"}]
+    final = writes[-1]
+    assert final["phase"] == "error"
+    assert final["engine"]["ap_logs_tail"] == ["hostapd: x"]
+    assert res.state["engine"]["stdout_tail"] == ["out"]
+
+
+def test_runtime_tuning_runs_both_steps_and_keeps_warning_order(monkeypatch):
+    def apply_runtime(state, _cfg, **_kwargs):
+        raise RuntimeError("boom")
+
+    def net_apply(_cfg, **_kwargs):
+        return {"qos": {"dscp": 46}}, ["qos_warn"]
+
+    affinity_calls = []
+    monkeypatch.setattr(
+        lifecycle, "_collect_affinity_pids", lambda **kwargs: affinity_calls.append(kwargs) or [123]
+    )
+    monkeypatch.setattr(lifecycle.system_tuning, "apply_runtime", apply_runtime)
+    monkeypatch.setattr(lifecycle.network_tuning, "apply", net_apply)
+
+    tuning, net_state, warnings = lifecycle._apply_runtime_tuning(
+        {"pre": True},
+        {},
+        ap_ifname="ap0",
+        adapter_ifname="wlan0",
+        engine_pid=123,
+        enable_internet=True,
+        fw_cfg={},
+        firewall_backend="nftables",
+    )
+
+    assert tuning == {"pre": True}
+    assert net_state == {"qos": {"dscp": 46}}
+    assert warnings == ["system_tuning_runtime_failed:boom", "qos_warn"]
+    assert affinity_calls == [{"adapter_ifname": "wlan0", "ap_interface": "ap0", "engine_pid": 123}]
+
+
+def test_hostapd_driver_error_matches_any_pattern_case_insensitively():
+    assert lifecycle._stdout_has_hostapd_driver_error(["ok", "nl80211: Could not configure driver mode"])
+    assert lifecycle._stdout_has_hostapd_driver_error([None, "Interface initialization FAILED"])
+    assert not lifecycle._stdout_has_hostapd_driver_error(["could not set", "channel for kernel driver"])
+    assert not lifecycle._stdout_has_hostapd_driver_error([])
+
+
+def test_start_overrides_only_apply_allowed_keys():
+    cfg = {"ssid": "old", "firewalld_zone": "trusted"}
+    out = lifecycle._apply_start_overrides(cfg, {"ssid": "new", "firewalld_zone": "public", "channel_5g": 149})
+    assert out is cfg
+    assert cfg == {"ssid": "new", "firewalld_zone": "trusted", "channel_5g": 149}
+    assert lifecycle._apply_start_overrides(cfg, None) is cfg
+
+
+def test_driver_error_retry_reuses_primary_build_kwargs(monkeypatch, mock_missing_system_commands):
+    cfg = {
+        "ssid": "Test",
+        "wpa2_passphrase": "password123",
+        "band_preference": "2.4ghz",
+        "ap_ready_timeout_s": 0.1,
+    }
+    _stubbed_env(monkeypatch, cfg, [None, None])
+    builds = []
+
+    def build_cmd(**kwargs):
+        builds.append(kwargs)
+        return ["cmd", kwargs["band_preference"]]
+
+    monkeypatch.setattr(lifecycle, "build_cmd", build_cmd)
+    monkeypatch.setattr(lifecycle, "get_tails", lambda: (["nl80211: Could not configure driver mode"], []))
+
+    res = lifecycle._start_hotspot_impl(correlation_id="t-build-kwargs")
+
+    assert res.code == "start_failed"
+    assert len(builds) == 2
+    primary, retry = builds
+    assert primary.pop("no_virt") != retry.pop("no_virt")
+    assert primary == retry
+
+
+def test_fallback_chain_stops_on_terminal_start_error(monkeypatch, mock_missing_system_commands):
+    cfg = dict(_CFG_6GHZ)
+    state, _calls = _stubbed_env(monkeypatch, cfg, [None])
+    calls = []
+
+    def start_engine(cmd, firewalld_cfg=None, early_fail_window_s=1.0):
+        calls.append(cmd)
+        failed = len(calls) > 1
+        return SimpleNamespace(
+            ok=not failed,
+            pid=None if failed else 123,
+            exit_code=None,
+            stdout_tail=[],
+            stderr_tail=[],
+            error="spawn_failed: [Errno 13] Permission denied" if failed else None,
+            cmd=cmd,
+            started_ts=123456,
+        )
+
+    monkeypatch.setattr(lifecycle, "start_engine", start_engine)
+
+    res = lifecycle._start_hotspot_impl(correlation_id="t-terminal")
+
+    assert res.code == "start_failed"
+    assert len(calls) == 2
+    assert "fallback_to_2_4ghz" not in state["warnings"]
+    assert "fallback_chain_aborted_terminal" in state["warnings"]
+    assert state["last_error"] == "fallback_chain_aborted:spawn_failed: [Errno 13] Permission denied"
+    assert state["fallback_reason"] == "fallback_chain_aborted"
+    assert not lifecycle._is_terminal_start_error("engine_exited_early: rc=1")
+    assert not lifecycle._is_terminal_start_error(None)
@@ -0,0 +1,59 @@
+import os
+
+import vr_hotspotd.lifecycle as lifecycle
+
+
+def test_validate_hostapd_country_scans_keys_once(tmp_path):
+    conf = tmp_path / "hostapd.conf"
+    conf.write_text(
+        "# country_code=XX\n"
+        "interface=wlan0\n"
+        "  ieee80211d=1\n"
+        "country_code=00\n"
+        "country_code=US\n",
+        encoding="utf-8",
+    )
+    assert lifecycle.validate_hostapd_country(str(conf)) is None
+
+    conf.write_text("ieee80211d=1\n#country_code=US\n", encoding="utf-8")
+    assert lifecycle.validate_hostapd_country(str(conf)) == "hostapd_invalid_country_code_for_80211d"
+
+    conf.write_text("ieee80211d=0\n", encoding="utf-8")
+    assert lifecycle.validate_hostapd_country(str(conf)) is None
+
+
+def test_ensure_ctrl_interface_dir_handles_dir_format(tmp_path):
+    ctrl = tmp_path / "ctrl"
+    conf = tmp_path / "hostapd.conf"
+    conf.write_text(f"#ctrl_interface=/nope\nctrl_interface=DIR={ctrl}\n", encoding="utf-8")
+
+    lifecycle.ensure_hostapd_ctrl_interface_dir(str(conf))
+
+    assert ctrl.is_dir()
+
+
+def test_enforce_hostapd_country_rewrites_first_key_once(tmp_path):
+    conf = tmp_path / "hostapd.conf"
+    conf.write_text("#country_code=DE\ninterface=wlan0\n  country_code=00\nieee80211d=1", encoding="utf-8")
+
+    assert lifecycle.enforce_hostapd_country(str(conf), "US") is True
+    assert conf.read_text(encoding="utf-8") == "#country_code=DE\ninterface=wlan0\ncountry_code=US\nieee80211d=1"
+    assert lifecycle.validate_hostapd_country(str(conf)) is None
+    assert lifecycle.enforce_hostapd_country(str(conf), "US") is False
+
+    conf.write_text("interface=wlan0", encoding="utf-8")
+    assert lifecycle.enforce_hostapd_country(str(conf), "US") is True
+    assert conf.read_text(encoding="utf-8") == "interface=wlan0\ncountry_code=US\n"
+
+
+def test_enforce_hostapd_country_refreshes_cached_text(tmp_path):
+    conf = tmp_path / "hostapd.conf"
+    conf.write_text("interface=wlan0\ncountry_code=DE\n", encoding="utf-8")
+    before = os.stat(conf)
+
+    assert lifecycle._read_hostapd_conf(str(conf)).endswith("country_code=DE\n")
+    assert lifecycle.enforce_hostapd_country(str(conf), "US") is True
+    # Same size and, on a coarse clock, the same mtime as the text that was cached.
+    os.utime(conf, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    assert lifecycle._read_hostapd_conf(str(conf)).endswith("country_code=US\n")
@@ -84,6 +84,12 @@ def test_band_from_freq_mhz():
     assert lifecycle._band_from_freq_mhz(5180) == "5ghz"
     assert lifecycle._band_from_freq_mhz(5925) == "6ghz"
     assert lifecycle._band_from_freq_mhz(None) is None
+    assert lifecycle._band_from_freq_mhz(5910) is None
+    assert lifecycle._band_from_freq_mhz(7125) == "6ghz"
+
+    hits = lifecycle._band_from_freq_mhz.cache_info().hits
+    assert lifecycle._band_from_freq_mhz(5180) == "5ghz"
+    assert lifecycle._band_from_freq_mhz.cache_info().hits == hits + 1
 
 
 def test_select_ap_from_iw_prefers_phy_and_ssid():
@@ -156,7 +162,7 @@ phy#0
     def fake_iw_dev_dump():
         return iw_text
 
-    def fake_hostapd_ready(ap_interface, *, adapter_ifname):
+    def fake_hostapd_ready(ap_interface, *, adapter_ifname, cli_failed_at=None):
         calls["hostapd"].append((ap_interface, adapter_ifname))
         return ap_interface == "vrhs_ap_wlan0"
 
@@ -196,7 +202,7 @@ def test_wait_for_ap_ready_with_expected_ifname_and_log():
     def fake_iw_dev_dump():
         return ""
 
-    def fake_hostapd_ready(ap_interface, *, adapter_ifname):
+    def fake_hostapd_ready(ap_interface, *, adapter_ifname, cli_failed_at=None):
         calls["hostapd"].append((ap_interface, adapter_ifname))
         return ap_interface == "wlan0"
 
@@ -265,7 +271,7 @@ phy#0
         channel 36 (5180 MHz), width: 80 MHz
 """
 
-    def fake_hostapd_ready(ap_interface, *, adapter_ifname):
+    def fake_hostapd_ready(ap_interface, *, adapter_ifname, cli_failed_at=None):
         calls["hostapd"].append((ap_interface, adapter_ifname))
         return ap_interface == "wlan0"
     
@@ -434,3 +440,154 @@ def test_lnxrouter_expected_ifname_short_iface_virtual_mode_unknown():
 def test_lnxrouter_expected_ifname_no_virt_uses_adapter():
     expected = lifecycle._lnxrouter_expected_ifname("wlx7419f816af4c", no_virt=True)
     assert expected == "wlx7419f816af4c"
+
+
+def test_recent_iw_dev_dump_reuses_last_dump_until_invalidated(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, timeout_s=lifecycle._CMD_TIMEOUT_S):
+        calls.append(cmd)
+        return f"dump{len(calls)}"
+
+    monkeypatch.setattr(lifecycle, "_run", fake_run)
+    monkeypatch.setattr(lifecycle, "_iw_bin", lambda: "/usr/sbin/iw")
+    lifecycle._invalidate_iw_dev_dump()
+    try:
+        assert lifecycle._iw_dev_dump() == "dump1"
+        assert lifecycle._recent_iw_dev_dump() == "dump1"
+        assert len(calls) == 1
+
+        lifecycle._invalidate_iw_dev_dump()
+        assert lifecycle._recent_iw_dev_dump() == "dump2"
+        assert len(calls) == 2
+
+        # Age is measured on the monotonic clock, so a wall-clock step changes nothing.
+        monkeypatch.setattr(lifecycle.time, "time", lambda: 0.0)
+        assert lifecycle._recent_iw_dev_dump() == "dump2"
+        assert len(calls) == 2
+    finally:
+        lifecycle._invalidate_iw_dev_dump()
+
+
+def test_iface_phy_reads_sysfs_without_iw(monkeypatch, tmp_path):
+    phy_dir = tmp_path / "x0wlan1" / "phy80211"
+    phy_dir.mkdir(parents=True)
+    (phy_dir / "name").write_text("phy2\n")
+    monkeypatch.setattr(lifecycle, "_SYS_CLASS_NET", tmp_path)
+
+    def forbidden(*_args, **_kwargs):
+        raise AssertionError("iw must not be spawned")
+
+    monkeypatch.setattr(lifecycle.subprocess, "run", forbidden)
+
+    assert lifecycle._iface_phy("x0wlan1") == "phy2"
+
+
+def test_iw_bin_lookup_is_cached(monkeypatch):
+    calls: List[str] = []
+
+    def fake_which(name):
+        calls.append(name)
+        return "/usr/bin/iw"
+
+    lifecycle.reset_bin_cache()
+    monkeypatch.setattr(lifecycle.shutil, "which", fake_which)
+    try:
+        assert lifecycle._iw_bin() == "/usr/bin/iw"
+        assert lifecycle._iw_bin() == "/usr/bin/iw"
+        assert calls == ["iw"]
+    finally:
+        lifecycle.reset_bin_cache()
+
+
+def test_parse_iw_dev_ap_info_memoizes_identical_dumps():
+    iw_text = """phy#0
+\tInterface x0wlan1
+\t\tssid TestNet
+\t\ttype AP
+\t\tchannel 36 (5180 MHz), width: 80 MHz
+"""
+    lifecycle._parse_iw_dev_ap_entries.cache_clear()
+    first = lifecycle._select_ap_from_iw(iw_text, target_phy="phy0", ssid="TestNet")
+    second = lifecycle._select_ap_by_ifname(iw_text, "x0wlan1")
+    assert first == second
+    assert lifecycle._parse_iw_dev_ap_entries.cache_info().misses == 1
+
+
+def test_maybe_set_regdom_skips_repeat_country(monkeypatch):
+    calls: List[List[str]] = []
+
+    class _Done:
+        returncode = 0
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(list(cmd))
+        return _Done()
+
+    monkeypatch.setattr(lifecycle, "_iw_bin", lambda: "/usr/sbin/iw")
+    monkeypatch.setattr(lifecycle.subprocess, "run", fake_run)
+    monkeypatch.setitem(lifecycle._REGDOM_APPLIED, "cc", None)
+
+    lifecycle._maybe_set_regdom("us")
+    lifecycle._maybe_set_regdom("US")
+    lifecycle._maybe_set_regdom("DE")
+
+    assert calls == [
+        ["/usr/sbin/iw", "reg", "set", "US"],
+        ["/usr/sbin/iw", "reg", "set", "DE"],
+    ]
+
+
+def test_select_ap_from_iw_bucket_priority():
+    iw_text = """phy#0
+\tInterface b_ap
+\t\tssid Other
+\t\ttype AP
+\t\tchannel 1 (2412 MHz), width: 20 MHz
+\tInterface a_ap
+\t\tssid TestNet
+\t\ttype AP
+\t\tchannel 36 (5180 MHz), width: 80 MHz
+phy#1
+\tInterface c_ap
+\t\tssid TestNet
+\t\ttype AP
+\t\tchannel 149 (5745 MHz), width: 80 MHz
+"""
+    pick = lifecycle._select_ap_from_iw
+    assert pick(iw_text, target_phy="phy1", ssid="TestNet").ifname == "c_ap"
+    assert pick(iw_text, target_phy="phy0", ssid="TestNet").ifname == "a_ap"
+    assert pick(iw_text, target_phy="phy0", ssid="Missing").ifname == "a_ap"
+    assert pick(iw_text, target_phy=None, ssid="TestNet").ifname == "a_ap"
+    assert pick(iw_text, target_phy=None, ssid=None).ifname == "a_ap"
+    assert pick(iw_text, target_phy="phy9", ssid=None) is None
+
+
+def test_parse_iw_dev_ap_info_skips_unrelated_rows():
+    dump = (
+        "phy#1\r\n"
+        "\tInterface x0wlan1\r\n"
+        "\t\tifindex 7\r\n"
+        "\t\twdev 0x100000002\r\n"
+        "\t\taddr 02:00:00:00:00:01\r\n"
+        "\t\tssid  VR Hotspot \r\n"
+        "\t\ttype AP\r\n"
+        "\t\tchannel 149 (5745 MHz), width: 80 MHz, center1: 5775 MHz\r\n"
+        "\t\ttxpower 20.00 dBm\r\n"
+        "\t\tmulticast TXQ:\r\n"
+        "\t\t\tqsz-byt\tqsz-pkt\tflows\tdrops\r\n"
+        "\t\t\t0\t0\t12\t0\r\n"
+        "\tInterface wlan1\r\n"
+        "\t\ttype managed\r\n"
+    )
+    aps = lifecycle._parse_iw_dev_ap_info(dump)
+    assert aps == [
+        lifecycle.APReadyInfo(
+            ifname="x0wlan1",
+            phy="phy1",
+            ssid="VR Hotspot",
+            freq_mhz=5745,
+            channel=149,
+            channel_width_mhz=80,
+        )
+    ]
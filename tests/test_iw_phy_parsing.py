@@ -44,3 +44,18 @@ def test_parse_ap_managed_concurrency() -> None:
 
     iw_text_missing = "Wiphy phy0"
     assert lifecycle._parse_ap_managed_concurrency(iw_text_missing) is None
+
+
+def test_parse_ap_managed_concurrency_keeps_combinations_separate() -> None:
+    split_across = """
+    valid interface combinations:
+     * #{ managed } <= 1, #channels <= 1
+     * #{ AP } <= 1,
+       total <= 2, #channels <= 1
+    """
+    assert lifecycle._parse_ap_managed_concurrency(split_across) is False
+
+    second_matches = split_across + """     * #{ managed } <= 1, #{ AP } <= 1,\r
+       total <= 2\r
+    """
+    assert lifecycle._parse_ap_managed_concurrency(second_matches) is True
@@ -0,0 +1,20 @@
+import signal
+import threading
+
+from vr_hotspotd import main
+
+
+def test_sighup_resets_bin_cache_without_stopping(monkeypatch):
+    installed = {}
+    resets = []
+    monkeypatch.setattr(main.signal, "signal", lambda sig, handler: installed.__setitem__(sig, handler))
+    monkeypatch.setattr(main, "reset_bin_cache", lambda: resets.append(1))
+    stop_event = threading.Event()
+
+    main._install_signal_handlers(stop_event)
+    installed[signal.SIGHUP](signal.SIGHUP, None)
+
+    assert resets == [1]
+    assert not stop_event.is_set()
+    installed[signal.SIGTERM](signal.SIGTERM, None)
+    assert stop_event.is_set()
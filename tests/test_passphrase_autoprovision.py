@@ -135,3 +135,23 @@ def test_start_does_not_autoprovision_when_short_override_provided(
     assert res.state.get("last_error") == "invalid_passphrase_min_length_8"
     assert not writes, "Should not auto-provision when caller explicitly provided override"
     assert not strict_called["value"], "Strict start path should not run for invalid override"
+
+
+def test_early_start_failure_clears_attempts_in_its_error_write(
+    monkeypatch,
+    mock_missing_system_commands,
+):
+    lifecycle = _common_start_mocks(
+        monkeypatch,
+        {"wpa2_passphrase": "", "band_preference": "5ghz"},
+    )
+    writes = []
+    monkeypatch.setattr(lifecycle, "update_state", lambda **kw: writes.append(kw) or dict(kw))
+    monkeypatch.setattr(lifecycle, "write_config_file", lambda partial: partial)
+
+    res = lifecycle.start_hotspot(overrides={"wpa2_passphrase": "short"})
+
+    assert res.code == "start_failed"
+    # No standalone reset write: every write moves the phase.
+    assert [w.get("phase") for w in writes] == ["starting", "error"]
+    assert writes[-1]["attempts"] == [] and writes[-1]["last_error_detail"] is None
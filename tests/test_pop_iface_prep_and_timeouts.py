@@ -462,6 +462,20 @@ def test_nm_interference_reason_reports_connected(monkeypatch):
     assert lifecycle._nm_interference_reason("wlan0") == "nm_state=connected"
 
 
+def test_nm_wait_uses_monotonic_deadline_and_never_oversleeps(monkeypatch):
+    import vr_hotspotd.lifecycle as lifecycle
+
+    sleeps = []
+    real_sleep = lifecycle.time.sleep
+    monkeypatch.setattr(lifecycle, "_nm_is_running", lambda: True)
+    monkeypatch.setattr(lifecycle, "_nm_device_state", lambda _ifname: "connected")
+    monkeypatch.setattr(lifecycle.time, "time", lambda: pytest.fail("deadline must not follow the wall clock"))
+    monkeypatch.setattr(lifecycle.time, "sleep", lambda s: sleeps.append(s) or real_sleep(s))
+
+    assert lifecycle._nm_wait_non_interfering("wlan0", timeout_s=0.3) is False
+    assert sleeps and sum(sleeps) <= 0.3 + 1e-6
+
+
 def test_parent_iface_missing_signal_detects_cannot_find_parent_iface():
     import vr_hotspotd.lifecycle as lifecycle
 
@@ -1377,3 +1391,15 @@ def test_attempt_start_candidate_classifies_ap_disabled(monkeypatch):
     assert ap_info is None
     assert failure_code == "hostapd_failed"
     assert failure_detail == "ap_disabled"
+
+
+def test_lifecycle_run_decodes_bytes_output(monkeypatch):
+    import vr_hotspotd.lifecycle as lifecycle
+
+    def fake_run(cmd, **kwargs):
+        assert "text" not in kwargs
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"phy#0\n\tInterface wlan0\n", stderr=b"warn\xff")
+
+    monkeypatch.setattr(lifecycle.subprocess, "run", fake_run)
+
+    assert lifecycle._run(["iw", "dev"]) == "phy#0\n\tInterface wlan0\n\nwarn�"
@@ -1,3 +1,12 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
 import vr_hotspotd.lifecycle as lifecycle
 
 
@@ -9,26 +18,26 @@ def test_cleanup_kills_dnsmasq_and_removes_conf_dir(tmp_path, monkeypatch):
     (conf_dir / "hostapd.pid").write_text("222")
 
     monkeypatch.setattr(lifecycle, "_LNXROUTER_TMP", lnx_tmp)
-    monkeypatch.setattr(lifecycle, "_find_our_lnxrouter_pids", lambda: [333])
+    monkeypatch.setattr(lifecycle, "_find_our_lnxrouter_pids", lambda *_a: [333])
     monkeypatch.setattr(lifecycle, "_pid_running", lambda pid: pid in (111, 222, 333))
 
-    def _fake_cmdline(pid: int) -> str:
+    def _fake_cmdline(pid: int) -> bytes:
         if pid == 111:
-            return "dnsmasq --conf-file"
+            return b"dnsmasq\x00--conf-file\x00"
         if pid == 222:
-            return "hostapd -c /dev/shm/lnxrouter_tmp/hostapd.conf"
+            return b"hostapd\x00-c\x00/dev/shm/lnxrouter_tmp/hostapd.conf\x00"
         if pid == 333:
-            return "lnxrouter --ap wlan0"
-        return ""
+            return b"lnxrouter\x00--ap\x00wlan0\x00"
+        return b""
 
-    monkeypatch.setattr(lifecycle, "_pid_cmdline", _fake_cmdline)
+    monkeypatch.setattr(lifecycle, "_pid_cmdline_raw", _fake_cmdline)
 
     killed = []
 
-    def _record_kill(pid: int, timeout_s: float = 3.0) -> None:
-        killed.append(pid)
+    def _record_kill(pids, timeout_s: float = 3.0) -> None:
+        killed.extend(pids)
 
-    monkeypatch.setattr(lifecycle, "_kill_pid", _record_kill)
+    monkeypatch.setattr(lifecycle, "_kill_pids", _record_kill)
 
     lifecycle._kill_runtime_processes("wlan0", stop_engine_first=False)
     assert sorted(killed) == [111, 222, 333]
@@ -36,3 +45,341 @@ def test_cleanup_kills_dnsmasq_and_removes_conf_dir(tmp_path, monkeypatch):
     removed = lifecycle._remove_conf_dirs("wlan0")
     assert conf_dir.name in removed
     assert not conf_dir.exists()
+
+
+def test_start_skips_repair_only_after_clean_stop(monkeypatch):
+    clean = {
+        "phase": "stopped",
+        "last_op": "stop",
+        "last_error": None,
+        "tuning": {},
+        "network_tuning": {},
+        "engine": {"pid": None},
+    }
+    monkeypatch.setattr(lifecycle, "_has_stale_artifacts", lambda: False)
+    assert lifecycle._start_needs_repair(clean) is False
+    assert lifecycle._start_needs_repair(dict(clean, last_op=None)) is True
+    assert lifecycle._start_needs_repair(dict(clean, phase="error")) is True
+    assert lifecycle._start_needs_repair(dict(clean, tuning={"sysctl_prev": {}})) is True
+    assert lifecycle._start_needs_repair(dict(clean, engine={"pid": 42})) is True
+
+    monkeypatch.setattr(lifecycle, "_has_stale_artifacts", lambda: True)
+    assert lifecycle._start_needs_repair(clean) is True
+
+
+def test_stale_artifacts_probe_sees_virtual_ap_ifaces(tmp_path, monkeypatch):
+    sys_net = tmp_path / "net"
+    sys_net.mkdir()
+    (sys_net / "wlan0").mkdir()
+    monkeypatch.setattr(lifecycle, "_SYS_CLASS_NET", sys_net)
+    monkeypatch.setattr(lifecycle, "_LNXROUTER_TMP", tmp_path / "lnxrouter_tmp")
+    monkeypatch.setattr(lifecycle, "is_running", lambda: False)
+
+    assert lifecycle._has_stale_artifacts() is False
+    (sys_net / "x0wlan0").mkdir()
+    assert lifecycle._has_stale_artifacts() is True
+
+
+def test_pidfile_lookup_reuses_proc_scan(tmp_path, monkeypatch):
+    lnx_tmp = tmp_path / "lnxrouter_tmp"
+    conf_dir = lnx_tmp / "lnxrouter.wlan0.conf.TEST"
+    conf_dir.mkdir(parents=True)
+    (conf_dir / "hostapd.pid").write_text("222")
+    (conf_dir / "dnsmasq.pid").write_text("111")
+
+    def forbidden(*_args, **_kwargs):
+        raise AssertionError("must use the scanned cmdlines")
+
+    monkeypatch.setattr(lifecycle, "_LNXROUTER_TMP", lnx_tmp)
+    monkeypatch.setattr(lifecycle, "_pid_running", forbidden)
+    monkeypatch.setattr(lifecycle, "_pid_cmdline", forbidden)
+    monkeypatch.setattr(lifecycle, "_pid_cmdline_raw", forbidden)
+
+    procs = {111: "dnsmasq --conf-file", 222: "hostapd hostapd.conf", 333: lifecycle._LNXROUTER_PATH + " --ap wlan0"}
+    assert lifecycle._find_our_lnxrouter_pids(procs) == [333]
+    assert lifecycle._find_hostapd_pids("wlan0", procs) == [222]
+    assert lifecycle._find_dnsmasq_pids("wlan0", procs) == [111]
+
+
+def test_kill_pids_signals_all_before_waiting(monkeypatch):
+    sent = []
+    alive = {10, 20}
+
+    def fake_kill(pid, sig):
+        if sig == 0:
+            if pid not in alive:
+                raise ProcessLookupError(pid)
+            return
+        sent.append((pid, sig))
+        alive.discard(pid)
+
+    monkeypatch.setattr(lifecycle, "_pidfd_open", lambda _pid: None)
+    monkeypatch.setattr(lifecycle.os, "kill", fake_kill)
+    monkeypatch.setattr(lifecycle.os.path, "exists", lambda _path: pytest.fail("liveness must use kill(pid, 0)"))
+    monkeypatch.setattr(lifecycle.time, "sleep", lambda _s: None)
+
+    lifecycle._kill_pids([10, 20, 10])
+
+    assert sent == [(10, lifecycle.signal.SIGTERM), (20, lifecycle.signal.SIGTERM)]
+
+
+@pytest.mark.skipif(
+    not (hasattr(os, "pidfd_open") and hasattr(signal, "pidfd_send_signal")),
+    reason="pidfd not available",
+)
+def test_kill_pids_sees_unreaped_child_exit_via_pidfd():
+    probe = lifecycle._pidfd_open(os.getpid())
+    if probe is None:
+        pytest.skip("pidfd_open not permitted")
+    os.close(probe)
+
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        t0 = time.monotonic()
+        lifecycle._kill_pids([child.pid], timeout_s=3.0)
+        # The child stays a zombie until we reap it; /proc polling would wait the full timeout.
+        assert time.monotonic() - t0 < 2.0
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_kill_pids_proc_fallback_treats_zombie_as_gone(monkeypatch):
+    monkeypatch.setattr(lifecycle, "_pidfd_open", lambda _pid: None)
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        t0 = time.monotonic()
+        lifecycle._kill_pids([child.pid], timeout_s=3.0)
+        assert time.monotonic() - t0 < 2.0
+        assert lifecycle._pid_is_zombie(child.pid)
+    finally:
+        child.kill()
+        child.wait()
+    assert not lifecycle._pid_is_zombie(child.pid)
+
+
+def test_proc_scan_keeps_only_runtime_cmdlines(monkeypatch):
+    raw = {
+        "1": b"/sbin/init\x00",
+        "42": b"/usr/sbin/HOSTAPD\x00-B\x00hostapd.conf\x00",
+        "43": b"dnsmasq\x00--conf-file=x\x00",
+        "44": b"",
+    }
+    class _Entries(list):
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc):
+            return False
+
+    entries = _Entries(SimpleNamespace(name=name) for name in list(raw) + ["self"])
+    monkeypatch.setattr(lifecycle.os, "scandir", lambda _path: entries)
+    monkeypatch.setattr(lifecycle, "_pid_cmdline_raw", lambda pid: raw[str(pid)])
+
+    assert lifecycle._scan_proc_cmdlines() == {
+        42: "/usr/sbin/HOSTAPD -B hostapd.conf",
+        43: "dnsmasq --conf-file=x",
+    }
+
+
+def test_kill_runtime_processes_lists_conf_dirs_once(tmp_path, monkeypatch):
+    conf_dir = tmp_path / "lnxrouter.wlan0.conf.TEST"
+    conf_dir.mkdir()
+    (conf_dir / "hostapd.pid").write_text("222")
+    (conf_dir / "dnsmasq.pid").write_text("111")
+    listings = []
+
+    def fake_candidates(adapter_ifname):
+        listings.append(adapter_ifname)
+        return [conf_dir]
+
+    killed = []
+    monkeypatch.setattr(lifecycle, "_candidate_conf_dirs", fake_candidates)
+    monkeypatch.setattr(lifecycle, "_scan_proc_cmdlines", lambda: {111: "dnsmasq", 222: "hostapd"})
+    monkeypatch.setattr(lifecycle, "_kill_pids", lambda pids, timeout_s=3.0: killed.extend(pids))
+
+    lifecycle._kill_runtime_processes("wlan0", stop_engine_first=False)
+
+    assert listings == ["wlan0"]
+    assert killed == [222, 111]
+
+
+def test_cleanup_virtual_ap_ifaces_filters_phy_from_dump(monkeypatch):
+    dump = """phy#0
+\tInterface x0wlan0
+\t\ttype AP
+\t\tchannel 36 (5180 MHz), width: 80 MHz
+phy#1
+\tInterface x0wlan1
+\t\ttype AP
+\t\tchannel 6 (2437 MHz), width: 20 MHz
+\tInterface wlan1
+\t\ttype AP
+\t\tchannel 6 (2437 MHz), width: 20 MHz
+"""
+    deleted = []
+
+    def fake_run(cmd, **_kwargs):
+        assert cmd[-1] == "del", cmd
+        deleted.append(cmd[-2])
+
+    monkeypatch.setattr(lifecycle, "_iw_dev_dump", lambda: dump)
+    monkeypatch.setattr(lifecycle, "_iw_bin", lambda: "/usr/sbin/iw")
+    monkeypatch.setattr(lifecycle, "_iface_phy", lambda _ifname: pytest.fail("phy lookup must come from the dump"))
+    monkeypatch.setattr(lifecycle.subprocess, "run", fake_run)
+
+    assert lifecycle._cleanup_virtual_ap_ifaces(target_phy="phy1") == ["x0wlan1"]
+    assert deleted == ["x0wlan1"]
+
+
+def test_cleanup_virtual_ap_ifaces_deletes_every_match(monkeypatch):
+    dump = "phy#0\n" + "".join(f"\tInterface x{i}wlan0\n\t\ttype AP\n" for i in range(3))
+    deleted = []
+
+    iw_lookups = []
+
+    monkeypatch.setattr(lifecycle, "_iw_dev_dump", lambda: dump)
+    monkeypatch.setattr(lifecycle, "_iw_bin", lambda: iw_lookups.append(1) or "/usr/sbin/iw")
+    monkeypatch.setattr(lifecycle.subprocess, "run", lambda cmd, **_kw: deleted.append(cmd[-2]))
+
+    assert lifecycle._cleanup_virtual_ap_ifaces() == ["x0wlan0", "x1wlan0", "x2wlan0"]
+    assert sorted(deleted) == ["x0wlan0", "x1wlan0", "x2wlan0"]
+    assert len(iw_lookups) == 1
+
+
+def test_virt_ap_re_only_accepts_ascii_digits():
+    assert lifecycle._VIRT_AP_RE.match("x12wlan0")
+    assert not lifecycle._VIRT_AP_RE.match("x\u0663wlan0")
+
+
+def test_remove_conf_dirs_moves_to_trash_and_drains(monkeypatch, tmp_path):
+    monkeypatch.setattr(lifecycle, "_LNXROUTER_TMP", tmp_path)
+    monkeypatch.setitem(lifecycle._CONF_TRASH, "thread", None)
+    monkeypatch.setitem(lifecycle._CONF_TRASH, "pending", False)
+    conf_dir = tmp_path / "lnxrouter.wlan0.conf.XYZ"
+    conf_dir.mkdir()
+    (conf_dir / "hostapd.conf").write_text("interface=wlan0\n")
+
+    started = []
+    monkeypatch.setattr(
+        lifecycle.threading,
+        "Thread",
+        lambda target, **_kw: SimpleNamespace(start=lambda: started.append(target)),
+    )
+
+    assert lifecycle._remove_conf_dirs("wlan0") == [conf_dir.name]
+    assert not conf_dir.exists()
+    assert lifecycle._candidate_conf_dirs(None) == []
+
+    trash = tmp_path / ".trash"
+    assert len(list(trash.iterdir())) == 1
+    assert len(started) == 1
+
+    # A second removal while the drainer runs asks it for another pass instead of a new thread.
+    (tmp_path / "lnxrouter.wlan0.conf.ABC").mkdir()
+    assert lifecycle._remove_conf_dirs("wlan0") == ["lnxrouter.wlan0.conf.ABC"]
+    assert len(started) == 1
+    assert lifecycle._CONF_TRASH["pending"] is True
+
+    started[0]()
+    assert list(trash.iterdir()) == []
+    assert lifecycle._CONF_TRASH == {"thread": None, "pending": False}
+
+
+def test_repair_drains_leftover_trash_synchronously(monkeypatch, tmp_path):
+    monkeypatch.setattr(lifecycle, "_LNXROUTER_TMP", tmp_path)
+    leftover = tmp_path / ".trash" / "lnxrouter.wlan0.conf.OLD.abcd"
+    leftover.mkdir(parents=True)
+    (leftover / "hostapd.conf").write_text("wpa_passphrase=secret\n")
+    monkeypatch.setattr(lifecycle, "load_config", lambda: {})
+    monkeypatch.setattr(lifecycle, "load_state", lambda: {})
+    monkeypatch.setattr(lifecycle, "update_state", lambda **kw: kw)
+    monkeypatch.setattr(lifecycle, "get_adapters", lambda **_kw: {"adapters": [], "recommended": None})
+    monkeypatch.setattr(lifecycle, "_kill_runtime_processes", lambda *_a, **_kw: None)
+    monkeypatch.setattr(lifecycle, "_cleanup_virtual_ap_ifaces", lambda **_kw: [])
+
+    lifecycle._repair_impl(correlation_id="boot", platform_is_pop=False)
+
+    assert list((tmp_path / ".trash").iterdir()) == []
+
+
+def test_collect_affinity_pids_reads_each_cmdline_once(tmp_path, monkeypatch):
+    conf_dir = tmp_path / "lnxrouter.wlan0.conf.TEST"
+    conf_dir.mkdir()
+    (conf_dir / "hostapd.pid").write_text("222")
+    (conf_dir / "dnsmasq.pid").write_text("111")
+    raw = {222: b"/usr/sbin/hostapd\x00x.conf\x00", 111: b""}
+    reads = []
+
+    def fake_raw(pid):
+        reads.append(pid)
+        return raw.get(pid, b"")
+
+    monkeypatch.setattr(lifecycle, "_find_latest_conf_dir", lambda *_a: conf_dir)
+    monkeypatch.setattr(lifecycle, "_pid_cmdline_raw", fake_raw)
+
+    pids = lifecycle._collect_affinity_pids(adapter_ifname="wlan0", ap_interface="ap0", engine_pid=99)
+
+    assert pids == [99, 222]
+    assert reads == [222, 111]
+
+
+def test_pid_identity_checks_never_decode_cmdline(monkeypatch):
+    def forbidden(*_args, **_kwargs):
+        raise AssertionError("identity checks must stay on bytes")
+
+    monkeypatch.setattr(lifecycle, "_pid_cmdline", forbidden)
+    monkeypatch.setattr(lifecycle, "_pid_cmdline_raw", lambda pid: b"/usr/sbin/HOSTAPD\x00-B\x00")
+    assert lifecycle._pid_is_hostapd(5) is True
+    assert lifecycle._pid_is_dnsmasq(5) is False
+    assert lifecycle._pid_is_our_lnxrouter(5) is False
+
+
+def test_shutdown_stop_waits_for_trash_drain(monkeypatch):
+    calls = []
+    monkeypatch.setattr(lifecycle, "_stop_hotspot_impl", lambda correlation_id: calls.append(correlation_id))
+    monkeypatch.setattr(lifecycle, "_drain_conf_trash", lambda: calls.append("drain"))
+
+    lifecycle.stop_hotspot(correlation_id="stop")
+    lifecycle.stop_hotspot(correlation_id="shutdown", wait_cleanup=True)
+
+    assert calls == ["stop", "shutdown", "drain"]
+
+
+def test_kill_pids_still_sigkills_when_the_wait_fails(monkeypatch):
+    sent = []
+
+    def fake_kill(pid, sig):
+        if sig != 0:
+            sent.append((pid, sig))
+
+    monkeypatch.setattr(lifecycle, "_pidfd_open", lambda _pid: None)
+    monkeypatch.setattr(lifecycle, "_pid_is_zombie", lambda _pid: False)
+    monkeypatch.setattr(lifecycle.os, "kill", fake_kill)
+    monkeypatch.setattr(lifecycle.time, "sleep", lambda _s: (_ for _ in ()).throw(OSError("wait failed")))
+
+    lifecycle._kill_pids([10], timeout_s=1.0)
+
+    assert sent == [(10, lifecycle.signal.SIGTERM), (10, lifecycle.signal.SIGKILL)]
+
+
+def test_readable_fds_handles_fds_above_fd_setsize():
+    import resource
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard != resource.RLIM_INFINITY and hard <= 1100:
+        pytest.skip("fd limit too low")
+    r, w = os.pipe()
+    high = None
+    try:
+        if soft <= 1100:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (1200, hard))
+        high = os.dup2(r, 1100)
+        assert lifecycle._readable_fds([high], 0) == []
+        os.write(w, b"x")
+        assert lifecycle._readable_fds([high], 0) == [high]
+    finally:
+        for fd in (r, w, high):
+            if fd is not None:
+                os.close(fd)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
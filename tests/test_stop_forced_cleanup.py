@@ -28,9 +28,10 @@ def test_stop_performs_forced_cleanup_when_state_stopped_but_runtime_present(mon
     monkeypatch.setattr(lifecycle, "_safe_revert_tuning", lambda _s: [])
     monkeypatch.setattr(lifecycle, "_safe_revert_network_tuning", lambda _s: [])
     monkeypatch.setattr(lifecycle, "is_running", lambda: True)
-    monkeypatch.setattr(lifecycle, "_find_our_lnxrouter_pids", lambda: [])
-    monkeypatch.setattr(lifecycle, "_find_hostapd_pids", lambda _a: [])
-    monkeypatch.setattr(lifecycle, "_find_dnsmasq_pids", lambda _a: [])
+    monkeypatch.setattr(lifecycle, "_scan_proc_cmdlines", lambda: calls.setdefault("proc_scans", []).append(1) or {})
+    monkeypatch.setattr(lifecycle, "_find_our_lnxrouter_pids", lambda *_a: [])
+    monkeypatch.setattr(lifecycle, "_find_hostapd_pids", lambda *_a: [])
+    monkeypatch.setattr(lifecycle, "_find_dnsmasq_pids", lambda *_a: [])
     monkeypatch.setattr(lifecycle, "stop_engine", lambda firewalld_cfg=None: (True, 0, [], [], None))
     monkeypatch.setattr(
         lifecycle,
@@ -46,4 +47,87 @@ def test_stop_performs_forced_cleanup_when_state_stopped_but_runtime_present(mon
 
     assert res.code == "stopped"
     assert calls.get("stop_engine_first") is True
-    assert any(u.get("phase") == "stopping" for u in updates)
+    # The live engine was enough to skip the leftover probe's /proc sweep.
+    assert "proc_scans" not in calls
+    assert [u.get("phase") for u in updates] == ["stopping", "stopped"]
+    assert updates[-1]["engine"]["last_exit_code"] == 0
+
+
+def test_stop_overlaps_conf_dir_and_iface_cleanup(monkeypatch):
+    import threading
+
+    import vr_hotspotd.lifecycle as lifecycle
+
+    state = {"phase": "running", "adapter": "wlan1", "tuning": {}, "network_tuning": {}}
+    order = []
+    both_started = threading.Barrier(2, timeout=2.0)
+
+    def fake_update_state(**kwargs):
+        state.update(kwargs)
+        return dict(state)
+
+    def fake_remove_conf_dirs(_adapter):
+        order.append("conf")
+        both_started.wait()
+        return ["lnxrouter.wlan1.conf.A"]
+
+    def fake_cleanup_ifaces(target_phy=None):
+        order.append("ifaces")
+        both_started.wait()
+        return ["x0wlan1"]
+
+    monkeypatch.setattr(lifecycle, "load_state", lambda: dict(state))
+    monkeypatch.setattr(lifecycle, "load_config", lambda: {})
+    monkeypatch.setattr(lifecycle, "update_state", fake_update_state)
+    monkeypatch.setattr(lifecycle, "stop_engine", lambda firewalld_cfg=None: (True, 0, [], [], None))
+    monkeypatch.setattr(
+        lifecycle,
+        "_kill_runtime_processes",
+        lambda *_a, **_kw: order.append("kill"),
+    )
+    monkeypatch.setattr(lifecycle, "_remove_conf_dirs", fake_remove_conf_dirs)
+    monkeypatch.setattr(lifecycle, "_cleanup_virtual_ap_ifaces", fake_cleanup_ifaces)
+
+    res = lifecycle.stop_hotspot(correlation_id="t-stop-overlap")
+
+    assert res.code == "stopped"
+    assert order[0] == "kill"
+    assert sorted(order[1:]) == ["conf", "ifaces"]
+    assert "stop_removed_virtual_ap_ifaces:x0wlan1" in state["warnings"]
+    assert "stop_removed_lnxrouter_conf_dirs:lnxrouter.wlan1.conf.A" in state["warnings"]
+
+
+def test_stop_already_stopped_skips_reverts(monkeypatch):
+    import vr_hotspotd.lifecycle as lifecycle
+
+    state = {"phase": "stopped", "adapter": None, "tuning": {}, "network_tuning": {}}
+
+    def forbidden(*_args, **_kwargs):
+        raise AssertionError("must not run on the already-stopped path")
+
+    monkeypatch.setattr(lifecycle, "load_state", lambda: dict(state))
+    monkeypatch.setattr(lifecycle, "load_config", forbidden)
+    monkeypatch.setattr(lifecycle, "update_state", forbidden)
+    monkeypatch.setattr(lifecycle, "_safe_revert_tuning", forbidden)
+    monkeypatch.setattr(lifecycle, "_safe_revert_network_tuning", forbidden)
+    monkeypatch.setattr(lifecycle, "is_running", lambda: False)
+    monkeypatch.setattr(lifecycle, "_find_our_lnxrouter_pids", lambda *_a: [])
+    monkeypatch.setattr(lifecycle, "_find_hostapd_pids", lambda *_a: [])
+    monkeypatch.setattr(lifecycle, "_find_dnsmasq_pids", lambda *_a: [])
+
+    res = lifecycle.stop_hotspot(correlation_id="t-stop-noop")
+
+    assert res.code == "already_stopped"
+
+
+def test_empty_engine_returns_fresh_tails():
+    import vr_hotspotd.lifecycle as lifecycle
+    from vr_hotspotd.state import DEFAULT_STATE
+
+    first = lifecycle._empty_engine()
+    first["stdout_tail"].append("x")
+    second = lifecycle._empty_engine(last_error="boom")
+
+    assert second["stdout_tail"] == []
+    assert second["last_error"] == "boom"
+    assert set(second) == set(DEFAULT_STATE["engine"])
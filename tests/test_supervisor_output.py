@@ -13,3 +13,33 @@ def test_merge_head_tail_uses_tail_when_stream_count_is_small():
     tail = deque(["line1", "line2"], maxlen=200)
     merged = _merge_head_tail([], tail, 2, 200)
     assert merged == ["line1", "line2"]
+
+
+def test_wait_for_output_wakes_on_reader_line():
+    import io
+
+    from vr_hotspotd.engine import supervisor
+
+    supervisor.clear_output_signal()
+    assert supervisor.wait_for_output(0.0) is False
+
+    supervisor._reader_thread(io.StringIO("wlan0: AP-ENABLED\n"), deque(maxlen=10), "stderr")
+    assert supervisor.wait_for_output(5.0) is True
+    # Waiting does not consume the signal; only an explicit clear does.
+    assert supervisor.wait_for_output(0.0) is True
+    supervisor.clear_output_signal()
+    assert supervisor.wait_for_output(0.0) is False
+
+
+def test_start_engine_forgets_previous_engine_output(monkeypatch):
+    from vr_hotspotd.engine import supervisor
+
+    supervisor._signal_output()
+    monkeypatch.setattr(supervisor, "is_running", lambda: False)
+    monkeypatch.setattr(supervisor, "_extract_ap_ifname", lambda _cmd: None)
+    monkeypatch.setattr(supervisor, "_build_engine_env", lambda: (_ for _ in ()).throw(RuntimeError("stop")))
+
+    res = supervisor.start_engine(["lnxrouter"])
+
+    assert res.error == "spawn_failed: stop"
+    assert supervisor.wait_for_output(0.0) is False
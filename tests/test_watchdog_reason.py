@@ -24,7 +24,7 @@ def test_watchdog_reason_accepts_engine_children_when_pidfiles_missing(monkeypat
     monkeypatch.setattr(lifecycle, "_pid_is_hostapd", lambda pid: pid == 111)
     monkeypatch.setattr(lifecycle, "_pid_is_dnsmasq", lambda pid: pid == 222)
 
-    reason = lifecycle._watchdog_reason(st, cfg)
+    reason, _snapshot = lifecycle._watchdog_reason(st, cfg)
     assert reason is None
 
 
@@ -44,10 +44,25 @@ def test_watchdog_reason_reports_hostapd_exited_when_no_fallback_signal(monkeypa
     monkeypatch.setattr(lifecycle, "_hostapd_ready", lambda *_args, **_kwargs: False)
     monkeypatch.setattr(lifecycle, "_pid_running", lambda _pid: False)
 
-    reason = lifecycle._watchdog_reason(st, cfg)
+    reason, _snapshot = lifecycle._watchdog_reason(st, cfg)
     assert reason == "hostapd_exited"
 
 
+def test_watchdog_reason_lists_conf_dirs_once_without_engine(monkeypatch):
+    import vr_hotspotd.lifecycle as lifecycle
+
+    st = {"adapter": "wlan0", "ap_interface": "wlan0", "engine": {"pid": None}}
+    cfg = {"bridge_mode": False, "connection_quality_monitoring": False}
+    listings = []
+
+    monkeypatch.setattr(lifecycle, "_find_latest_conf_dir", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(lifecycle, "_candidate_conf_dirs", lambda adapter: listings.append(adapter) or [])
+    monkeypatch.setattr(lifecycle, "_find_pidfile_pids", lambda _a, pid_file, *_rest: [7])
+
+    assert lifecycle._watchdog_reason(st, cfg) == (None, None)
+    assert listings == ["wlan0"]
+
+
 def test_restart_from_watchdog_skips_when_not_running(monkeypatch):
     import vr_hotspotd.lifecycle as lifecycle
 
@@ -63,6 +78,63 @@ def test_restart_from_watchdog_skips_when_not_running(monkeypatch):
     assert called["start"] == 0
 
 
+def test_watchdog_reason_hands_quality_snapshot_back(monkeypatch):
+    import vr_hotspotd.lifecycle as lifecycle
+    from vr_hotspotd import telemetry
+
+    snap = {"enabled": True, "summary": {"quality_score_avg": 90.0, "rssi_avg_dbm": -50}}
+    calls = []
+    monkeypatch.setattr(telemetry, "get_snapshot", lambda **kw: calls.append(kw) or snap)
+    monkeypatch.setattr(lifecycle, "_find_latest_conf_dir", lambda *_args, **_kwargs: object())
+    monkeypatch.setattr(lifecycle, "_hostapd_pid_running", lambda *_args, **_kwargs: True)
+    monkeypatch.setattr(lifecycle, "_dnsmasq_pid_running", lambda *_args, **_kwargs: True)
+
+    st = {"adapter": "wlan0", "ap_interface": "wlan0", "engine": {"pid": 1}}
+    reason, snapshot = lifecycle._watchdog_reason(st, {"connection_quality_monitoring": True})
+    assert reason is None
+    assert snapshot is snap
+    assert len(calls) == 1
+
+
+def test_idle_watchdog_parks_until_next_start(monkeypatch):
+    import threading
+    import time
+
+    import vr_hotspotd.lifecycle as lifecycle
+
+    stop = threading.Event()
+    state_reads = []
+    monkeypatch.setattr(lifecycle, "_WATCHDOG_STOP", stop)
+    monkeypatch.setattr(lifecycle, "load_config", lambda: {})
+    monkeypatch.setattr(lifecycle, "_watchdog_interval", lambda _cfg: 0.01)
+    thread = threading.Thread(target=lifecycle._watchdog_loop, daemon=True)
+
+    def fake_load_state():
+        # A watchdog left running by an earlier test may wake on the same notify.
+        if threading.current_thread() is thread:
+            state_reads.append(1)
+        return {"running": False, "phase": "stopped"}
+
+    monkeypatch.setattr(lifecycle, "load_state", fake_load_state)
+    monkeypatch.setattr(lifecycle, "_WATCHDOG_THREAD", thread)
+    thread.start()
+    try:
+        time.sleep(0.3)
+        assert len(state_reads) == 1
+
+        lifecycle._ensure_watchdog_started()
+        deadline = time.monotonic() + 2.0
+        while len(state_reads) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(state_reads) == 2
+    finally:
+        stop.set()
+        with lifecycle._WATCHDOG_CV:
+            lifecycle._WATCHDOG_CV.notify_all()
+        thread.join(2.0)
+    assert not thread.is_alive()
+
+
 def _exercise_watchdog_channel_switch(
     monkeypatch,
     *,
@@ -177,3 +249,15 @@ def test_watchdog_config_persistence_failure_remains_best_effort(monkeypatch):
 
     assert writes == [{"channel_5g": 149}]
     assert restart_calls == ["stop", "start"]
+
+
+def test_watchdog_channel_switch_skips_write_when_channel_unchanged(monkeypatch):
+    cfg, writes, restart_calls = _exercise_watchdog_channel_switch(
+        monkeypatch,
+        band="5ghz",
+        selected_channel=36,
+    )
+
+    assert writes == []
+    assert cfg["channel_5g"] == 36
+    assert restart_calls == ["stop", "start"]